@@ -1,8 +1,9 @@
 """Shared aiohttp application helpers."""
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import Any, Literal, Protocol
+from typing import Any, Literal, Protocol, Sequence
 
 from aiohttp import web
 from aiohttp_cors import CorsConfig, ResourceOptions, setup as cors_setup
@@ -40,13 +41,22 @@ _EXPOSED_HEADERS = (
     "X-Request-Id",
 )
 
+# Every allowed origin gets the same policy, so a single immutable
+# ResourceOptions is shared instead of building one per origin per app.
+_CORS_OPTIONS = ResourceOptions(
+    allow_credentials=True,
+    expose_headers=_EXPOSED_HEADERS,
+    allow_headers=_ALLOWED_HEADERS,
+    allow_methods=_ALLOWED_METHODS,
+)
+
 
 class SettingsProtocol(Protocol):
     """Protocol for settings objects used by the app helpers."""
 
     app_name: str
     env: Literal["development", "staging", "production"]
-    cors_allowed_origins: list[str]
+    cors_allowed_origins: Sequence[str]
 
 
 def create_base_app(settings: SettingsProtocol) -> tuple[web.Application, CorsConfig]:
@@ -58,15 +68,7 @@ def create_base_app(settings: SettingsProtocol) -> tuple[web.Application, CorsCo
 
     cors = cors_setup(
         app,
-        defaults={
-            origin: ResourceOptions(
-                allow_credentials=True,
-                expose_headers=_EXPOSED_HEADERS,
-                allow_headers=_ALLOWED_HEADERS,
-                allow_methods=_ALLOWED_METHODS,
-            )
-            for origin in settings.cors_allowed_origins
-        },
+        defaults=dict.fromkeys(settings.cors_allowed_origins, _CORS_OPTIONS),
     )
 
     return app, cors
@@ -111,15 +113,16 @@ async def read_json(request: web.Request) -> dict[str, Any]:
     return data
 
 
+# "Bearer <token>"; group 1 is the token with surrounding whitespace stripped.
+_BEARER_RE = re.compile(r"Bearer \s*(.*?)\s*\Z", re.DOTALL)
+
+
 def extract_bearer_token(request: web.Request) -> str:
     """Extract Bearer token from Authorization header.
 
     Raises web.HTTPUnauthorized if the header is missing or malformed.
     """
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise web.HTTPUnauthorized(reason="Authorization token is required")
-    token = auth_header[len("Bearer "):].strip()
-    if not token:
+    match = _BEARER_RE.match(request.headers.get("Authorization") or "")
+    if match is None or not match.group(1):
         raise web.HTTPUnauthorized(reason="Authorization token is required")
-    return token
+    return match.group(1)
@@ -4,13 +4,26 @@ Supports three conversion kinds:
 - linear: physical = a * raw + b
 - polynomial: physical = c0 + c1*x + c2*x² + ...
 - lookup_table: linear interpolation between points, clamp beyond boundaries
+
+``apply_conversion`` converts a single value; ``apply_conversion_batch``
+inspects the payload once and converts a whole batch of values with it.
+Callers that reuse one profile across many requests can keep the result of
+``compile_conversion`` and skip payload parsing entirely.
 """
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
 from typing import Any
 
 SUPPORTED_KINDS = ("linear", "polynomial", "lookup_table")
 
+Converter = Callable[[float], float | None]
+
+
+class InvalidConversionError(ValueError):
+    """A conversion payload that cannot be validated or compiled."""
+
 
 def validate_conversion_payload(kind: str, payload: dict[str, Any]) -> None:
     """Validate that *payload* matches the required schema for *kind*.
@@ -76,59 +89,123 @@ def apply_conversion(kind: str, payload: dict[str, Any], raw_value: float) -> fl
     Returns the computed physical value, or ``None`` when the payload is
     invalid or the *kind* is not recognised.
     """
+    convert = compile_conversion(kind, payload)
+    if convert is None:
+        return None
+    return convert(raw_value)
+
+
+def apply_conversion_batch(
+    kind: str, payload: dict[str, Any], raw_values: Sequence[float]
+) -> list[float | None]:
+    """Apply a conversion profile to a batch of raw values.
+
+    The payload is parsed once per batch instead of once per value (the
+    lookup table in particular is sorted only once).  The result has the
+    same length as *raw_values*; every element is ``None`` when the payload
+    is invalid or the *kind* is not recognised.
+    """
+    convert = compile_conversion(kind, payload)
+    if convert is None:
+        return [None] * len(raw_values)
+    return [convert(raw_value) for raw_value in raw_values]
+
+
+def compile_conversion(kind: str, payload: dict[str, Any]) -> Converter | None:
+    """Return a ``raw -> physical`` function for *payload*, or ``None`` if invalid.
+
+    Coefficients are converted to floats and lookup-table points are split
+    into sorted ``raws`` / ``physicals`` lists up front, so the returned
+    function does only arithmetic.
+    """
+    if not isinstance(payload, dict):
+        return None
     if kind == "linear":
-        return _apply_linear(payload, raw_value)
+        return _build_linear(payload)
     if kind == "polynomial":
-        return _apply_polynomial(payload, raw_value)
+        return _build_polynomial(payload)
     if kind == "lookup_table":
-        return _apply_lookup_table(payload, raw_value)
+        return _build_lookup_table(payload)
     return None
 
 
-def _apply_linear(payload: dict[str, Any], raw_value: float) -> float | None:
+def compile_validated_conversion(kind: str, payload: dict[str, Any]) -> Converter:
+    """Validate *payload* for *kind* and compile it.
+
+    Intended for the points where a profile becomes usable (e.g. publish),
+    so invalid payloads are rejected once there instead of being silently
+    skipped on every converted sample.  Raises :class:`InvalidConversionError`
+    with the same message as :func:`validate_conversion_payload`.
+    """
+    try:
+        validate_conversion_payload(kind, payload)
+    except ValueError as exc:
+        raise InvalidConversionError(str(exc)) from exc
+    convert = compile_conversion(kind, payload)
+    if convert is None:
+        raise InvalidConversionError(f"{kind} payload could not be compiled")
+    return convert
+
+
+def _build_linear(payload: dict[str, Any]) -> Converter | None:
     a_raw = payload.get("a")
     b_raw = payload.get("b")
     if not isinstance(a_raw, (int, float)) or not isinstance(b_raw, (int, float)):
         return None
-    return float(a_raw) * raw_value + float(b_raw)
+    a = float(a_raw)
+    b = float(b_raw)
 
+    def convert(raw_value: float) -> float:
+        return a * raw_value + b
 
-def _apply_polynomial(payload: dict[str, Any], raw_value: float) -> float | None:
+    return convert
+
+
+def _build_polynomial(payload: dict[str, Any]) -> Converter | None:
     coefficients = payload.get("coefficients")
     if not isinstance(coefficients, list) or len(coefficients) == 0:
         return None
-    result = 0.0
-    power = 1.0
-    for i, c in enumerate(coefficients):
-        if not isinstance(c, (int, float)):
-            return None
-        result += float(c) * power
-        power *= raw_value
-    return result
+    if not all(isinstance(c, (int, float)) for c in coefficients):
+        return None
+    # Highest-degree coefficient first, for Horner's rule.
+    coeffs = [float(c) for c in reversed(coefficients)]
+
+    def convert(raw_value: float) -> float:
+        result = 0.0
+        for c in coeffs:
+            result = result * raw_value + c
+        return result
+
+    return convert
 
 
-def _apply_lookup_table(payload: dict[str, Any], raw_value: float) -> float | None:
+def _build_lookup_table(payload: dict[str, Any]) -> Converter | None:
     table = payload.get("table")
     if not isinstance(table, list) or len(table) < 2:
         return None
     try:
-        sorted_points = sorted(table, key=lambda p: float(p["raw"]))
+        points = sorted(
+            ((float(p["raw"]), float(p["physical"])) for p in table),
+            key=lambda point: point[0],
+        )
     except (TypeError, KeyError, ValueError):
         return None
+    raws = [x for x, _ in points]
+    physicals = [y for _, y in points]
+
+    def convert(raw_value: float) -> float | None:
+        # Clamp to boundary values
+        if raw_value <= raws[0]:
+            return physicals[0]
+        if raw_value >= raws[-1]:
+            return physicals[-1]
+
+        # Linear interpolation on the segment raws[i] < raw_value <= raws[i + 1].
+        i = bisect_left(raws, raw_value) - 1
+        if i < 0:  # NaN input
+            return None
+        x0, x1 = raws[i], raws[i + 1]
+        y0, y1 = physicals[i], physicals[i + 1]
+        return y0 + (raw_value - x0) / (x1 - x0) * (y1 - y0)
 
-    # Clamp to boundary values
-    if raw_value <= float(sorted_points[0]["raw"]):
-        return float(sorted_points[0]["physical"])
-    if raw_value >= float(sorted_points[-1]["raw"]):
-        return float(sorted_points[-1]["physical"])
-
-    # Linear interpolation
-    for i in range(len(sorted_points) - 1):
-        x0 = float(sorted_points[i]["raw"])
-        y0 = float(sorted_points[i]["physical"])
-        x1 = float(sorted_points[i + 1]["raw"])
-        y1 = float(sorted_points[i + 1]["physical"])
-        if x0 <= raw_value <= x1:
-            t = (raw_value - x0) / (x1 - x0) if x1 != x0 else 0.0
-            return y0 + t * (y1 - y0)
-    return None
+    return convert
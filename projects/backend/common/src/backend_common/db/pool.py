@@ -1,7 +1,10 @@
 """Asyncpg connection pool helpers."""
 from __future__ import annotations
 
+import json
+
 import asyncpg  # type: ignore[import-untyped]
+import orjson
 
 from typing import Any, AsyncIterator, Protocol
 
@@ -9,6 +12,44 @@ from typing import Any, AsyncIterator, Protocol
 pool: asyncpg.Pool | None = None
 _sync_pool: asyncpg.Pool | None = None  # For sync access in auth-service
 
+# Prepared statements kept per connection (asyncpg default: 100).
+_STATEMENT_CACHE_SIZE = 1024
+
+
+# Binary jsonb wire format: a version byte followed by the JSON text.
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a jsonb parameter; ``str``/``bytes`` are taken as ready JSON text."""
+    if isinstance(value, str):
+        return _JSONB_VERSION + value.encode()
+    if isinstance(value, (bytes, bytearray)):
+        return _JSONB_VERSION + value
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    try:
+        return orjson.loads(data[1:])
+    except orjson.JSONDecodeError:
+        # Numbers beyond what orjson represents (e.g. 1e400) still parse here.
+        return json.loads(data[1:])
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """Decode jsonb to Python objects in the driver instead of per row in repositories.
+
+    Pass as ``init=`` to any pool whose connections the repositories use.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
 
 class SettingsProtocol(Protocol):
     """Protocol for settings objects with database configuration."""
@@ -21,9 +62,15 @@ async def init_pool(database_url: str, pool_size: int, _app: Any = None) -> None
     """Initialize global asyncpg pool."""
     global pool, _sync_pool
     if pool is None:
+        # Fixed-size pool: all connections are opened at startup and never
+        # reclaimed when idle, so requests never pay for a handshake.
         pool = await asyncpg.create_pool(
             dsn=database_url,
+            min_size=pool_size,
             max_size=pool_size,
+            statement_cache_size=_STATEMENT_CACHE_SIZE,
+            max_inactive_connection_lifetime=0,
+            init=init_connection,
         )
         _sync_pool = pool
 
@@ -38,20 +85,24 @@ async def close_pool(_app: Any = None) -> None:
 
 
 async def get_pool() -> asyncpg.Pool:
-    """Return the initialized asyncpg pool, creating it if needed."""
-    global pool
-    if pool is None:
+    """Return the initialized asyncpg pool.
+
+    The pool is deliberately a module global rather than a ContextVar: it is
+    created in an on_startup hook and must be visible to every request task
+    and background worker, whatever context they were spawned from.
+    """
+    current = pool
+    if current is None:
         raise RuntimeError("Database pool not initialized. Call init_pool() first.")
-    assert pool is not None  # for type checkers
-    return pool
+    return current
 
 
 def get_pool_sync() -> asyncpg.Pool:
     """Return the initialized asyncpg pool synchronously (raises if not initialized)."""
-    global _sync_pool
-    if _sync_pool is None:
+    current = _sync_pool
+    if current is None:
         raise RuntimeError("Database pool not initialized")
-    return _sync_pool
+    return current
 
 
 async def get_connection() -> AsyncIterator[asyncpg.Connection]:
@@ -1,8 +1,12 @@
 """Logging configuration for structured TSKV (Tab-Separated Key-Value) logging."""
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 
@@ -21,7 +25,7 @@ def replace_newlines_processor(logger, method_name, event_dict):
     """
     Processor to replace newlines in string values with \\n.
     This ensures each log entry stays on a single line for TSKV format.
-    Processes all string values including those added by format_exc_info.
+    Tracebacks are not in the event dict here; the listener formats them.
     """
     for key, value in event_dict.items():
         if isinstance(value, str):
@@ -39,10 +43,67 @@ def replace_newlines_processor(logger, method_name, event_dict):
     return event_dict
 
 
+# Background listener that owns the real stdout handler (see configure_logging).
+_queue_listener: QueueListener | None = None
+
+# Marks stdlib records produced by structlog whose traceback is still to be
+# rendered as an ``exception=`` field.
+_EXCEPTION_FIELD = "structlog_exception_field"
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves traceback formatting to the listener thread.
+
+    The stock ``prepare`` formats the whole record (including ``exc_info``)
+    in the caller; here only ``%``-args are merged so later mutation of the
+    arguments cannot change the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _DeferExceptionRenderer:
+    """Render the event without its traceback and pass ``exc_info`` on to stdlib.
+
+    Replaces ``format_exc_info`` in the caller: the record carries the
+    exception to the listener thread, where :class:`SingleLineFormatter`
+    appends it as the ``exception`` field.
+    """
+
+    def __init__(self, renderer) -> None:
+        self._renderer = renderer
+
+    def __call__(self, logger, method_name, event_dict):
+        exc_info = event_dict.pop("exc_info", None)
+        rendered = self._renderer(logger, method_name, event_dict)
+        if not exc_info:
+            return rendered
+        return (rendered,), {"exc_info": exc_info, "extra": {_EXCEPTION_FIELD: True}}
+
+
 class SingleLineFormatter(logging.Formatter):
     """Formatter that ensures output is always on a single line."""
 
     def format(self, record):
+        if getattr(record, _EXCEPTION_FIELD, False):
+            # structlog event: the message is already rendered key=value
+            message = record.getMessage()
+            if record.exc_info and record.exc_info[0] is not None:
+                exception = _sanitize_string(self.formatException(record.exc_info))
+                message = f"{message} exception={exception!r}"
+            return message
         # Get the formatted message
         message = super().format(record)
         # Replace any remaining newlines with \\n
@@ -51,16 +112,27 @@ class SingleLineFormatter(logging.Formatter):
 
 
 def configure_logging() -> None:
-    """Configure structlog for TSKV output suitable for Grafana/Loki/Alloy."""
+    """Configure structlog for TSKV output suitable for Grafana/Loki/Alloy.
+
+    Handlers on the event loop only enqueue records; traceback formatting
+    and the blocking stdout write happen in a QueueListener thread.
+    """
+    global _queue_listener
     # Configure standard logging to pass through to structlog
     # This ensures all logs (including aiohttp) go through structlog
     # Use a handler that ensures single-line output
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(SingleLineFormatter("%(message)s"))
 
+    # Repeated calls replace the previous listener instead of leaking threads
+    _stop_queue_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.handlers = [handler]
+    root_logger.handlers = [_DeferredQueueHandler(log_queue)]
     root_logger.setLevel(logging.INFO)
     root_logger.propagate = False
 
@@ -86,18 +158,19 @@ def configure_logging() -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             # Add stack info for exceptions
             structlog.processors.StackInfoRenderer(),
-            # Format exceptions (adds exception field with traceback)
-            structlog.processors.format_exc_info,
             # Replace newlines in string values with \\n to keep logs on single line
-            # This MUST be after format_exc_info to process the formatted traceback
-            # and before KeyValueRenderer
+            # This MUST be before KeyValueRenderer
             replace_newlines_processor,
             # KeyValueRenderer outputs key=value format (space-separated)
             # This format is easier for Alloy to parse than JSON
             # Values with spaces are automatically quoted
-            structlog.processors.KeyValueRenderer(
-                key_order=["timestamp", "level", "logger", "event", "message"],
-                drop_missing=True,
+            # Exceptions are not formatted here: exc_info goes with the record
+            # and the listener appends the exception field with the traceback
+            _DeferExceptionRenderer(
+                structlog.processors.KeyValueRenderer(
+                    key_order=["timestamp", "level", "logger", "event", "message"],
+                    drop_missing=True,
+                )
             ),
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -106,3 +179,5 @@ def configure_logging() -> None:
         cache_logger_on_first_use=True,
     )
 
+
+atexit.register(_stop_queue_listener)
@@ -17,6 +17,8 @@ don't inherit from ``ServiceError``.
 """
 from __future__ import annotations
 
+import json
+
 import structlog
 from aiohttp import web
 from aiohttp.web import middleware
@@ -28,6 +30,13 @@ logger = structlog.get_logger(__name__)
 # Extra (service-specific) exception → status_code mappings.
 _extra_mappings: dict[type[Exception], int] = {}
 
+# Resolved status per concrete exception class (None = not mapped), so the
+# isinstance scan over _extra_mappings runs once per class, not per failure.
+_status_by_type: dict[type[BaseException], int | None] = {}
+
+# The generic 500 body never changes; encode it once.
+_INTERNAL_ERROR_BODY = json.dumps({"error": "Internal server error"}).encode()
+
 
 def register_error_mappings(mappings: dict[type[Exception], int]) -> None:
     """Register additional exception-class → HTTP-status-code mappings.
@@ -37,6 +46,21 @@ def register_error_mappings(mappings: dict[type[Exception], int]) -> None:
     inherit from ``ServiceError``.
     """
     _extra_mappings.update(mappings)
+    _status_by_type.clear()
+
+
+def _mapped_status(exc_type: type[BaseException]) -> int | None:
+    try:
+        return _status_by_type[exc_type]
+    except KeyError:
+        pass
+    status: int | None = None
+    for exc_cls, mapped in _extra_mappings.items():
+        if issubclass(exc_type, exc_cls):
+            status = mapped
+            break
+    _status_by_type[exc_type] = status
+    return status
 
 
 @middleware
@@ -57,13 +81,14 @@ async def error_handling_middleware(
         return web.json_response({"error": message}, status=status)
     except Exception as exc:
         # Check extra mappings registered by the service.
-        for exc_cls, status in _extra_mappings.items():
-            if isinstance(exc, exc_cls):
-                message = str(exc) or type(exc).__name__
-                return web.json_response({"error": message}, status=status)
+        mapped = _mapped_status(type(exc))
+        if mapped is not None:
+            message = str(exc) or type(exc).__name__
+            return web.json_response({"error": message}, status=mapped)
 
         logger.exception("Unhandled exception")
-        return web.json_response(
-            {"error": "Internal server error"},
+        return web.Response(
+            body=_INTERNAL_ERROR_BODY,
             status=500,
+            content_type="application/json",
         )
@@ -1,6 +1,8 @@
 """Middleware for trace_id and request_id logging."""
 from __future__ import annotations
 
+import logging
+import re
 import time
 from uuid import UUID, uuid4
 
@@ -11,6 +13,13 @@ TRACE_ID_HEADER = "X-Trace-Id"
 REQUEST_ID_HEADER = "X-Request-Id"
 
 logger = structlog.get_logger(__name__)
+# stdlib logger behind the structlog one; used only for level checks.
+_std_logger = logging.getLogger(__name__)
+
+# Canonical 8-4-4-4-12 form, which is what clients send in practice.
+_CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
 
 # Заголовки, которые не нужно логировать (чувствительные данные)
 SENSITIVE_HEADERS = {
@@ -25,6 +34,9 @@ SENSITIVE_HEADERS = {
 
 def is_valid_uuid(value: str) -> bool:
     """Check if string is a valid UUID."""
+    # Fast path: a regex match is several times cheaper than building a UUID.
+    if isinstance(value, str) and len(value) == 36 and _CANONICAL_UUID_RE.fullmatch(value):
+        return True
     try:
         UUID(value)
         return True
@@ -150,7 +162,9 @@ def create_trace_middleware(service_name: str):
                 duration_ms=round(duration_ms, 2),
                 error=str(e),
                 error_type=type(e).__name__,
-                exc_info=True,  # Включаем полный traceback
+                # HTTP-исключения (404, 401, ...) — штатный путь; полный traceback
+                # форматируем только при включённом DEBUG.
+                exc_info=_std_logger.isEnabledFor(logging.DEBUG),
             )
             raise
         except Exception as e:
@@ -16,6 +16,10 @@ class BaseRepository:
         async with self._pool.acquire() as conn:
             return await conn.fetchrow(query, *args)
 
+    async def _fetchval(self, query: str, *args: Any) -> Any:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval(query, *args)
+
     async def _fetch(self, query: str, *args: Any) -> Iterable[asyncpg.Record]:
         async with self._pool.acquire() as conn:
             return cast(Iterable[asyncpg.Record], await conn.fetch(query, *args))
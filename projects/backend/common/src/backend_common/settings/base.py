@@ -1,17 +1,25 @@
 """Base settings class with common fields."""
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, Literal, Self, cast
 
-from pydantic import AnyHttpUrl, Field, PostgresDsn, model_validator
+from pydantic import AnyHttpUrl, Field, PostgresDsn, computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from backend_common.settings.yaml_loader import load_service_yaml
+# Fields that load_from_yaml can fill in from service.yaml.
+_YAML_FIELDS = ("app_name", "database_url", "db_pool_size")
+
+_DEFAULT_CORS_ORIGINS = ("http://localhost:3000", "http://localhost:8080")
 
 
 class BaseServiceSettings(BaseSettings):
-    """Base settings class with common fields for all services."""
+    """Base settings class with common fields for all services.
+
+    ``app_name``/``database_url``/``db_pool_size`` fall back to service.yaml;
+    set ``SERVICE_YAML_PATH`` to point at the file and skip the directory search.
+    """
 
     model_config = SettingsConfigDict(env_file=(".env", "env.example"), env_file_encoding="utf-8")
 
@@ -25,12 +33,26 @@ class BaseServiceSettings(BaseSettings):
     )
     db_pool_size: int = 20
 
+    @classmethod
+    def instance(cls) -> Self:
+        """Process-wide settings object for this class (env/YAML parsed once)."""
+        # _instance_for is cached per class, so it returns a ``cls`` instance.
+        return cast(Self, _instance_for(cls))
+
     @model_validator(mode="before")
     @classmethod
     def load_from_yaml(cls, values: dict[str, Any] | Any) -> dict[str, Any]:
-        """Load database settings from service.yaml if available."""
+        """Load database settings from service.yaml if available.
+
+        ``values`` already holds init kwargs merged with env/.env sources, so
+        when every YAML-derivable field is present the file is never touched.
+        """
         if not isinstance(values, dict):
             values = {}
+        if all(field in values for field in _YAML_FIELDS):
+            return values
+
+        from backend_common.settings.yaml_loader import load_service_yaml
 
         yaml_config = load_service_yaml()
         if not yaml_config:
@@ -54,23 +76,22 @@ class BaseServiceSettings(BaseSettings):
 
     # Use a string field to avoid JSON parsing by pydantic-settings
     cors_allowed_origins_str: str = Field(
-        default="http://localhost:3000,http://localhost:8080",
+        default=",".join(_DEFAULT_CORS_ORIGINS),
         alias="CORS_ALLOWED_ORIGINS",
     )
 
-    # This field is populated by the validator, not from env vars
-    cors_allowed_origins: list[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
-        validation_alias="__cors_allowed_origins_internal__",  # Use a non-existent alias to prevent env parsing
-    )
+    @computed_field  # type: ignore[prop-decorator]
+    @functools.cached_property
+    def cors_allowed_origins(self) -> tuple[str, ...]:
+        """CORS origins parsed from ``cors_allowed_origins_str``."""
+        return _split_origins(self.cors_allowed_origins_str) or _DEFAULT_CORS_ORIGINS
+
+
+@functools.cache
+def _instance_for(cls: type[BaseServiceSettings]) -> BaseServiceSettings:
+    return cls()
 
-    @model_validator(mode="after")
-    def parse_cors_origins(self) -> "BaseServiceSettings":
-        """Parse CORS origins from comma-separated string after model initialization."""
-        value = self.cors_allowed_origins_str
-        if value:
-            self.cors_allowed_origins = [
-                origin.strip() for origin in value.split(",") if origin.strip()
-            ]
-        return self
 
+@functools.lru_cache(maxsize=8)
+def _split_origins(value: str) -> tuple[str, ...]:
+    return tuple(origin.strip() for origin in value.split(",") if origin.strip())
@@ -0,0 +1,64 @@
+"""Bounded in-process cache with per-entry expiry.
+
+Shared by the services' hot-path caches (verified tokens, users behind
+access tokens, telemetry authorization results). Expiry uses the monotonic
+clock; callers with a wall-clock deadline (a token's ``exp``) pass the
+remaining seconds as ``ttl``.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Mapping whose entries expire after a TTL, holding at most ``max_entries``.
+
+    When full, the oldest insertion is dropped, so ``set`` never scans the
+    cache; expired entries are removed when they are read. A non-positive
+    ``ttl_seconds`` or ``max_entries`` disables the cache.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for *key*, or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        """Store *value*; ``ttl`` can only shorten the cache-wide TTL."""
+        if ttl is None or ttl > self._ttl:
+            ttl = self._ttl
+        if ttl <= 0 or self._max_entries <= 0:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_entries:
+            self._entries.popitem(last=False)
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
@@ -11,6 +11,7 @@ from aiohttp_cors import CorsConfig
 from backend_common.aiohttp_app import (
     _ALLOWED_HEADERS,
     _ALLOWED_METHODS,
+    _CORS_OPTIONS,
     _EXPOSED_HEADERS,
     add_cors_to_routes,
     add_healthcheck,
@@ -90,6 +91,26 @@ class TestCreateBaseApp:
 
         assert isinstance(cors, CorsConfig)
 
+    def test_origins_share_cors_options(self):
+        """Test every origin maps to the shared ResourceOptions instance."""
+        mock_settings = MagicMock()
+        mock_settings.app_name = "test-service"
+        mock_settings.cors_allowed_origins = (
+            "http://localhost:3000",
+            "https://example.com",
+        )
+
+        with patch("backend_common.aiohttp_app.cors_setup") as mock_setup:
+            create_base_app(mock_settings)
+
+        defaults = mock_setup.call_args.kwargs["defaults"]
+        assert list(defaults) == ["http://localhost:3000", "https://example.com"]
+        assert all(options is _CORS_OPTIONS for options in defaults.values())
+        assert _CORS_OPTIONS.allow_credentials is True
+        assert _CORS_OPTIONS.allow_headers == frozenset(
+            h.upper() for h in _ALLOWED_HEADERS
+        )
+
     def test_cors_with_empty_origins(self):
         """Test CORS works with empty origins list."""
         mock_settings = MagicMock()
@@ -3,7 +3,13 @@ from __future__ import annotations
 
 import pytest
 
-from backend_common.conversion import apply_conversion, validate_conversion_payload
+from backend_common.conversion import (
+    InvalidConversionError,
+    apply_conversion,
+    apply_conversion_batch,
+    compile_validated_conversion,
+    validate_conversion_payload,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -142,6 +148,62 @@ class TestUnknownKind:
         assert apply_conversion("", {}, 5.0) is None
 
 
+# ---------------------------------------------------------------------------
+# Batch
+# ---------------------------------------------------------------------------
+class TestBatch:
+    TABLE = [
+        {"raw": 10.0, "physical": 100.0},
+        {"raw": 0.0, "physical": 0.0},
+    ]
+
+    def test_linear(self):
+        assert apply_conversion_batch("linear", {"a": 2.0, "b": 1.0}, [0.0, 1.0, 3.0]) == [1.0, 3.0, 7.0]
+
+    def test_polynomial(self):
+        assert apply_conversion_batch("polynomial", {"coefficients": [1.0, 0.0, 2.0]}, [0.0, 3.0]) == [1.0, 19.0]
+
+    def test_lookup_table(self):
+        assert apply_conversion_batch("lookup_table", {"table": self.TABLE}, [-1.0, 2.5, 50.0]) == [
+            0.0,
+            25.0,
+            100.0,
+        ]
+
+    def test_matches_single_value_api(self):
+        values = [-5.0, 0.0, 1.5, 7.25, 10.0, 12.0]
+        payload = {"table": self.TABLE}
+        assert apply_conversion_batch("lookup_table", payload, values) == [
+            apply_conversion("lookup_table", payload, v) for v in values
+        ]
+
+    def test_invalid_payload(self):
+        assert apply_conversion_batch("linear", {"a": "two", "b": 1.0}, [1.0, 2.0]) == [None, None]
+
+    def test_unknown_kind(self):
+        assert apply_conversion_batch("custom_formula", {}, [1.0]) == [None]
+
+    def test_empty_batch(self):
+        assert apply_conversion_batch("linear", {"a": 1.0, "b": 0.0}, []) == []
+
+
+# ---------------------------------------------------------------------------
+# compile_validated_conversion
+# ---------------------------------------------------------------------------
+class TestCompileValidated:
+    def test_valid_payload_returns_converter(self):
+        convert = compile_validated_conversion("polynomial", {"coefficients": [1.0, 2.0]})
+        assert convert(3.0) == 7.0
+
+    def test_invalid_payload_raises(self):
+        with pytest.raises(InvalidConversionError, match="coefficients"):
+            compile_validated_conversion("polynomial", {"coefficients": [1.0, "bad"]})
+
+    def test_unknown_kind_raises(self):
+        with pytest.raises(InvalidConversionError, match="kind must be one of"):
+            compile_validated_conversion("custom_formula", {})
+
+
 # ---------------------------------------------------------------------------
 # validate_conversion_payload
 # ---------------------------------------------------------------------------
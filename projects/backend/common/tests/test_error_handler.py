@@ -0,0 +1,99 @@
+"""Unit tests for backend_common.middleware.error_handler module."""
+from __future__ import annotations
+
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+from backend_common.core.exceptions import ServiceError
+from backend_common.middleware import error_handler
+from backend_common.middleware.error_handler import (
+    error_handling_middleware,
+    register_error_mappings,
+)
+
+
+class _Base(Exception):
+    pass
+
+
+class _Child(_Base):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _isolated_mappings():
+    saved = dict(error_handler._extra_mappings)
+    error_handler._extra_mappings.clear()
+    error_handler._status_by_type.clear()
+    yield
+    error_handler._extra_mappings.clear()
+    error_handler._extra_mappings.update(saved)
+    error_handler._status_by_type.clear()
+
+
+def _raising(exc: BaseException):
+    async def handler(request: web.Request) -> web.StreamResponse:
+        raise exc
+
+    return handler
+
+
+async def _call(handler) -> web.Response:
+    request = make_mocked_request("GET", "/")
+    return await error_handling_middleware(request, handler)
+
+
+@pytest.mark.asyncio
+async def test_passes_through_response():
+    async def ok(request: web.Request) -> web.Response:
+        return web.Response(text="ok")
+
+    response = await _call(ok)
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_http_exception_is_reraised():
+    with pytest.raises(web.HTTPNotFound):
+        await _call(_raising(web.HTTPNotFound()))
+
+
+@pytest.mark.asyncio
+async def test_service_error_uses_status_code():
+    class _Conflict(ServiceError):
+        status_code = 409
+
+    response = await _call(_raising(_Conflict("taken")))
+    assert response.status == 409
+    assert json.loads(response.body) == {"error": "taken"}
+
+
+@pytest.mark.asyncio
+async def test_registered_mapping_matches_subclasses():
+    register_error_mappings({_Base: 422})
+
+    response = await _call(_raising(_Child("nope")))
+    assert response.status == 422
+    assert json.loads(response.body) == {"error": "nope"}
+    assert error_handler._status_by_type[_Child] == 422
+
+
+@pytest.mark.asyncio
+async def test_register_invalidates_resolved_statuses():
+    response = await _call(_raising(_Child()))
+    assert response.status == 500
+
+    register_error_mappings({_Child: 418})
+    response = await _call(_raising(_Child()))
+    assert response.status == 418
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception_returns_generic_500():
+    response = await _call(_raising(RuntimeError("secret details")))
+    assert response.status == 500
+    assert response.content_type == "application/json"
+    assert json.loads(response.body) == {"error": "Internal server error"}
@@ -0,0 +1,80 @@
+"""Tests for backend_common.logging_config."""
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+import structlog
+
+from backend_common import logging_config
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    logging_config._stop_queue_listener()
+    root.handlers, root.level = handlers, level
+
+
+def test_records_are_written_by_listener_thread(capsys, restore_root_logger):
+    logging_config.configure_logging()
+    root = logging.getLogger()
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], logging_config._DeferredQueueHandler)
+
+    try:
+        raise ValueError("bad\nvalue")
+    except ValueError:
+        logging.getLogger("test").exception("failed %s", "op")
+
+    logging_config._stop_queue_listener()
+    out = capsys.readouterr().out
+    lines = out.splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("failed op\\nTraceback")
+    assert "ValueError: bad\\nvalue" in lines[0]
+
+
+def test_structlog_traceback_is_formatted_by_listener(capsys, restore_root_logger, monkeypatch):
+    logging_config.configure_logging()
+    formatted_in: list[str] = []
+    original = logging_config.SingleLineFormatter.formatException
+
+    def spy(self, exc_info):
+        formatted_in.append(threading.current_thread().name)
+        return original(self, exc_info)
+
+    monkeypatch.setattr(logging_config.SingleLineFormatter, "formatException", spy)
+
+    try:
+        raise ValueError("bad\nvalue")
+    except ValueError:
+        structlog.get_logger("test").exception("op_failed", step="load")
+
+    logging_config._stop_queue_listener()
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    assert "level='error' logger='test' event='op_failed'" in lines[0]
+    assert "step='load' exception='Traceback" in lines[0]
+    assert "ValueError: bad\\\\nvalue" in lines[0]
+    assert formatted_in and "MainThread" not in formatted_in
+
+
+def test_structlog_event_without_exception(capsys, restore_root_logger):
+    logging_config.configure_logging()
+    structlog.get_logger("test").info("started", port=8000)
+
+    logging_config._stop_queue_listener()
+    (line,) = capsys.readouterr().out.splitlines()
+    assert line.endswith("event='started' port=8000")
+
+
+def test_reconfigure_replaces_listener(restore_root_logger):
+    logging_config.configure_logging()
+    first = logging_config._queue_listener
+    logging_config.configure_logging()
+    assert logging_config._queue_listener is not first
+    assert first is not None and first._thread is None
@@ -23,7 +23,11 @@ class TestPoolInitialization:
 
             mock_create.assert_called_once_with(
                 dsn="postgresql://localhost/test",
+                min_size=10,
                 max_size=10,
+                statement_cache_size=pool._STATEMENT_CACHE_SIZE,
+                max_inactive_connection_lifetime=0,
+                init=pool.init_connection,
             )
             assert pool.pool is mock_pool
             assert pool._sync_pool is mock_pool
@@ -85,6 +89,36 @@ class TestPoolInitialization:
             assert pool._sync_pool is new_pool
 
 
+class TestJsonbCodec:
+    """Tests for the jsonb codec registered on every pool connection."""
+
+    @pytest.mark.asyncio
+    async def test_init_connection_registers_binary_jsonb_codec(self):
+        conn = AsyncMock()
+
+        await pool.init_connection(conn)
+
+        conn.set_type_codec.assert_awaited_once_with(
+            "jsonb",
+            encoder=pool._encode_jsonb,
+            decoder=pool._decode_jsonb,
+            schema="pg_catalog",
+            format="binary",
+        )
+
+    @pytest.mark.parametrize(
+        "value", [{"a": [1, 2.5, None]}, '{"a": [1, 2.5, null]}', b'{"a": [1, 2.5, null]}'],
+    )
+    def test_encode_accepts_objects_and_pre_encoded_json(self, value):
+        data = pool._encode_jsonb(value)
+
+        assert data[:1] == b"\x01"
+        assert pool._decode_jsonb(data) == {"a": [1, 2.5, None]}
+
+    def test_decode_falls_back_for_out_of_range_numbers(self):
+        assert pool._decode_jsonb(b"\x01[1e400]") == [float("inf")]
+
+
 class TestPoolClose:
     """Tests for pool closing."""
 
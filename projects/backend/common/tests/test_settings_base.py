@@ -0,0 +1,75 @@
+"""Unit tests for backend_common.settings.base module."""
+from __future__ import annotations
+
+import pytest
+
+from backend_common.settings import yaml_loader
+from backend_common.settings.base import BaseServiceSettings
+
+
+class _Settings(BaseServiceSettings):
+    port: int = 8000
+
+
+@pytest.fixture
+def yaml_calls(monkeypatch):
+    calls = []
+
+    def fake_load_service_yaml(*args, **kwargs):
+        calls.append(args)
+        return {"name": "from-yaml", "database": {"pool_size": 3}}
+
+    monkeypatch.setattr(yaml_loader, "load_service_yaml", fake_load_service_yaml)
+    return calls
+
+
+def test_yaml_skipped_when_fields_passed_explicitly(yaml_calls):
+    settings = _Settings(
+        app_name="explicit",
+        database_url="postgresql://u:p@db:5432/app",
+        db_pool_size=5,
+    )
+
+    assert yaml_calls == []
+    assert settings.app_name == "explicit"
+    assert settings.db_pool_size == 5
+
+
+def test_yaml_skipped_when_fields_come_from_env(yaml_calls, monkeypatch):
+    monkeypatch.setenv("APP_NAME", "env-app")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@db:5432/app")
+    monkeypatch.setenv("DB_POOL_SIZE", "9")
+
+    settings = _Settings()
+
+    assert yaml_calls == []
+    assert settings.app_name == "env-app"
+    assert settings.db_pool_size == 9
+
+
+def test_yaml_fills_missing_fields(yaml_calls, monkeypatch):
+    monkeypatch.delenv("APP_NAME", raising=False)
+    monkeypatch.delenv("DB_POOL_SIZE", raising=False)
+
+    settings = _Settings(database_url="postgresql://u:p@db:5432/app")
+
+    assert len(yaml_calls) == 1
+    assert settings.app_name == "from-yaml"
+    assert settings.db_pool_size == 3
+
+
+def test_cors_origins_parsed_into_tuple(monkeypatch):
+    monkeypatch.setenv("CORS_ALLOWED_ORIGINS", " https://a.example , ,https://b.example")
+
+    settings = _Settings(app_name="svc", database_url="postgresql://u:p@db:5432/app", db_pool_size=1)
+
+    assert settings.cors_allowed_origins == ("https://a.example", "https://b.example")
+    assert settings.model_dump()["cors_allowed_origins"] == ("https://a.example", "https://b.example")
+
+
+def test_cors_origins_fall_back_to_defaults_when_empty(monkeypatch):
+    monkeypatch.setenv("CORS_ALLOWED_ORIGINS", "")
+
+    settings = _Settings(app_name="svc", database_url="postgresql://u:p@db:5432/app", db_pool_size=1)
+
+    assert settings.cors_allowed_origins == ("http://localhost:3000", "http://localhost:8080")
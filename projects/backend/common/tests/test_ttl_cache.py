@@ -0,0 +1,66 @@
+"""Tests for backend_common.ttl_cache."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from backend_common.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_miss_then_hit(self):
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60.0, max_entries=10)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_expired_entry_is_dropped(self):
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=10.0, max_entries=10)
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_ttl_argument_only_shortens(self):
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=10.0, max_entries=10)
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("short", 1, ttl=2.0)
+            cache.set("long", 2, ttl=3600.0)
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=105.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == 2
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=110.0):
+            assert cache.get("long") is None
+
+    def test_non_positive_ttl_argument_is_not_stored(self):
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=10.0, max_entries=10)
+        cache.set("a", 1, ttl=0.0)
+
+        assert len(cache) == 0
+
+    def test_evicts_oldest_insertion_when_full(self):
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60.0, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)  # re-set moves "a" to the newest position
+        cache.set("c", 4)
+
+        assert list(cache) == ["a", "c"]
+
+    def test_disabled(self):
+        for ttl, size in ((0.0, 10), (60.0, 0)):
+            cache: TTLCache[str, int] = TTLCache(ttl_seconds=ttl, max_entries=size)
+            cache.set("a", 1)
+            assert cache.get("a") is None
+
+    def test_pop_and_clear(self):
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=60.0, max_entries=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("a")  # absent keys are fine
+        assert list(cache) == ["b"]
+        cache.clear()
+        assert len(cache) == 0
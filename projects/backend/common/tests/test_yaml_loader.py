@@ -0,0 +1,98 @@
+"""Unit tests for backend_common.settings.yaml_loader module."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from backend_common.settings import yaml_loader
+from backend_common.settings.yaml_loader import load_service_yaml, reset_service_yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_service_yaml_cache()
+    yield
+    reset_service_yaml_cache()
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text)
+    return path
+
+
+def test_explicit_path_is_parsed_once(tmp_path, monkeypatch):
+    yaml_path = _write(tmp_path / "service.yaml", "name: svc\ndatabase:\n  pool_size: 7\n")
+    calls = []
+    real_parse = yaml_loader._parse_yaml
+
+    def counting_parse(stream):
+        calls.append(stream)
+        return real_parse(stream)
+
+    monkeypatch.setattr(yaml_loader, "_parse_yaml", counting_parse)
+
+    first = load_service_yaml(yaml_path)
+    second = load_service_yaml(yaml_path)
+
+    assert first is second
+    assert first["name"] == "svc"
+    assert first["database"]["pool_size"] == 7
+    assert len(calls) == 1
+
+
+def test_result_is_read_only(tmp_path):
+    config = load_service_yaml(_write(tmp_path / "service.yaml", "name: svc\n"))
+    with pytest.raises(TypeError):
+        config["name"] = "other"  # type: ignore[index]
+
+
+def test_reset_forces_reread(tmp_path):
+    yaml_path = _write(tmp_path / "service.yaml", "name: one\n")
+    assert load_service_yaml(yaml_path)["name"] == "one"
+
+    _write(yaml_path, "name: two\n")
+    assert load_service_yaml(yaml_path)["name"] == "one"
+
+    reset_service_yaml_cache()
+    assert load_service_yaml(yaml_path)["name"] == "two"
+
+
+def test_missing_or_non_mapping_yaml_is_empty(tmp_path):
+    assert load_service_yaml(tmp_path / "absent.yaml") == {}
+    assert load_service_yaml(_write(tmp_path / "list.yaml", "- a\n- b\n")) == {}
+
+
+def test_auto_discovery_is_keyed_by_cwd(tmp_path, monkeypatch):
+    first_dir = tmp_path / "a"
+    second_dir = tmp_path / "b"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    _write(first_dir / "service.yaml", "name: a\n")
+    _write(second_dir / "service.yaml", "name: b\n")
+
+    monkeypatch.chdir(first_dir)
+    assert load_service_yaml().get("name") == "a"
+    monkeypatch.chdir(second_dir)
+    assert load_service_yaml().get("name") == "b"
+
+
+def test_env_var_path_skips_discovery(tmp_path, monkeypatch):
+    yaml_path = _write(tmp_path / "custom.yaml", "name: from-env\n")
+    monkeypatch.setenv("SERVICE_YAML_PATH", str(yaml_path))
+
+    def fail_find(*args, **kwargs):
+        raise AssertionError("find_service_yaml must not be called")
+
+    monkeypatch.setattr(yaml_loader, "find_service_yaml", fail_find)
+
+    assert load_service_yaml().get("name") == "from-env"
+
+
+def test_safe_loader_rejects_python_tags(tmp_path):
+    yaml_path = _write(tmp_path / "service.yaml", "name: !!python/object/apply:os.getcwd []\n")
+    assert load_service_yaml(yaml_path) == {}
+
+
+def test_unparsable_yaml_is_empty(tmp_path):
+    assert load_service_yaml(_write(tmp_path / "broken.yaml", "name: [unclosed\n")) == {}
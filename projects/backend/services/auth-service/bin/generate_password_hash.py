@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
-"""Generate bcrypt password hash."""
+"""Generate argon2id password hash.
+
+The cost parameters follow ARGON2_TIME_COST / ARGON2_MEMORY_COST_KIB /
+ARGON2_PARALLELISM (defaults 2 / 65536 / 1), like the auth-service
+``argon2_*`` settings, so seeded hashes are not rehashed on first login.
+"""
+import os
 import sys
-import bcrypt
+from argon2 import PasswordHasher
 
 if len(sys.argv) < 2:
     print("Usage: python generate_password_hash.py <password>")
     sys.exit(1)
 
 password = sys.argv[1]
-hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=12))
-print(hashed.decode('utf-8'))
-
+hasher = PasswordHasher(
+    time_cost=int(os.environ.get('ARGON2_TIME_COST', '2')),
+    memory_cost=int(os.environ.get('ARGON2_MEMORY_COST_KIB', '65536')),
+    parallelism=int(os.environ.get('ARGON2_PARALLELISM', '1')),
+)
+print(hasher.hash(password))
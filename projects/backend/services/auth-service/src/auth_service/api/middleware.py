@@ -1,6 +1,7 @@
 """aiohttp middlewares for auth-service."""
 from __future__ import annotations
 
+import json
 from typing import Awaitable, Callable
 
 from aiohttp import web
@@ -17,6 +18,14 @@ _PCR_ALLOWED_PATHS: frozenset[str] = frozenset(
     }
 )
 
+# The 403 payload never varies, so encode it once instead of per blocked request.
+_PCR_RESPONSE_BODY: bytes = json.dumps(
+    {
+        "error": "password_change_required",
+        "message": "You must change your password before continuing",
+    }
+).encode()
+
 Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
 Middleware = Callable[[web.Request, Handler], Awaitable[web.StreamResponse]]
 
@@ -31,6 +40,13 @@ async def password_change_required_middleware(
     Allowed paths are :data:`_PCR_ALLOWED_PATHS`. All other paths return
     403 with ``{"error": "password_change_required", ...}``.
     """
+    # Allowed paths pass regardless of the token, so check them before
+    # paying for JWT decoding.
+    path = request.path.rstrip("/") or "/"
+    # Normalise so both "/auth/logout" and "/auth/logout/" match.
+    if path in _PCR_ALLOWED_PATHS:
+        return await handler(request)
+
     token = extract_bearer_token(request)
     if token is None:
         return await handler(request)
@@ -44,16 +60,8 @@ async def password_change_required_middleware(
     if not payload.get("pcr", False):
         return await handler(request)
 
-    # pcr=true — enforce the allowed-paths wall.
-    path = request.path.rstrip("/") or "/"
-    # Normalise so both "/auth/logout" and "/auth/logout/" match.
-    if path in _PCR_ALLOWED_PATHS:
-        return await handler(request)
-
-    return web.json_response(
-        {
-            "error": "password_change_required",
-            "message": "You must change your password before continuing",
-        },
+    return web.Response(
+        body=_PCR_RESPONSE_BODY,
         status=403,
+        content_type="application/json",
     )
@@ -6,7 +6,7 @@ from uuid import UUID
 import structlog
 from aiohttp import web
 
-from auth_service.api.utils import get_requester_id
+from auth_service.api.utils import get_requester_id, json_response
 from auth_service.core.exceptions import ForbiddenError, InvalidCredentialsError
 from auth_service.domain.dto import AuditLogEntry
 from auth_service.repositories.audit import AuditRepository
@@ -72,17 +72,17 @@ async def list_audit_log(request: web.Request) -> web.Response:
         )
 
         response = [AuditLogEntry.from_model(e).model_dump() for e in entries]
-        return web.json_response(response)
+        return json_response(response)
 
     except web.HTTPBadRequest:
         raise
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except Exception as e:
         logger.error("Failed to query audit log", exc_info=e)
-        return web.json_response({"error": str(e)}, status=500)
+        return json_response({"error": str(e)}, status=500)
 
 
 async def ingest_audit_entry(request: web.Request) -> web.Response:
@@ -126,7 +126,7 @@ async def ingest_audit_entry(request: web.Request) -> web.Response:
         ip_address=data.get("ip_address"),
         user_agent=data.get("user_agent"),
     )
-    return web.json_response(AuditLogEntry.from_model(entry).model_dump(), status=201)
+    return json_response(AuditLogEntry.from_model(entry).model_dump(), status=201)
 
 
 def setup_routes(app: web.Application) -> None:
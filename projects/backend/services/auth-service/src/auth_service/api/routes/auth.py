@@ -6,9 +6,13 @@ from uuid import UUID
 import structlog
 from aiohttp import web
 
-from backend_common.aiohttp_app import read_json
-
-from auth_service.api.utils import extract_bearer_token, extract_client_ip, extract_user_agent
+from auth_service.api.utils import (
+    extract_bearer_token,
+    extract_client_ip,
+    extract_user_agent,
+    invalid_request_response,
+    json_response,
+)
 from auth_service.core.exceptions import AuthError, handle_auth_error
 from auth_service.domain.dto import (
     AdminUserResetRequest,
@@ -45,13 +49,12 @@ async def _get_requester_id(request: web.Request, auth_service: AuthService) ->
 async def bootstrap_admin(request: web.Request) -> web.Response:
     """Create the first superadmin user. Requires ADMIN_BOOTSTRAP_SECRET."""
     if not settings.admin_bootstrap_secret:
-        return web.json_response({"error": "Bootstrap is disabled"}, status=404)
+        return json_response({"error": "Bootstrap is disabled"}, status=404)
 
     try:
-        data = await read_json(request)
-        req = BootstrapAdminRequest(**data)
+        req = BootstrapAdminRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -64,10 +67,10 @@ async def bootstrap_admin(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        user_resp = await auth_service.get_user_response(user)
-        return web.json_response(
+        user_payload = await auth_service.get_user_payload(user)
+        return json_response(
             {
-                "user": user_resp.model_dump(),
+                "user": user_payload,
                 "access_token": tokens.access_token,
                 "refresh_token": tokens.refresh_token,
             },
@@ -77,16 +80,15 @@ async def bootstrap_admin(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Bootstrap admin error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def register(request: web.Request) -> web.Response:
     """Register a new user."""
     try:
-        data = await read_json(request)
-        req = UserRegisterRequest(**data)
+        req = UserRegisterRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -98,10 +100,10 @@ async def register(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        user_resp = await auth_service.get_user_response(user)
-        return web.json_response(
+        user_payload = await auth_service.get_user_payload(user)
+        return json_response(
             {
-                "user": user_resp.model_dump(),
+                "user": user_payload,
                 "access_token": tokens.access_token,
                 "refresh_token": tokens.refresh_token,
             },
@@ -111,16 +113,15 @@ async def register(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Registration error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def login(request: web.Request) -> web.Response:
     """Login user."""
     try:
-        data = await read_json(request)
-        req = UserLoginRequest(**data)
+        req = UserLoginRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -130,66 +131,64 @@ async def login(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        user_resp = await auth_service.get_user_response(user)
+        user_payload = await auth_service.get_user_payload(user)
         body: dict = {
-            "user": user_resp.model_dump(),
+            "user": user_payload,
             "access_token": tokens.access_token,
             "refresh_token": tokens.refresh_token,
         }
         if tokens.password_change_required:
             body["password_change_required"] = True
-        return web.json_response(body, status=200)
+        return json_response(body, status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Login error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def refresh(request: web.Request) -> web.Response:
     """Refresh access token."""
     try:
-        data = await read_json(request)
-        req = TokenRefreshRequest(**data)
+        req = TokenRefreshRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
         tokens = await auth_service.refresh_token(req.refresh_token)
-        return web.json_response(tokens.model_dump(), status=200)
+        return json_response(tokens.model_dump(), status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Refresh error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def me(request: web.Request) -> web.Response:
     """Get current user information."""
     token = extract_bearer_token(request)
     if not token:
-        return web.json_response({"error": "Unauthorized"}, status=401)
+        return json_response({"error": "Unauthorized"}, status=401)
 
     try:
         auth_service = await get_auth_service(request)
         user = await auth_service.get_user_by_token(token)
-        user_resp = await auth_service.get_user_response(user)
-        return web.json_response(user_resp.model_dump(), status=200)
+        user_payload = await auth_service.get_user_payload(user)
+        return json_response(user_payload, status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Me error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def logout(request: web.Request) -> web.Response:
     """Logout user — revokes the provided refresh token."""
     try:
-        data = await read_json(request)
-        req = LogoutRequest(**data)
+        req = LogoutRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -198,25 +197,24 @@ async def logout(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        return web.json_response({"ok": True}, status=200)
+        return json_response({"ok": True}, status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Logout error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def change_password(request: web.Request) -> web.Response:
     """Change user password."""
     token = extract_bearer_token(request)
     if not token:
-        return web.json_response({"error": "Unauthorized"}, status=401)
+        return json_response({"error": "Unauthorized"}, status=401)
 
     try:
-        data = await read_json(request)
-        req = PasswordChangeRequest(**data)
+        req = PasswordChangeRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -226,10 +224,10 @@ async def change_password(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        user_resp = await auth_service.get_user_response(updated_user)
-        return web.json_response(
+        user_payload = await auth_service.get_user_payload(updated_user)
+        return json_response(
             {
-                **user_resp.model_dump(),
+                **user_payload,
                 "access_token": new_tokens.access_token,
                 "refresh_token": new_tokens.refresh_token,
             },
@@ -239,16 +237,15 @@ async def change_password(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Change password error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def password_reset_request(request: web.Request) -> web.Response:
     """Request a password reset token."""
     try:
-        data = await read_json(request)
-        req = PasswordResetRequestDto(**data)
+        req = PasswordResetRequestDto.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     MSG = "Если этот email зарегистрирован, вы получите письмо со ссылкой для сброса пароля"
 
@@ -264,16 +261,15 @@ async def password_reset_request(request: web.Request) -> web.Response:
         logger.exception("Password reset request error")
         # Still return success to avoid leaking info
 
-    return web.json_response({"message": MSG})
+    return json_response({"message": MSG})
 
 
 async def password_reset_confirm(request: web.Request) -> web.Response:
     """Confirm a password reset using a token."""
     try:
-        data = await read_json(request)
-        req = PasswordResetConfirmRequest(**data)
+        req = PasswordResetConfirmRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -282,12 +278,12 @@ async def password_reset_confirm(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        return web.json_response(tokens.model_dump(), status=200)
+        return json_response(tokens.model_dump(), status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Password reset confirm error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def admin_reset_user(request: web.Request) -> web.Response:
@@ -295,15 +291,14 @@ async def admin_reset_user(request: web.Request) -> web.Response:
     user_id_str = request.match_info.get("user_id", "")
 
     try:
-        data = await read_json(request)
-        req = AdminUserResetRequest(**data)
+        req = AdminUserResetRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         target_user_id = UUID(user_id_str)
     except ValueError:
-        return web.json_response({"error": "Invalid user_id"}, status=400)
+        return json_response({"error": "Invalid user_id"}, status=400)
 
     try:
         auth_service = await get_auth_service(request)
@@ -311,36 +306,35 @@ async def admin_reset_user(request: web.Request) -> web.Response:
         updated_user, new_password = await auth_service.admin_reset_user(
             requester_id, target_user_id, req.new_password,
         )
-        user_resp = await auth_service.get_user_response(updated_user)
-        return web.json_response(
-            {"user": user_resp.model_dump(), "new_password": new_password},
+        user_payload = await auth_service.get_user_payload(updated_user)
+        return json_response(
+            {"user": user_payload, "new_password": new_password},
             status=200,
         )
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Admin reset user error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def create_invite(request: web.Request) -> web.Response:
     """Create a new invite token. Requires 'users.create' permission."""
     try:
-        data = await read_json(request)
-        req = InviteCreateRequest(**data)
+        req = InviteCreateRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
         requester_id = await _get_requester_id(request, auth_service)
         invite = await auth_service.create_invite(requester_id, req.email_hint, req.expires_in_hours)
-        return web.json_response(InviteResponse.from_model(invite).model_dump(mode="json"), status=201)
+        return json_response(InviteResponse.from_model(invite).model_dump(mode="json"), status=201)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Create invite error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def list_invites(request: web.Request) -> web.Response:
@@ -352,7 +346,7 @@ async def list_invites(request: web.Request) -> web.Response:
         auth_service = await get_auth_service(request)
         requester_id = await _get_requester_id(request, auth_service)
         invites = await auth_service.list_invites(requester_id, active_only=active_only)
-        return web.json_response(
+        return json_response(
             [InviteResponse.from_model(inv).model_dump(mode="json") for inv in invites],
             status=200,
         )
@@ -360,7 +354,7 @@ async def list_invites(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("List invites error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def revoke_invite(request: web.Request) -> web.Response:
@@ -369,7 +363,7 @@ async def revoke_invite(request: web.Request) -> web.Response:
     try:
         invite_token_uuid = UUID(token_str)
     except ValueError:
-        return web.json_response({"error": "Invalid token format"}, status=400)
+        return json_response({"error": "Invalid token format"}, status=400)
 
     try:
         auth_service = await get_auth_service(request)
@@ -380,7 +374,7 @@ async def revoke_invite(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Revoke invite error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def list_users(request: web.Request) -> web.Response:
@@ -395,13 +389,13 @@ async def list_users(request: web.Request) -> web.Response:
         if is_active_str is not None:
             filter_active = is_active_str.lower() in ("true", "1", "yes")
             users = [u for u in users if u.is_active == filter_active]
-        results = [r.model_dump() for r in await auth_service.get_user_responses(users)]
-        return web.json_response(results, status=200)
+        results = await auth_service.get_user_payloads(users)
+        return json_response(results, status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("List users error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def update_user(request: web.Request) -> web.Response:
@@ -410,13 +404,12 @@ async def update_user(request: web.Request) -> web.Response:
     try:
         target_user_id = UUID(user_id_str)
     except ValueError:
-        return web.json_response({"error": "Invalid user_id"}, status=400)
+        return json_response({"error": "Invalid user_id"}, status=400)
 
     try:
-        data = await read_json(request)
-        req = AdminUserUpdateRequest(**data)
+        req = AdminUserUpdateRequest.model_validate_json(await request.read())
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         auth_service = await get_auth_service(request)
@@ -424,13 +417,13 @@ async def update_user(request: web.Request) -> web.Response:
         user = await auth_service.update_user(
             requester_id, target_user_id, req.is_active, req.is_admin,
         )
-        user_resp = await auth_service.get_user_response(user)
-        return web.json_response(user_resp.model_dump(), status=200)
+        user_payload = await auth_service.get_user_payload(user)
+        return json_response(user_payload, status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Update user error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def delete_user(request: web.Request) -> web.Response:
@@ -439,7 +432,7 @@ async def delete_user(request: web.Request) -> web.Response:
     try:
         target_user_id = UUID(user_id_str)
     except ValueError:
-        return web.json_response({"error": "Invalid user_id"}, status=400)
+        return json_response({"error": "Invalid user_id"}, status=400)
 
     try:
         auth_service = await get_auth_service(request)
@@ -450,24 +443,28 @@ async def delete_user(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Delete user error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 def setup_routes(app: web.Application) -> None:
     """Setup authentication routes."""
-    app.router.add_post("/auth/admin/bootstrap", bootstrap_admin)
-    app.router.add_post("/auth/login", login)
-    app.router.add_post("/auth/register", register)
-    app.router.add_post("/auth/refresh", refresh)
-    app.router.add_post("/auth/logout", logout)
-    app.router.add_get("/auth/me", me)
-    app.router.add_post("/auth/change-password", change_password)
-    app.router.add_post("/auth/password-reset/request", password_reset_request)
-    app.router.add_post("/auth/password-reset/confirm", password_reset_confirm)
-    app.router.add_post("/auth/admin/users/{user_id}/reset", admin_reset_user)
-    app.router.add_post("/auth/admin/invites", create_invite)
-    app.router.add_get("/auth/admin/invites", list_invites)
-    app.router.add_delete("/auth/admin/invites/{token}", revoke_invite)
-    app.router.add_get("/auth/admin/users", list_users)
-    app.router.add_patch("/auth/admin/users/{user_id}", update_user)
-    app.router.add_delete("/auth/admin/users/{user_id}", delete_user)
+    app.add_routes(
+        [
+            web.post("/auth/admin/bootstrap", bootstrap_admin),
+            web.post("/auth/login", login),
+            web.post("/auth/register", register),
+            web.post("/auth/refresh", refresh),
+            web.post("/auth/logout", logout),
+            web.get("/auth/me", me),
+            web.post("/auth/change-password", change_password),
+            web.post("/auth/password-reset/request", password_reset_request),
+            web.post("/auth/password-reset/confirm", password_reset_confirm),
+            web.post("/auth/admin/users/{user_id}/reset", admin_reset_user),
+            web.post("/auth/admin/invites", create_invite),
+            web.get("/auth/admin/invites", list_invites),
+            web.delete("/auth/admin/invites/{token}", revoke_invite),
+            web.get("/auth/admin/users", list_users),
+            web.patch("/auth/admin/users/{user_id}", update_user),
+            web.delete("/auth/admin/users/{user_id}", delete_user),
+        ]
+    )
@@ -6,7 +6,7 @@ from uuid import UUID
 import structlog
 from aiohttp import web
 
-from auth_service.api.utils import get_requester_id
+from auth_service.api.utils import get_requester_id, json_response
 from auth_service.core.exceptions import InvalidCredentialsError
 from auth_service.domain.dto import PermissionResponse
 from auth_service.repositories.permissions import PermissionRepository
@@ -30,12 +30,12 @@ async def list_permissions(request: web.Request) -> web.Response:
         permissions = await perm_repo.list_all()
 
         response = [PermissionResponse.from_model(p).model_dump() for p in permissions]
-        return web.json_response(response)
+        return json_response(response)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to list permissions", exc_info=e)
-        return web.json_response({"error": str(e)}, status=500)
+        return json_response({"error": str(e)}, status=500)
 
 
 async def get_effective_permissions(request: web.Request) -> web.Response:
@@ -67,14 +67,14 @@ async def get_effective_permissions(request: web.Request) -> web.Response:
             await perm_svc.ensure_permission(requester_id, "project.members.view", project_id)
         
         effective_perms = await perm_svc.get_effective_permissions(target_user_id, project_id)
-        return web.json_response(effective_perms.model_dump())
+        return json_response(effective_perms.model_dump())
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to get effective permissions", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 def setup_routes(app: web.Application) -> None:
@@ -6,7 +6,7 @@ from uuid import UUID
 import structlog
 from aiohttp import web
 
-from auth_service.api.utils import get_requester_id
+from auth_service.api.utils import get_requester_id, json_response
 from auth_service.core.exceptions import InvalidCredentialsError
 from auth_service.domain.dto import CreateRoleRequest, RoleResponse, UpdateRoleRequest
 from auth_service.domain.models import ScopeType
@@ -50,14 +50,14 @@ async def list_project_roles(request: web.Request) -> web.Response:
             role_resp = RoleResponse.from_model(role, permissions=perms)
             result.append(role_resp.model_dump())
         
-        return web.json_response(result)
+        return json_response(result)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to list project roles", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def get_project_role(request: web.Request) -> web.Response:
@@ -78,18 +78,18 @@ async def get_project_role(request: web.Request) -> web.Response:
         role = await role_repo.get_by_id_or_raise(role_id)
         
         if role.scope_type != ScopeType.PROJECT or role.project_id != project_id:
-            return web.json_response({"error": "Role not found in this project"}, status=404)
+            return json_response({"error": "Role not found in this project"}, status=404)
         
         perms = await role_repo.get_permissions(role.id)
         role_resp = RoleResponse.from_model(role, permissions=perms)
-        return web.json_response(role_resp.model_dump())
+        return json_response(role_resp.model_dump())
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to get project role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def create_project_role(request: web.Request) -> web.Response:
@@ -117,14 +117,14 @@ async def create_project_role(request: web.Request) -> web.Response:
         # Fetch permissions for response
         perm_ids = await perm_svc.get_role_permissions(role.id)
         role_resp = RoleResponse.from_model(role, permissions=perm_ids)
-        return web.json_response(role_resp.model_dump(), status=201)
+        return json_response(role_resp.model_dump(), status=201)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to create project role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def update_project_role(request: web.Request) -> web.Response:
@@ -144,7 +144,7 @@ async def update_project_role(request: web.Request) -> web.Response:
         # Verify role belongs to this project BEFORE making changes
         existing_role = await perm_svc.get_role_by_id_or_raise(role_id)
         if existing_role.project_id != project_id:
-            return web.json_response({"error": "Role not found in this project"}, status=404)
+            return json_response({"error": "Role not found in this project"}, status=404)
 
         role = await perm_svc.update_custom_role(
             updater_id=requester_id,
@@ -157,14 +157,14 @@ async def update_project_role(request: web.Request) -> web.Response:
         # Fetch permissions for response
         perm_ids = await perm_svc.get_role_permissions(role.id)
         role_resp = RoleResponse.from_model(role, permissions=perm_ids)
-        return web.json_response(role_resp.model_dump())
+        return json_response(role_resp.model_dump())
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to update project role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def delete_project_role(request: web.Request) -> web.Response:
@@ -181,17 +181,17 @@ async def delete_project_role(request: web.Request) -> web.Response:
         
         role = await perm_svc.get_role_by_id_or_raise(role_id)
         if role.project_id != project_id:
-            return web.json_response({"error": "Role not found in this project"}, status=404)
+            return json_response({"error": "Role not found in this project"}, status=404)
         
         await perm_svc.delete_custom_role(requester_id, role_id)
         return web.Response(status=204)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to delete project role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 # =============================================================================
@@ -225,21 +225,21 @@ async def list_member_roles(request: web.Request) -> web.Response:
             if role is None:
                 continue  # skip orphaned assignments (role was deleted)
             result.append({
-                "role_id": str(role.id),
+                "role_id": role.id,
                 "role_name": role.name,
-                "granted_by": str(assignment.granted_by),
-                "granted_at": assignment.granted_at.isoformat(),
-                "expires_at": assignment.expires_at.isoformat() if assignment.expires_at else None,
+                "granted_by": assignment.granted_by,
+                "granted_at": assignment.granted_at,
+                "expires_at": assignment.expires_at,
             })
         
-        return web.json_response(result)
+        return json_response(result)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to list member roles", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def grant_role_to_member(request: web.Request) -> web.Response:
@@ -272,21 +272,21 @@ async def grant_role_to_member(request: web.Request) -> web.Response:
             role_id=role_id,
         )
         
-        return web.json_response({
-            "user_id": str(role_assignment.user_id),
-            "project_id": str(role_assignment.project_id),
-            "role_id": str(role_assignment.role_id),
-            "granted_by": str(role_assignment.granted_by),
-            "granted_at": role_assignment.granted_at.isoformat(),
-            "expires_at": role_assignment.expires_at.isoformat() if role_assignment.expires_at else None,
+        return json_response({
+            "user_id": role_assignment.user_id,
+            "project_id": role_assignment.project_id,
+            "role_id": role_assignment.role_id,
+            "granted_by": role_assignment.granted_by,
+            "granted_at": role_assignment.granted_at,
+            "expires_at": role_assignment.expires_at,
         }, status=201)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to grant project role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def revoke_role_from_member(request: web.Request) -> web.Response:
@@ -310,16 +310,16 @@ async def revoke_role_from_member(request: web.Request) -> web.Response:
         )
         
         if success:
-            return web.json_response({"message": "Role revoked"}, status=200)
+            return json_response({"message": "Role revoked"}, status=200)
         else:
-            return web.json_response({"error": "Role assignment not found"}, status=404)
+            return json_response({"error": "Role assignment not found"}, status=404)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to revoke project role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 def setup_routes(app: web.Application) -> None:
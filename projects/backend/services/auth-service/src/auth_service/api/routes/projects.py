@@ -6,7 +6,13 @@ from uuid import UUID
 
 from aiohttp import web
 
-from auth_service.api.utils import extract_client_ip, extract_user_agent, get_requester_id
+from auth_service.api.utils import (
+    extract_client_ip,
+    extract_user_agent,
+    get_requester_id,
+    invalid_request_response,
+    json_response,
+)
 from auth_service.core.exceptions import AuthError, ForbiddenError, NotFoundError, handle_auth_error
 from auth_service.domain.dto import (
     ProjectCreateRequest,
@@ -43,7 +49,7 @@ async def create_project(request: web.Request) -> web.Response:
         data = await read_json(request)
         req = ProjectCreateRequest(**data)
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         service = await get_project_service(request)
@@ -54,7 +60,7 @@ async def create_project(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        return web.json_response(
+        return json_response(
             ProjectResponse.from_project(project).model_dump(),
             status=201,
         )
@@ -62,7 +68,7 @@ async def create_project(request: web.Request) -> web.Response:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Create project error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def get_project(request: web.Request) -> web.Response:
@@ -76,24 +82,24 @@ async def get_project(request: web.Request) -> web.Response:
     try:
         project_id = _parse_project_id(request)
     except web.HTTPBadRequest:
-        return web.json_response({"error": "Invalid project ID"}, status=400)
+        return json_response({"error": "Invalid project ID"}, status=400)
 
     try:
         service = await get_project_service(request)
         project = await service.get_project(project_id, user_id)
-        return web.json_response(
+        return json_response(
             ProjectResponse.from_project(project).model_dump(),
             status=200,
         )
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Get project error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def list_projects(request: web.Request) -> web.Response:
@@ -118,7 +124,7 @@ async def list_projects(request: web.Request) -> web.Response:
         limit = min(max(int(request.query.get("limit", "20")), 1), 100)
         offset = max(int(request.query.get("offset", "0")), 0)
     except ValueError:
-        return web.json_response({"error": "limit and offset must be integers"}, status=400)
+        return json_response({"error": "limit and offset must be integers"}, status=400)
 
     try:
         service = await get_project_service(request)
@@ -131,12 +137,12 @@ async def list_projects(request: web.Request) -> web.Response:
             limit=limit,
             offset=offset,
         )
-        return web.json_response(response.model_dump(), status=200)
+        return json_response(response.model_dump(), status=200)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("List projects error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def update_project(request: web.Request) -> web.Response:
@@ -150,13 +156,13 @@ async def update_project(request: web.Request) -> web.Response:
     try:
         project_id = _parse_project_id(request)
     except web.HTTPBadRequest:
-        return web.json_response({"error": "Invalid project ID"}, status=400)
+        return json_response({"error": "Invalid project ID"}, status=400)
 
     try:
         data = await read_json(request)
         req = ProjectUpdateRequest(**data)
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         service = await get_project_service(request)
@@ -166,19 +172,19 @@ async def update_project(request: web.Request) -> web.Response:
             name=req.name,
             description=req.description,
         )
-        return web.json_response(
+        return json_response(
             ProjectResponse.from_project(project).model_dump(),
             status=200,
         )
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Update project error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def delete_project(request: web.Request) -> web.Response:
@@ -192,7 +198,7 @@ async def delete_project(request: web.Request) -> web.Response:
     try:
         project_id = _parse_project_id(request)
     except web.HTTPBadRequest:
-        return web.json_response({"error": "Invalid project ID"}, status=400)
+        return json_response({"error": "Invalid project ID"}, status=400)
 
     try:
         service = await get_project_service(request)
@@ -201,16 +207,16 @@ async def delete_project(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        return web.json_response({"ok": True}, status=200)
+        return json_response({"ok": True}, status=200)
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Delete project error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def list_members(request: web.Request) -> web.Response:
@@ -224,12 +230,12 @@ async def list_members(request: web.Request) -> web.Response:
     try:
         project_id = _parse_project_id(request)
     except web.HTTPBadRequest:
-        return web.json_response({"error": "Invalid project ID"}, status=400)
+        return json_response({"error": "Invalid project ID"}, status=400)
 
     try:
         service = await get_project_service(request)
         members = await service.list_members(project_id, user_id)
-        return web.json_response(
+        return json_response(
             {
                 "members": [
                     ProjectMemberResponse(
@@ -245,14 +251,14 @@ async def list_members(request: web.Request) -> web.Response:
             status=200,
         )
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("List members error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def add_member(request: web.Request) -> web.Response:
@@ -266,19 +272,19 @@ async def add_member(request: web.Request) -> web.Response:
     try:
         project_id = _parse_project_id(request)
     except web.HTTPBadRequest:
-        return web.json_response({"error": "Invalid project ID"}, status=400)
+        return json_response({"error": "Invalid project ID"}, status=400)
 
     try:
         data = await read_json(request)
         req = ProjectMemberAddRequest(**data)
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         new_user_id = UUID(req.user_id)
         role_id = UUID(req.resolved_role_id())
     except ValueError as e:
-        return web.json_response({"error": str(e)}, status=400)
+        return json_response({"error": str(e)}, status=400)
 
     try:
         service = await get_project_service(request)
@@ -290,26 +296,26 @@ async def add_member(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        return web.json_response(
+        return json_response(
             {
-                "user_id": str(assignment.user_id),
-                "project_id": str(assignment.project_id),
-                "role_id": str(assignment.role_id),
-                "granted_by": str(assignment.granted_by),
-                "granted_at": assignment.granted_at.isoformat(),
-                "expires_at": assignment.expires_at.isoformat() if assignment.expires_at else None,
+                "user_id": assignment.user_id,
+                "project_id": assignment.project_id,
+                "role_id": assignment.role_id,
+                "granted_by": assignment.granted_by,
+                "granted_at": assignment.granted_at,
+                "expires_at": assignment.expires_at,
             },
             status=201,
         )
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Add member error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def remove_member(request: web.Request) -> web.Response:
@@ -324,17 +330,17 @@ async def remove_member(request: web.Request) -> web.Response:
         project_id = UUID(request.match_info["project_id"])
         member_user_id = UUID(request.match_info["user_id"])
     except ValueError:
-        return web.json_response({"error": "Invalid ID"}, status=400)
+        return json_response({"error": "Invalid ID"}, status=400)
 
     # Get role_id from query param or body
     try:
         data = await read_json(request) if request.can_read_body else {}
         role_id_str = data.get("role_id") or request.query.get("role_id")
         if not role_id_str:
-            return web.json_response({"error": "role_id required"}, status=400)
+            return json_response({"error": "role_id required"}, status=400)
         role_id = UUID(role_id_str)
     except ValueError:
-        return web.json_response({"error": "Invalid role ID"}, status=400)
+        return json_response({"error": "Invalid role ID"}, status=400)
 
     try:
         service = await get_project_service(request)
@@ -346,16 +352,16 @@ async def remove_member(request: web.Request) -> web.Response:
             ip_address=extract_client_ip(request),
             user_agent=extract_user_agent(request),
         )
-        return web.json_response({"ok": True}, status=200)
+        return json_response({"ok": True}, status=200)
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Remove member error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 async def update_member_role(request: web.Request) -> web.Response:
@@ -370,24 +376,24 @@ async def update_member_role(request: web.Request) -> web.Response:
         project_id = UUID(request.match_info["project_id"])
         member_user_id = UUID(request.match_info["user_id"])
     except ValueError:
-        return web.json_response({"error": "Invalid ID"}, status=400)
+        return json_response({"error": "Invalid ID"}, status=400)
 
     try:
         data = await read_json(request)
         req = ProjectMemberUpdateRequest(**data)
     except Exception as e:
-        return web.json_response({"error": f"Invalid request: {e}"}, status=400)
+        return invalid_request_response(e)
 
     try:
         new_role_id = UUID(req.resolved_role_id())
         # Get old role_id from query param (also supports role name)
         old_role_id_str = request.query.get("old_role_id") or request.query.get("old_role")
         if not old_role_id_str:
-            return web.json_response({"error": "old_role_id query param required"}, status=400)
+            return json_response({"error": "old_role_id query param required"}, status=400)
         from auth_service.domain.dto import PROJECT_ROLE_NAME_TO_ID as _RMAP
         old_role_id = UUID(_RMAP.get(old_role_id_str.lower(), old_role_id_str))
     except ValueError as e:
-        return web.json_response({"error": str(e)}, status=400)
+        return json_response({"error": str(e)}, status=400)
 
     try:
         service = await get_project_service(request)
@@ -398,26 +404,26 @@ async def update_member_role(request: web.Request) -> web.Response:
             old_role_id=old_role_id,
             new_role_id=new_role_id,
         )
-        return web.json_response(
+        return json_response(
             {
-                "user_id": str(assignment.user_id),
-                "project_id": str(assignment.project_id),
-                "role_id": str(assignment.role_id),
-                "granted_by": str(assignment.granted_by),
-                "granted_at": assignment.granted_at.isoformat(),
-                "expires_at": assignment.expires_at.isoformat() if assignment.expires_at else None,
+                "user_id": assignment.user_id,
+                "project_id": assignment.project_id,
+                "role_id": assignment.role_id,
+                "granted_by": assignment.granted_by,
+                "granted_at": assignment.granted_at,
+                "expires_at": assignment.expires_at,
             },
             status=200,
         )
     except NotFoundError as e:
-        return web.json_response({"error": str(e)}, status=404)
+        return json_response({"error": str(e)}, status=404)
     except ForbiddenError as e:
-        return web.json_response({"error": str(e)}, status=403)
+        return json_response({"error": str(e)}, status=403)
     except AuthError as e:
         return handle_auth_error(request, e)
     except Exception:
         logger.exception("Update member role error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 def setup_routes(app: web.Application) -> None:
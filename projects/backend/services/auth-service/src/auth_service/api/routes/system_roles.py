@@ -6,7 +6,7 @@ from uuid import UUID
 import structlog
 from aiohttp import web
 
-from auth_service.api.utils import get_requester_id
+from auth_service.api.utils import get_requester_id, json_response
 from auth_service.core.exceptions import InvalidCredentialsError
 from auth_service.domain.dto import (
     CreateRoleRequest,
@@ -48,12 +48,12 @@ async def list_system_roles(request: web.Request) -> web.Response:
             role_resp = RoleResponse.from_model(role, permissions=perms)
             result.append(role_resp.model_dump())
 
-        return web.json_response(result)
+        return json_response(result)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to list system roles", exc_info=e)
-        return web.json_response({"error": str(e)}, status=500)
+        return json_response({"error": str(e)}, status=500)
 
 
 async def get_system_role(request: web.Request) -> web.Response:
@@ -66,16 +66,16 @@ async def get_system_role(request: web.Request) -> web.Response:
         role = await role_repo.get_by_id_or_raise(role_id)
         
         if role.scope_type != ScopeType.SYSTEM:
-            return web.json_response({"error": "Not a system role"}, status=404)
+            return json_response({"error": "Not a system role"}, status=404)
         
         perms = await role_repo.get_permissions(role.id)
         role_resp = RoleResponse.from_model(role, permissions=perms)
-        return web.json_response(role_resp.model_dump())
+        return json_response(role_resp.model_dump())
     except Exception as e:
         logger.error("Failed to get system role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def create_system_role(request: web.Request) -> web.Response:
@@ -101,14 +101,14 @@ async def create_system_role(request: web.Request) -> web.Response:
         # Fetch permissions for response
         perm_ids = await perm_svc.get_role_permissions(role.id)
         role_resp = RoleResponse.from_model(role, permissions=perm_ids)
-        return web.json_response(role_resp.model_dump(), status=201)
+        return json_response(role_resp.model_dump(), status=201)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to create system role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def update_system_role(request: web.Request) -> web.Response:
@@ -135,14 +135,14 @@ async def update_system_role(request: web.Request) -> web.Response:
         # Fetch permissions for response
         perm_ids = await perm_svc.get_role_permissions(role.id)
         role_resp = RoleResponse.from_model(role, permissions=perm_ids)
-        return web.json_response(role_resp.model_dump())
+        return json_response(role_resp.model_dump())
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to update system role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def delete_system_role(request: web.Request) -> web.Response:
@@ -158,12 +158,12 @@ async def delete_system_role(request: web.Request) -> web.Response:
         await perm_svc.delete_custom_role(requester_id, role_id)
         return web.Response(status=204)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to delete system role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 # =============================================================================
@@ -198,20 +198,20 @@ async def grant_system_role_to_user(request: web.Request) -> web.Response:
             expires_at=expires_at if expires_at else None,
         )
         
-        return web.json_response({
-            "user_id": str(role_assignment.user_id),
-            "role_id": str(role_assignment.role_id),
-            "granted_by": str(role_assignment.granted_by),
-            "granted_at": role_assignment.granted_at.isoformat(),
-            "expires_at": role_assignment.expires_at.isoformat() if role_assignment.expires_at else None,
+        return json_response({
+            "user_id": role_assignment.user_id,
+            "role_id": role_assignment.role_id,
+            "granted_by": role_assignment.granted_by,
+            "granted_at": role_assignment.granted_at,
+            "expires_at": role_assignment.expires_at,
         }, status=201)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to grant system role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def revoke_system_role_from_user(request: web.Request) -> web.Response:
@@ -233,16 +233,16 @@ async def revoke_system_role_from_user(request: web.Request) -> web.Response:
         )
         
         if success:
-            return web.json_response({"message": "Role revoked"}, status=200)
+            return json_response({"message": "Role revoked"}, status=200)
         else:
-            return web.json_response({"error": "Role assignment not found"}, status=404)
+            return json_response({"error": "Role assignment not found"}, status=404)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to revoke system role", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 async def list_user_system_roles(request: web.Request) -> web.Response:
@@ -269,21 +269,21 @@ async def list_user_system_roles(request: web.Request) -> web.Response:
             if role is None:
                 continue  # skip orphaned assignments (role was deleted)
             result.append({
-                "role_id": str(role.id),
+                "role_id": role.id,
                 "role_name": role.name,
-                "granted_by": str(assignment.granted_by),
-                "granted_at": assignment.granted_at.isoformat(),
-                "expires_at": assignment.expires_at.isoformat() if assignment.expires_at else None,
+                "granted_by": assignment.granted_by,
+                "granted_at": assignment.granted_at,
+                "expires_at": assignment.expires_at,
             })
 
-        return web.json_response(result)
+        return json_response(result)
     except InvalidCredentialsError as e:
-        return web.json_response({"error": str(e)}, status=401)
+        return json_response({"error": str(e)}, status=401)
     except Exception as e:
         logger.error("Failed to list user system roles", exc_info=e)
         if hasattr(e, "status_code"):
-            return web.json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
-        return web.json_response({"error": str(e)}, status=500)
+            return json_response({"error": str(e)}, status=getattr(e, "status_code", 500))
+        return json_response({"error": str(e)}, status=500)
 
 
 def setup_routes(app: web.Application) -> None:
@@ -9,7 +9,7 @@ from aiohttp import web
 from auth_service.core.exceptions import AuthError, handle_auth_error
 from auth_service.domain.dto import UserSearchResult
 from auth_service.repositories.users import UserRepository
-from auth_service.api.utils import get_requester_id
+from auth_service.api.utils import get_requester_id, json_response
 from auth_service.services.dependencies import get_permission_service
 from backend_common.db.pool import get_pool_service as get_pool
 
@@ -34,7 +34,7 @@ async def search_users(request: web.Request) -> web.Response:
 
     q = request.rel_url.query.get("q", "").strip()
     if len(q) < _MIN_QUERY_LENGTH:
-        return web.json_response(
+        return json_response(
             {"error": f"Query must be at least {_MIN_QUERY_LENGTH} characters"},
             status=400,
         )
@@ -51,7 +51,7 @@ async def search_users(request: web.Request) -> web.Response:
         try:
             exclude_project_id = UUID(raw_project_id)
         except ValueError:
-            return web.json_response({"error": "Invalid exclude_project_id"}, status=400)
+            return json_response({"error": "Invalid exclude_project_id"}, status=400)
 
     try:
         pool = await get_pool()
@@ -61,13 +61,13 @@ async def search_users(request: web.Request) -> web.Response:
             limit=limit,
             exclude_project_id=exclude_project_id,
         )
-        return web.json_response(
+        return json_response(
             [UserSearchResult(id=r["id"], username=r["username"], email=r["email"], is_active=r["is_active"]).model_dump() for r in results],
             status=200,
         )
     except Exception:
         logger.exception("User search error")
-        return web.json_response({"error": "Internal server error"}, status=500)
+        return json_response({"error": "Internal server error"}, status=500)
 
 
 def setup_routes(app: web.Application) -> None:
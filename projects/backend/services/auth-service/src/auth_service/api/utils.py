@@ -1,9 +1,54 @@
 """Shared API utilities."""
 from __future__ import annotations
 
+import re
+from typing import Any
 from uuid import UUID
 
+import orjson
 from aiohttp import web
+from pydantic import ValidationError
+
+
+def _orjson_default(value: Any) -> Any:
+    # asyncpg decodes uuid columns to its own uuid.UUID subclass, which orjson
+    # does not recognise (it only handles the exact type natively).
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_response(data: Any, *, status: int = 200) -> web.Response:
+    """Serialize ``data`` with orjson instead of the stdlib encoder."""
+    return web.Response(
+        body=orjson.dumps(data, default=_orjson_default),
+        status=status,
+        content_type="application/json",
+    )
+
+
+_INVALID_REQUEST_BODY = orjson.dumps({"error": "Invalid request"})
+
+# Whole-body failures (bad JSON, non-object) carry nothing worth echoing back.
+_MALFORMED_BODY_ERRORS = frozenset({"json_invalid", "json_type", "model_type", "model_attributes_type"})
+
+
+def invalid_request_response(exc: Exception) -> web.Response:
+    """400 response for a request body that failed to parse or validate.
+
+    Field-level validation messages are kept (clients show them), but never
+    the submitted values — ``str(ValidationError)`` would echo passwords back.
+    Anything else gets a constant, pre-encoded body.
+    """
+    if isinstance(exc, ValidationError):
+        messages = [
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+            for err in exc.errors(include_url=False, include_context=False, include_input=False)
+            if err["type"] not in _MALFORMED_BODY_ERRORS
+        ]
+        if messages:
+            return json_response({"error": "Invalid request: " + "; ".join(messages)}, status=400)
+    return web.Response(body=_INVALID_REQUEST_BODY, status=400, content_type="application/json")
 
 
 def extract_client_ip(request: web.Request) -> str | None:
@@ -24,13 +69,17 @@ from auth_service.services.jwt import get_user_id_from_token
 from auth_service.services.permission import PermissionService
 from backend_common.db.pool import get_pool_service as get_pool
 
+# "Bearer <token>" in one C-level match; group 1 is the token without
+# surrounding whitespace (empty when the header carries no token).
+_BEARER_RE = re.compile(r"Bearer \s*(.*?)\s*\Z", re.DOTALL)
+
 
 def extract_bearer_token(request: web.Request) -> str | None:
     """Extract Bearer token from Authorization header."""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
+    match = _BEARER_RE.match(request.headers.get("Authorization") or "")
+    if match is None:
         return None
-    return auth_header[7:].strip() or None
+    return match.group(1) or None
 
 
 async def get_requester_id(request: web.Request, perm_svc: PermissionService) -> UUID:
@@ -1,6 +1,7 @@
 """Custom exceptions."""
 from __future__ import annotations
 
+import orjson
 from aiohttp import web
 
 from backend_common.core.exceptions import ServiceError
@@ -15,10 +16,19 @@ class AuthError(ServiceError):
 
     status_code: int = 500
     message: str = "Authentication error"
+    # JSON body for the class-default message, see handle_auth_error.
+    _default_body: bytes = orjson.dumps({"error": message})
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._default_body = orjson.dumps({"error": cls.message})
 
     def __init__(self, message: str | None = None) -> None:
-        super().__init__(message or self.message)
-        self.message = message or self.message
+        # Only a custom message is stored on the instance; the default is
+        # read from the class, so raising with it costs no extra assignment.
+        if message:
+            self.message = message
+        super().__init__(self.message)
 
 
 class InvalidCredentialsError(AuthError):
@@ -72,8 +82,10 @@ class ConflictError(AuthError):
 
 def handle_auth_error(request: web.Request, error: AuthError) -> web.Response:
     """Handle authentication errors."""
-    return web.json_response(
-        {"error": error.message},
-        status=error.status_code,
-    )
+    error_type = type(error)
+    if error.message == error_type.message:
+        body = error_type._default_body
+    else:
+        body = orjson.dumps({"error": error.message})
+    return web.Response(body=body, status=error.status_code, content_type="application/json")
 
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 if TYPE_CHECKING:
     from auth_service.domain.models import (
@@ -36,6 +36,10 @@ def _check_password_complexity(value: str) -> str:
     return value
 
 
+# Request bodies are parsed once and never mutated.
+_REQUEST_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 # =============================================================================
 # Auth DTOs
 # =============================================================================
@@ -43,6 +47,8 @@ def _check_password_complexity(value: str) -> str:
 class BootstrapAdminRequest(BaseModel):
     """Bootstrap first admin user request."""
 
+    model_config = _REQUEST_CONFIG
+
     bootstrap_secret: str
     username: str = Field(..., min_length=3, max_length=50)
     email: EmailStr
@@ -57,6 +63,8 @@ class BootstrapAdminRequest(BaseModel):
 class UserRegisterRequest(BaseModel):
     """User registration request."""
 
+    model_config = _REQUEST_CONFIG
+
     username: str = Field(..., min_length=3, max_length=50)
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=100)
@@ -71,6 +79,8 @@ class UserRegisterRequest(BaseModel):
 class UserLoginRequest(BaseModel):
     """User login request."""
 
+    model_config = _REQUEST_CONFIG
+
     username: str
     password: str
 
@@ -78,12 +88,16 @@ class UserLoginRequest(BaseModel):
 class TokenRefreshRequest(BaseModel):
     """Token refresh request."""
 
+    model_config = _REQUEST_CONFIG
+
     refresh_token: str
 
 
 class LogoutRequest(BaseModel):
     """Logout request."""
 
+    model_config = _REQUEST_CONFIG
+
     refresh_token: str
 
 
@@ -110,28 +124,44 @@ class UserResponse(BaseModel):
     @classmethod
     def from_user(cls, user: "User", system_roles: list[str] | None = None) -> "UserResponse":
         """Create UserResponse from a User domain model."""
+        payload = cls.payload_from_user(user, system_roles)
+        payload["created_at"] = user.created_at.isoformat()
+        return cls(**payload)
+
+    @staticmethod
+    def payload_from_user(user: "User", system_roles: list[str] | None = None) -> dict[str, Any]:
+        """Build the UserResponse JSON shape as a plain dict (no model validation).
+
+        Used on the request path, where the model would only be dumped again.
+        ``created_at`` stays a datetime: the route encodes it with orjson,
+        which writes the same ISO 8601 text as ``isoformat()`` natively.
+        """
         roles = system_roles or []
-        return cls(
-            id=str(user.id),
-            username=user.username,
-            email=user.email,
-            password_change_required=user.password_change_required,
-            is_active=user.is_active,
-            is_admin="admin" in roles or "superadmin" in roles,
-            system_roles=roles,
-            created_at=user.created_at.isoformat(),
-        )
+        return {
+            "id": user.id_str,
+            "username": user.username,
+            "email": user.email,
+            "password_change_required": user.password_change_required,
+            "is_active": user.is_active,
+            "is_admin": "admin" in roles or "superadmin" in roles,
+            "system_roles": roles,
+            "created_at": user.created_at,
+        }
 
 
 class PasswordResetRequestDto(BaseModel):
     """Password reset request (by email)."""
 
+    model_config = _REQUEST_CONFIG
+
     email: EmailStr
 
 
 class PasswordResetConfirmRequest(BaseModel):
     """Password reset confirmation."""
 
+    model_config = _REQUEST_CONFIG
+
     reset_token: str
     new_password: str = Field(..., min_length=8, max_length=100)
 
@@ -144,12 +174,16 @@ class PasswordResetConfirmRequest(BaseModel):
 class AdminUserResetRequest(BaseModel):
     """Admin reset of another user's password."""
 
+    model_config = _REQUEST_CONFIG
+
     new_password: str | None = None
 
 
 class AdminUserUpdateRequest(BaseModel):
     """Admin update of user fields."""
 
+    model_config = _REQUEST_CONFIG
+
     is_active: bool | None = None
     is_admin: bool | None = None
 
@@ -157,6 +191,8 @@ class AdminUserUpdateRequest(BaseModel):
 class PasswordChangeRequest(BaseModel):
     """Password change request."""
 
+    model_config = _REQUEST_CONFIG
+
     old_password: str
     new_password: str = Field(..., min_length=8, max_length=100)
 
@@ -173,6 +209,8 @@ class PasswordChangeRequest(BaseModel):
 class InviteCreateRequest(BaseModel):
     """Invite creation request."""
 
+    model_config = _REQUEST_CONFIG
+
     email_hint: str | None = None
     expires_in_hours: int = Field(default=72, ge=1, le=8760)
 
@@ -213,6 +251,8 @@ class InviteResponse(BaseModel):
 class ProjectCreateRequest(BaseModel):
     """Project creation request."""
 
+    model_config = _REQUEST_CONFIG
+
     name: str = Field(..., min_length=1, max_length=200)
     description: str | None = Field(None, max_length=1000)
 
@@ -220,6 +260,8 @@ class ProjectCreateRequest(BaseModel):
 class ProjectUpdateRequest(BaseModel):
     """Project update request."""
 
+    model_config = _REQUEST_CONFIG
+
     name: str | None = Field(None, min_length=1, max_length=200)
     description: str | None = Field(None, max_length=1000)
 
@@ -280,6 +322,8 @@ class ProjectMemberAddRequest(BaseModel):
     Accepts either ``role_id`` (UUID) or ``role`` (name: owner/editor/viewer).
     """
 
+    model_config = _REQUEST_CONFIG
+
     user_id: str
     role_id: str | None = None
     role: str | None = None
@@ -302,6 +346,8 @@ class ProjectMemberUpdateRequest(BaseModel):
     Accepts either ``role_id`` (UUID) or ``role`` (name: owner/editor/viewer).
     """
 
+    model_config = _REQUEST_CONFIG
+
     role_id: str | None = None
     role: str | None = None
 
@@ -319,6 +365,8 @@ class ProjectMemberUpdateRequest(BaseModel):
 class GrantProjectRoleRequest(BaseModel):
     """Request to grant a project role to a user."""
 
+    model_config = _REQUEST_CONFIG
+
     role_id: UUID
     expires_at: datetime | None = None
 
@@ -361,6 +409,8 @@ class EffectivePermissionsResponse(BaseModel):
 class CreateRoleRequest(BaseModel):
     """Create a custom role."""
 
+    model_config = _REQUEST_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100)
     description: str | None = Field(None, max_length=500)
     permissions: list[str] = Field(..., min_length=1)
@@ -369,6 +419,8 @@ class CreateRoleRequest(BaseModel):
 class UpdateRoleRequest(BaseModel):
     """Update a custom role."""
 
+    model_config = _REQUEST_CONFIG
+
     name: str | None = Field(None, min_length=1, max_length=100)
     description: str | None = Field(None, max_length=500)
     permissions: list[str] | None = None
@@ -405,6 +457,8 @@ class RoleResponse(BaseModel):
 class GrantRoleRequest(BaseModel):
     """Assign a role to a user."""
 
+    model_config = _REQUEST_CONFIG
+
     role_id: UUID
     expires_at: datetime | None = None
 
@@ -412,6 +466,8 @@ class GrantRoleRequest(BaseModel):
 class RevokeRoleRequest(BaseModel):
     """Revoke a role from a user (used for DELETE body if needed)."""
 
+    model_config = _REQUEST_CONFIG
+
     role_id: UUID
 
 
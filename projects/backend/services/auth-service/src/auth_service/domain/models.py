@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import StrEnum
+from functools import cached_property
 from typing import Any
 from uuid import UUID
 
@@ -68,8 +70,13 @@ class AuditAction(StrEnum):
 # =============================================================================
 # Core models
 # =============================================================================
+# Models are built for every fetched row, so they use slots (no per-instance
+# __dict__, faster attribute access).  User is the exception: it caches
+# id_str in its __dict__.  User is frozen instead, since one instance is
+# shared between requests through the token user cache; the others stay
+# mutable because frozen dataclasses are noticeably slower to construct.
 
-@dataclass
+@dataclass(frozen=True)
 class User:
     """User domain model."""
 
@@ -83,7 +90,7 @@ class User:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> User:
+    def from_row(cls, row: Mapping[str, Any]) -> User:
         """Create User from database row."""
         return cls(
             id=row["id"],
@@ -96,10 +103,15 @@ class User:
             updated_at=row["updated_at"],
         )
 
+    @cached_property
+    def id_str(self) -> str:
+        """``str(id)``, formatted once per instance for response payloads."""
+        return str(self.id)
+
     def to_dict(self, exclude_password: bool = True) -> dict[str, Any]:
         """Convert to dictionary."""
         data = {
-            "id": str(self.id),
+            "id": self.id_str,
             "username": self.username,
             "email": self.email,
             "password_change_required": self.password_change_required,
@@ -112,7 +124,7 @@ class User:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class InviteToken:
     """Invite token domain model."""
 
@@ -126,7 +138,7 @@ class InviteToken:
     created_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> "InviteToken":
+    def from_row(cls, row: Mapping[str, Any]) -> "InviteToken":
         """Create InviteToken from database row."""
         return cls(
             id=row["id"],
@@ -145,7 +157,7 @@ class InviteToken:
         return self.used_at is None and self.expires_at > datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project domain model."""
 
@@ -157,7 +169,7 @@ class Project:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> Project:
+    def from_row(cls, row: Mapping[str, Any]) -> Project:
         """Create Project from database row."""
         return cls(
             id=row["id"],
@@ -184,7 +196,7 @@ class Project:
 # RBAC v2 models
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Permission domain model (справочник)."""
 
@@ -195,7 +207,7 @@ class Permission:
     created_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> Permission:
+    def from_row(cls, row: Mapping[str, Any]) -> Permission:
         return cls(
             id=row["id"],
             scope_type=ScopeType(row["scope_type"]),
@@ -205,7 +217,7 @@ class Permission:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """Role domain model (встроенная или кастомная)."""
 
@@ -220,7 +232,7 @@ class Role:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> Role:
+    def from_row(cls, row: Mapping[str, Any]) -> Role:
         return cls(
             id=row["id"],
             name=row["name"],
@@ -238,7 +250,7 @@ class Role:
         return self.id == SUPERADMIN_ROLE_ID
 
 
-@dataclass
+@dataclass(slots=True)
 class RolePermission:
     """Link between a role and a permission."""
 
@@ -246,14 +258,14 @@ class RolePermission:
     permission_id: str
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> RolePermission:
+    def from_row(cls, row: Mapping[str, Any]) -> RolePermission:
         return cls(
             role_id=row["role_id"],
             permission_id=row["permission_id"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSystemRole:
     """Assignment of a system role to a user."""
 
@@ -264,7 +276,7 @@ class UserSystemRole:
     expires_at: datetime | None
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> UserSystemRole:
+    def from_row(cls, row: Mapping[str, Any]) -> UserSystemRole:
         return cls(
             user_id=row["user_id"],
             role_id=row["role_id"],
@@ -280,7 +292,7 @@ class UserSystemRole:
         return self.expires_at <= datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProjectRole:
     """Assignment of a project role to a user (replaces ProjectMember)."""
 
@@ -292,7 +304,7 @@ class UserProjectRole:
     expires_at: datetime | None
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> UserProjectRole:
+    def from_row(cls, row: Mapping[str, Any]) -> UserProjectRole:
         return cls(
             user_id=row["user_id"],
             project_id=row["project_id"],
@@ -309,7 +321,7 @@ class UserProjectRole:
         return self.expires_at <= datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEntry:
     """Audit log entry."""
 
@@ -326,7 +338,7 @@ class AuditEntry:
     user_agent: str | None
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> AuditEntry:
+    def from_row(cls, row: Mapping[str, Any]) -> AuditEntry:
         return cls(
             id=row["id"],
             timestamp=row["timestamp"],
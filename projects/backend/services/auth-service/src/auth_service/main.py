@@ -11,7 +11,9 @@ from backend_common.middleware.error_handler import error_handling_middleware
 from backend_common.logging_config import configure_logging
 
 from auth_service.api.middleware import password_change_required_middleware
+from auth_service.services.dependencies import init_services
 from auth_service.services.email import EmailService
+from auth_service.services.password import shutdown_hash_pool
 from auth_service.api.routes.audit import setup_routes as setup_audit_routes
 from auth_service.api.routes.auth import setup_routes as setup_auth_routes
 from auth_service.api.routes.permissions import setup_routes as setup_permissions_routes
@@ -52,9 +54,11 @@ def create_app() -> web.Application:
     setup_users_routes(app)
 
     app.on_startup.append(init_pool)
+    app.on_startup.append(init_services)
     app.on_startup.append(start_background_worker)
     app.on_cleanup.append(stop_background_worker)
     app.on_cleanup.append(close_pool)
+    app.on_cleanup.append(shutdown_hash_pool)
 
     # Add CORS to all routes
     add_cors_to_routes(app, cors)
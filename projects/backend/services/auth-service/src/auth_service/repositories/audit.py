@@ -38,7 +38,7 @@ class AuditRepository(BaseRepository):
             json.dumps(details or {}), ip_address, user_agent,
         )
         assert row is not None
-        return AuditEntry.from_row(dict(row))
+        return AuditEntry.from_row(row)
 
     async def query(
         self,
@@ -116,4 +116,4 @@ class AuditRepository(BaseRepository):
         )
 
         rows = await self._fetch(query, *params)
-        return [AuditEntry.from_row(dict(r)) for r in rows]
+        return [AuditEntry.from_row(r) for r in rows]
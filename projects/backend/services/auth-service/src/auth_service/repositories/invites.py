@@ -29,7 +29,7 @@ class InviteRepository(BaseRepository):
             expires_at,
         )
         assert row is not None
-        return InviteToken.from_row(dict(row))
+        return InviteToken.from_row(row)
 
     async def get_by_token(self, token: UUID) -> InviteToken | None:
         """Get an invite token by its UUID token value."""
@@ -41,7 +41,7 @@ class InviteRepository(BaseRepository):
             """,
             token,
         )
-        return InviteToken.from_row(dict(row)) if row else None
+        return InviteToken.from_row(row) if row else None
 
     async def list_all(self, active_only: bool = False) -> list[InviteToken]:
         """List all invite tokens, optionally filtering to active ones only."""
@@ -62,7 +62,7 @@ class InviteRepository(BaseRepository):
                 ORDER BY created_at DESC
                 """
             )
-        return [InviteToken.from_row(dict(row)) for row in rows]
+        return [InviteToken.from_row(row) for row in rows]
 
     async def mark_used(self, token: UUID, user_id: UUID) -> InviteToken:
         """Mark an invite token as used by the given user."""
@@ -77,7 +77,7 @@ class InviteRepository(BaseRepository):
             user_id,
         )
         assert row is not None
-        return InviteToken.from_row(dict(row))
+        return InviteToken.from_row(row)
 
     async def delete(self, token: UUID) -> bool:
         """Delete an invite token. Returns True if a row was deleted."""
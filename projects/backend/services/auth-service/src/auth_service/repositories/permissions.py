@@ -14,7 +14,7 @@ class PermissionRepository(BaseRepository):
             "SELECT id, scope_type, category, description, created_at "
             "FROM permissions ORDER BY category, id"
         )
-        return [Permission.from_row(dict(r)) for r in rows]
+        return [Permission.from_row(r) for r in rows]
 
     async def get_by_ids(self, ids: list[str]) -> list[Permission]:
         """Get permissions by their IDs."""
@@ -25,7 +25,7 @@ class PermissionRepository(BaseRepository):
             "FROM permissions WHERE id = ANY($1::text[]) ORDER BY id",
             ids,
         )
-        return [Permission.from_row(dict(r)) for r in rows]
+        return [Permission.from_row(r) for r in rows]
 
     async def list_by_scope(self, scope_type: str) -> list[Permission]:
         """List permissions filtered by scope_type ('system' or 'project')."""
@@ -34,4 +34,4 @@ class PermissionRepository(BaseRepository):
             "FROM permissions WHERE scope_type = $1 ORDER BY category, id",
             scope_type,
         )
-        return [Permission.from_row(dict(r)) for r in rows]
+        return [Permission.from_row(r) for r in rows]
@@ -4,9 +4,37 @@ from __future__ import annotations
 from uuid import UUID
 
 from auth_service.core.exceptions import NotFoundError
-from auth_service.domain.models import Project, UserProjectRole
+from auth_service.domain.models import SUPERADMIN_ROLE_ID, Project, UserProjectRole
 from auth_service.repositories.base import BaseRepository
 
+# One row per call even when the project does not exist (p.* is then NULL),
+# so the permission verdict is always available. "allowed" mirrors
+# PermissionService.ensure_permission: superadmin, or the permission granted
+# by an active system role or an active role in this project.
+_GET_WITH_ACCESS_SQL = """
+    SELECT p.id, p.name, p.description, p.owner_id, p.created_at, p.updated_at,
+           (
+               EXISTS(
+                   SELECT 1 FROM user_system_roles usr
+                   WHERE usr.user_id = $2
+                     AND (usr.role_id = $4 OR EXISTS(
+                         SELECT 1 FROM role_permissions rp
+                         WHERE rp.role_id = usr.role_id AND rp.permission_id = $3
+                     ))
+                     AND (usr.expires_at IS NULL OR usr.expires_at > now())
+               )
+               OR EXISTS(
+                   SELECT 1 FROM user_project_roles upr
+                   JOIN role_permissions rp ON rp.role_id = upr.role_id
+                   WHERE upr.user_id = $2 AND upr.project_id = $1
+                     AND rp.permission_id = $3
+                     AND (upr.expires_at IS NULL OR upr.expires_at > now())
+               )
+           ) AS allowed
+    FROM (SELECT $1::uuid AS id) AS q
+    LEFT JOIN projects p ON p.id = q.id
+"""
+
 
 class ProjectRepository(BaseRepository):
     """Repository for project operations."""
@@ -32,7 +60,7 @@ class ProjectRepository(BaseRepository):
             "AND (expires_at IS NULL OR expires_at > now())",
             project_id, user_id,
         )
-        return [UserProjectRole.from_row(dict(r)) for r in rows]
+        return [UserProjectRole.from_row(r) for r in rows]
 
     async def get_member_role_names(self, project_id: UUID, user_id: UUID) -> list[str]:
         """Get role names for a user in a project."""
@@ -60,7 +88,7 @@ class ProjectRepository(BaseRepository):
         row = await self._fetchrow(query, name, description, owner_id)
         if not row:
             raise RuntimeError("Failed to create project")
-        return Project.from_row(dict(row))
+        return Project.from_row(row)
 
     async def get_by_id(self, project_id: UUID) -> Project | None:
         """Get project by ID."""
@@ -72,7 +100,23 @@ class ProjectRepository(BaseRepository):
         row = await self._fetchrow(query, project_id)
         if not row:
             return None
-        return Project.from_row(dict(row))
+        return Project.from_row(row)
+
+    async def get_with_access(
+        self, project_id: UUID, user_id: UUID, permission_id: str,
+    ) -> tuple[Project | None, bool]:
+        """Get project by ID together with the user's permission on it.
+
+        Returns (project or None, whether user_id holds permission_id in the
+        project) in a single round-trip.
+        """
+        row = await self._fetchrow(
+            _GET_WITH_ACCESS_SQL, project_id, user_id, permission_id, SUPERADMIN_ROLE_ID,
+        )
+        if not row:
+            return None, False
+        project = Project.from_row(row) if row["id"] is not None else None
+        return project, bool(row["allowed"])
 
     async def get_by_id_or_raise(self, project_id: UUID) -> Project:
         """Get project by ID or raise NotFoundError."""
@@ -114,7 +158,7 @@ class ProjectRepository(BaseRepository):
             LIMIT $4 OFFSET $5
         """
         rows = await self._fetch(select_query, user_id, search, role, limit, offset)
-        return [Project.from_row(dict(row)) for row in rows], total
+        return [Project.from_row(row) for row in rows], total
 
     async def list_all(self) -> list[Project]:
         """List all projects (for superadmin/admin views)."""
@@ -124,7 +168,7 @@ class ProjectRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = await self._fetch(query)
-        return [Project.from_row(dict(row)) for row in rows]
+        return [Project.from_row(row) for row in rows]
 
     async def list_by_owner(self, owner_id: UUID) -> list[Project]:
         """List all projects owned by user."""
@@ -135,7 +179,7 @@ class ProjectRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = await self._fetch(query, owner_id)
-        return [Project.from_row(dict(row)) for row in rows]
+        return [Project.from_row(row) for row in rows]
 
     async def update(
         self,
@@ -171,7 +215,7 @@ class ProjectRepository(BaseRepository):
         row = await self._fetchrow(query, *params)
         if not row:
             raise NotFoundError(f"Project {project_id} not found")
-        return Project.from_row(dict(row))
+        return Project.from_row(row)
 
     async def delete(self, project_id: UUID) -> None:
         """Delete project."""
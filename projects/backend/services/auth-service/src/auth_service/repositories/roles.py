@@ -34,14 +34,14 @@ class RoleRepository(BaseRepository):
             name, scope_type.value, project_id, description, created_by,
         )
         assert row is not None
-        return Role.from_row(dict(row))
+        return Role.from_row(row)
 
     async def get_by_id(self, role_id: UUID) -> Role | None:
         """Get role by ID."""
         row = await self._fetchrow(
             f"SELECT {_ROLE_COLS} FROM roles WHERE id = $1", role_id,
         )
-        return Role.from_row(dict(row)) if row else None
+        return Role.from_row(row) if row else None
 
     async def get_by_id_or_raise(self, role_id: UUID) -> Role:
         """Get role by ID or raise NotFoundError."""
@@ -56,7 +56,7 @@ class RoleRepository(BaseRepository):
             f"SELECT {_ROLE_COLS} FROM roles "
             f"WHERE scope_type = 'system' ORDER BY is_builtin DESC, name",
         )
-        return [Role.from_row(dict(r)) for r in rows]
+        return [Role.from_row(r) for r in rows]
 
     async def list_by_project(self, project_id: UUID) -> list[Role]:
         """List project-scope roles: built-in templates + custom for this project."""
@@ -66,7 +66,7 @@ class RoleRepository(BaseRepository):
             f"ORDER BY is_builtin DESC, name",
             project_id,
         )
-        return [Role.from_row(dict(r)) for r in rows]
+        return [Role.from_row(r) for r in rows]
 
     async def update(
         self,
@@ -101,7 +101,7 @@ class RoleRepository(BaseRepository):
         )
         if not row:
             raise NotFoundError(f"Role {role_id} not found")
-        return Role.from_row(dict(row))
+        return Role.from_row(row)
 
     async def delete(self, role_id: UUID) -> None:
         """Delete a role."""
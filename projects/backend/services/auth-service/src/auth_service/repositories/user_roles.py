@@ -34,7 +34,7 @@ class UserRoleRepository(BaseRepository):
             user_id, role_id, granted_by, expires_at,
         )
         assert row is not None
-        return UserSystemRole.from_row(dict(row))
+        return UserSystemRole.from_row(row)
 
     async def revoke_system_role(self, user_id: UUID, role_id: UUID) -> bool:
         """Revoke a system role. Returns True if a row was deleted."""
@@ -52,7 +52,7 @@ class UserRoleRepository(BaseRepository):
             "WHERE usr.user_id = $1",
             user_id,
         )
-        return [UserSystemRole.from_row(dict(r)) for r in rows]
+        return [UserSystemRole.from_row(r) for r in rows]
 
     async def list_system_role_names(self, user_id: UUID) -> list[str]:
         """List system role names for a user (for UserResponse.system_roles)."""
@@ -103,7 +103,7 @@ class UserRoleRepository(BaseRepository):
             user_id, project_id, role_id, granted_by, expires_at,
         )
         assert row is not None
-        return UserProjectRole.from_row(dict(row))
+        return UserProjectRole.from_row(row)
 
     async def revoke_project_role(
         self, user_id: UUID, project_id: UUID, role_id: UUID,
@@ -126,7 +126,7 @@ class UserRoleRepository(BaseRepository):
             "WHERE user_id = $1 AND project_id = $2",
             user_id, project_id,
         )
-        return [UserProjectRole.from_row(dict(r)) for r in rows]
+        return [UserProjectRole.from_row(r) for r in rows]
 
     # ── Effective permissions ───────────────────────────────────────────
 
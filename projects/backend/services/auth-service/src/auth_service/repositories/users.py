@@ -18,6 +18,70 @@ class UserSearchRow(TypedDict):
 
 _SELECT_COLS = "id, username, email, hashed_password, password_change_required, is_active, created_at, updated_at"
 
+# Statements are module constants: built once, and the identical text on
+# every call keeps asyncpg's per-connection prepared-statement cache hot.
+_CREATE_SQL = f"""
+    INSERT INTO users (username, email, hashed_password, password_change_required)
+    VALUES ($1, $2, $3, $4)
+    RETURNING {_SELECT_COLS}
+"""
+
+_CREATE_IF_ABSENT_SQL = f"""
+    INSERT INTO users (username, email, hashed_password, password_change_required)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT DO NOTHING
+    RETURNING {_SELECT_COLS}
+"""
+
+_GET_BY_ID_SQL = f"SELECT {_SELECT_COLS} FROM users WHERE id = $1"
+
+_GET_BY_USERNAME_SQL = f"SELECT {_SELECT_COLS} FROM users WHERE username = $1"
+
+_GET_BY_EMAIL_SQL = f"SELECT {_SELECT_COLS} FROM users WHERE email = $1"
+
+_UPDATE_PASSWORD_SQL = f"""
+    UPDATE users
+    SET hashed_password = $2,
+        password_change_required = $3,
+        updated_at = now()
+    WHERE id = $1
+    RETURNING {_SELECT_COLS}
+"""
+
+_USER_EXISTS_SQL = """
+    SELECT 1 FROM users
+    WHERE username = $1 OR email = $2
+    LIMIT 1
+"""
+
+_LIST_SEARCH_SQL = f"""
+    SELECT {_SELECT_COLS} FROM users
+    WHERE username ILIKE $1 OR email ILIKE $1
+    ORDER BY created_at DESC
+"""
+
+_LIST_ALL_SQL = f"SELECT {_SELECT_COLS} FROM users ORDER BY created_at DESC"
+
+_SET_ACTIVE_SQL = f"""
+    UPDATE users SET is_active = $2, updated_at = now()
+    WHERE id = $1
+    RETURNING {_SELECT_COLS}
+"""
+
+_DELETE_SQL = "DELETE FROM users WHERE id = $1"
+
+_SEARCH_BY_USERNAME_SQL = """
+    SELECT id, username, email, is_active
+    FROM users
+    WHERE username ILIKE $1 || '%'
+      AND is_active = true
+      AND ($2::uuid IS NULL OR id NOT IN (
+          SELECT user_id FROM user_project_roles WHERE project_id = $2
+      ))
+    ORDER BY username
+    LIMIT $3
+"""
+
 
 class UserRepository(BaseRepository):
     """Repository for user operations."""
@@ -30,39 +94,49 @@ class UserRepository(BaseRepository):
         password_change_required: bool = False,
     ) -> User:
         """Create a new user."""
-        query = f"""
-            INSERT INTO users (username, email, hashed_password, password_change_required)
-            VALUES ($1, $2, $3, $4)
-            RETURNING {_SELECT_COLS}
-        """
-        row = await self._fetchrow(query, username, email, hashed_password, password_change_required)
+        row = await self._fetchrow(_CREATE_SQL, username, email, hashed_password, password_change_required)
         if not row:
             raise RuntimeError("Failed to create user")
-        return User.from_row(dict(row))
+        return User.from_row(row)
+
+    async def create_if_absent(
+        self,
+        username: str,
+        email: str,
+        hashed_password: str,
+        password_change_required: bool = False,
+    ) -> User | None:
+        """Create a new user unless the username or email is taken.
+
+        Uniqueness is enforced by the table's unique indexes in the same
+        statement, so there is no separate existence check (and no race
+        between check and insert).  Returns None on conflict.
+        """
+        row = await self._fetchrow(_CREATE_IF_ABSENT_SQL, username, email, hashed_password, password_change_required)
+        if not row:
+            return None
+        return User.from_row(row)
 
     async def get_by_id(self, user_id: UUID) -> User | None:
         """Get user by ID."""
-        query = f"SELECT {_SELECT_COLS} FROM users WHERE id = $1"
-        row = await self._fetchrow(query, user_id)
+        row = await self._fetchrow(_GET_BY_ID_SQL, user_id)
         if not row:
             return None
-        return User.from_row(dict(row))
+        return User.from_row(row)
 
     async def get_by_username(self, username: str) -> User | None:
         """Get user by username."""
-        query = f"SELECT {_SELECT_COLS} FROM users WHERE username = $1"
-        row = await self._fetchrow(query, username)
+        row = await self._fetchrow(_GET_BY_USERNAME_SQL, username)
         if not row:
             return None
-        return User.from_row(dict(row))
+        return User.from_row(row)
 
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email."""
-        query = f"SELECT {_SELECT_COLS} FROM users WHERE email = $1"
-        row = await self._fetchrow(query, email)
+        row = await self._fetchrow(_GET_BY_EMAIL_SQL, email)
         if not row:
             return None
-        return User.from_row(dict(row))
+        return User.from_row(row)
 
     async def update_password(
         self,
@@ -71,60 +145,33 @@ class UserRepository(BaseRepository):
         password_change_required: bool = False,
     ) -> User:
         """Update user password."""
-        query = f"""
-            UPDATE users
-            SET hashed_password = $2,
-                password_change_required = $3,
-                updated_at = now()
-            WHERE id = $1
-            RETURNING {_SELECT_COLS}
-        """
-        row = await self._fetchrow(query, user_id, new_hashed_password, password_change_required)
+        row = await self._fetchrow(_UPDATE_PASSWORD_SQL, user_id, new_hashed_password, password_change_required)
         if not row:
             raise RuntimeError("Failed to update password")
-        return User.from_row(dict(row))
+        return User.from_row(row)
 
     async def user_exists(self, username: str, email: str) -> bool:
         """Check if user with username or email exists."""
-        query = """
-            SELECT EXISTS(
-                SELECT 1 FROM users
-                WHERE username = $1 OR email = $2
-            )
-        """
-        row = await self._fetchrow(query, username, email)
-        return bool(row["exists"]) if row else False
+        return await self._fetchval(_USER_EXISTS_SQL, username, email) is not None
 
     async def list_all(self, search: str | None = None) -> list[User]:
         """List all users, optionally filtered by username/email substring."""
         if search:
-            query = f"""
-                SELECT {_SELECT_COLS} FROM users
-                WHERE username ILIKE $1 OR email ILIKE $1
-                ORDER BY created_at DESC
-            """
-            rows = await self._fetch(query, f"%{search}%")
+            rows = await self._fetch(_LIST_SEARCH_SQL, f"%{search}%")
         else:
-            query = f"SELECT {_SELECT_COLS} FROM users ORDER BY created_at DESC"
-            rows = await self._fetch(query)
-        return [User.from_row(dict(r)) for r in rows]
+            rows = await self._fetch(_LIST_ALL_SQL)
+        return [User.from_row(r) for r in rows]
 
     async def set_active(self, user_id: UUID, is_active: bool) -> User:
         """Set user is_active flag."""
-        query = f"""
-            UPDATE users SET is_active = $2, updated_at = now()
-            WHERE id = $1
-            RETURNING {_SELECT_COLS}
-        """
-        row = await self._fetchrow(query, user_id, is_active)
+        row = await self._fetchrow(_SET_ACTIVE_SQL, user_id, is_active)
         if not row:
             raise RuntimeError("User not found")
-        return User.from_row(dict(row))
+        return User.from_row(row)
 
     async def delete(self, user_id: UUID) -> bool:
         """Delete user by ID. Returns True if a row was deleted."""
-        query = "DELETE FROM users WHERE id = $1"
-        result = await self._execute(query, user_id)
+        result = await self._execute(_DELETE_SQL, user_id)
         return result == "DELETE 1"
 
     async def search_by_username(
@@ -134,18 +181,7 @@ class UserRepository(BaseRepository):
         exclude_project_id: UUID | None = None,
     ) -> list[UserSearchRow]:
         """Search active users by username prefix, optionally excluding project members."""
-        sql = """
-            SELECT id, username, email, is_active
-            FROM users
-            WHERE username ILIKE $1 || '%'
-              AND is_active = true
-              AND ($2::uuid IS NULL OR id NOT IN (
-                  SELECT user_id FROM user_project_roles WHERE project_id = $2
-              ))
-            ORDER BY username
-            LIMIT $3
-        """
-        rows = await self._fetch(sql, query, exclude_project_id, limit)
+        rows = await self._fetch(_SEARCH_BY_USERNAME_SQL, query, exclude_project_id, limit)
         return [
             UserSearchRow(
                 id=str(row["id"]),
@@ -4,6 +4,7 @@ from __future__ import annotations
 import secrets
 import structlog
 from datetime import datetime, timedelta, timezone
+from typing import Any
 from uuid import UUID
 
 from auth_service.core.exceptions import (
@@ -29,8 +30,15 @@ from auth_service.services.jwt import (
     decode_token,
     get_user_id_from_token,
 )
-from auth_service.services.password import hash_password, verify_password
+from auth_service.services.password import (
+    hash_password,
+    needs_rehash,
+    run_in_hash_pool,
+    verify_password,
+)
 from auth_service.services.permission import PermissionService
+from auth_service.services.user_cache import UserCache
+from auth_service.settings import settings
 from auth_service.prometheus_metrics import (
     AUTH_LOGINS,
     AUTH_REUSE_DETECTIONS,
@@ -50,7 +58,7 @@ class AuthService:
         reset_repo: PasswordResetRepository,
         permission_service: PermissionService,
         invite_repo: InviteRepository | None = None,
-        registration_mode: str = "open",
+        registration_mode: str | None = None,
         audit_repo: AuditRepository | None = None,
         family_repo: TokenFamilyRepository | None = None,
     ):
@@ -59,9 +67,15 @@ class AuthService:
         self._reset_repo = reset_repo
         self._perm_svc = permission_service
         self._invite_repo = invite_repo
+        # None: follow settings.registration_mode at call time (the app-scoped
+        # instance outlives any change to the setting).
         self._registration_mode = registration_mode
         self._audit_repo = audit_repo
         self._family_repo = family_repo
+        self._user_cache = UserCache(
+            ttl_seconds=settings.user_cache_ttl_seconds,
+            max_entries=settings.user_cache_max_entries,
+        )
 
     async def _audit(
         self,
@@ -112,7 +126,7 @@ class AuthService:
         if await self._user_repo.user_exists(username, email):
             raise UserAlreadyExistsError("User with this username or email already exists")
 
-        hashed_pw = hash_password(password)
+        hashed_pw = await run_in_hash_pool(hash_password, password)
         user = await self._user_repo.create(username, email, hashed_pw, password_change_required=False)
 
         # Grant superadmin system role (self-grant for bootstrap, no grantor check)
@@ -139,7 +153,8 @@ class AuthService:
         """Register a new user."""
         validated_invite = None
 
-        if self._registration_mode == "invite":
+        registration_mode = self._registration_mode or settings.registration_mode
+        if registration_mode == "invite":
             if self._invite_repo is None:
                 raise ForbiddenError("Invite system is not configured")
             if invite_token is None:
@@ -151,11 +166,17 @@ class AuthService:
             if not validated_invite or not validated_invite.is_active:
                 raise InvalidTokenError("Invalid or expired invite token")
 
+        # Cheap early reject so a taken name does not cost an argon2 hash;
+        # create_if_absent still settles races between concurrent sign-ups.
         if await self._user_repo.user_exists(username, email):
             raise UserAlreadyExistsError("User with this username or email already exists")
 
-        hashed_pw = hash_password(password)
-        user = await self._user_repo.create(username, email, hashed_pw, password_change_required=False)
+        hashed_pw = await run_in_hash_pool(hash_password, password)
+        user = await self._user_repo.create_if_absent(
+            username, email, hashed_pw, password_change_required=False,
+        )
+        if user is None:
+            raise UserAlreadyExistsError("User with this username or email already exists")
 
         if validated_invite is not None and self._invite_repo is not None and invite_token is not None:
             await self._invite_repo.mark_used(invite_token, user.id)
@@ -222,13 +243,23 @@ class AuthService:
             AUTH_LOGINS.labels(result="failure").inc()
             raise InvalidCredentialsError()
 
-        if not verify_password(password, user.hashed_password):
+        if not await run_in_hash_pool(verify_password, password, user.hashed_password):
             AUTH_LOGINS.labels(result="failure").inc()
             raise InvalidCredentialsError()
 
         if not user.is_active:
             raise ForbiddenError("Account is deactivated")
 
+        if needs_rehash(user.hashed_password):
+            # Legacy bcrypt hash or outdated argon2 parameters; migrate it
+            # now that the plaintext is known to be correct.
+            user = await self._user_repo.update_password(
+                user.id,
+                await run_in_hash_pool(hash_password, password),
+                password_change_required=user.password_change_required,
+            )
+            self._user_cache.invalidate(user.id)
+
         tokens = await self._create_tokens(
             str(user.id),
             password_change_required=user.password_change_required,
@@ -257,13 +288,14 @@ class AuthService:
         if not user:
             raise UserNotFoundError()
 
-        if not verify_password(old_password, user.hashed_password):
+        if not await run_in_hash_pool(verify_password, old_password, user.hashed_password):
             raise InvalidCredentialsError("Invalid old password")
 
-        new_hashed = hash_password(new_password)
+        new_hashed = await run_in_hash_pool(hash_password, new_password)
         updated = await self._user_repo.update_password(
             user_id, new_hashed, password_change_required=False,
         )
+        self._user_cache.invalidate(user_id)
         # Invalidate all refresh token families on password change
         if self._family_repo is not None:
             await self._family_repo.revoke_all_user_families(user_id)
@@ -374,13 +406,19 @@ class AuthService:
         except ValueError as e:
             raise InvalidCredentialsError(str(e)) from e
 
-        user = await self._user_repo.get_by_id(UUID(user_id))
+        user_uuid = UUID(user_id)
+        user = self._user_cache.get(user_uuid)
+        if user is not None:
+            return user
+
+        user = await self._user_repo.get_by_id(user_uuid)
         if not user:
             raise UserNotFoundError()
 
         if not user.is_active:
             raise ForbiddenError("Account is deactivated")
 
+        self._user_cache.remember(user)
         return user
 
     async def request_password_reset(self, email: str) -> tuple[str, datetime]:
@@ -410,7 +448,9 @@ class AuthService:
             raise InvalidCredentialsError("Reset token expired")
 
         user_id: UUID = record["user_id"]
-        await self._user_repo.update_password(user_id, hash_password(new_password), password_change_required=False)
+        new_hashed = await run_in_hash_pool(hash_password, new_password)
+        await self._user_repo.update_password(user_id, new_hashed, password_change_required=False)
+        self._user_cache.invalidate(user_id)
         await self._reset_repo.delete_token(token)
         tokens = await self._create_tokens(str(user_id))
         await self._audit(
@@ -435,8 +475,9 @@ class AuthService:
 
         pwd = new_password if new_password else ("Tmp1" + secrets.token_hex(8))
         updated_user = await self._user_repo.update_password(
-            target_user_id, hash_password(pwd), password_change_required=True,
+            target_user_id, await run_in_hash_pool(hash_password, pwd), password_change_required=True,
         )
+        self._user_cache.invalidate(target_user_id)
         return updated_user, pwd
 
     async def list_users(
@@ -471,6 +512,7 @@ class AuthService:
                 if count <= 1:
                     raise ConflictError("Cannot remove the last superadmin")
             target = await self._user_repo.set_active(target_user_id, is_active)
+            self._user_cache.invalidate(target_user_id)
 
         if is_admin is not None:
             await self._perm_svc.set_admin_role(
@@ -502,6 +544,7 @@ class AuthService:
                 raise ConflictError("Cannot delete the last superadmin")
 
         deleted = await self._user_repo.delete(target_user_id)
+        self._user_cache.invalidate(target_user_id)
         if not deleted:
             raise NotFoundError("User not found")
         return True
@@ -523,6 +566,23 @@ class AuthService:
             for u in users
         ]
 
+    async def get_user_payload(self, user: User) -> dict[str, Any]:
+        """Same as get_user_response, but as a JSON-ready dict."""
+        role_names = await self._perm_svc.list_system_role_names(user.id)
+        return UserResponse.payload_from_user(user, system_roles=role_names)
+
+    async def get_user_payloads(self, users: list[User]) -> list[dict[str, Any]]:
+        """Same as get_user_responses, but as JSON-ready dicts."""
+        if not users:
+            return []
+        roles_by_user = await self._perm_svc.batch_list_system_role_names(
+            [u.id for u in users],
+        )
+        return [
+            UserResponse.payload_from_user(u, system_roles=roles_by_user.get(u.id, []))
+            for u in users
+        ]
+
     async def _create_tokens(
         self,
         user_id: str,
@@ -7,8 +7,20 @@ from typing import Any
 
 import jwt  # type: ignore[import-untyped]
 
+from backend_common.ttl_cache import TTLCache
+
 from auth_service.settings import settings
 
+# get_user_id_from_token runs on every authenticated request with the same
+# token reused for its whole lifetime. Tokens that passed full verification
+# are remembered briefly (raw token -> user id), never past their own ``exp``.
+# Only verified tokens are stored, so forged ones always take the slow path.
+_VERIFIED_TOKEN_TTL_SECONDS = 60.0
+_VERIFIED_TOKEN_MAX_ENTRIES = 50_000
+_verified_tokens: TTLCache[str, str] = TTLCache(
+    _VERIFIED_TOKEN_TTL_SECONDS, _VERIFIED_TOKEN_MAX_ENTRIES
+)
+
 
 def create_access_token(
     user_id: str,
@@ -85,13 +97,30 @@ def decode_token(token: str) -> dict[str, Any]:
         raise ValueError(f"Invalid token: {e}") from e
 
 
+def _remember_verified_token(token: str, user_id: str, exp: Any) -> None:
+    if not isinstance(exp, (int, float)):
+        return
+    _verified_tokens.set(token, user_id, ttl=float(exp) - time.time())
+
+
+def clear_verified_tokens() -> None:
+    """Forget all remembered token verifications."""
+    _verified_tokens.clear()
+
+
 def get_user_id_from_token(token: str) -> str:
     """Extract user ID from token."""
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        return cached
+
     payload = decode_token(token)
     user_id = payload.get("sub")
     if not user_id:
         raise ValueError("Token missing user ID")
-    return str(user_id)
+    user_id = str(user_id)
+    _remember_verified_token(token, user_id, payload.get("exp"))
+    return user_id
 
 
 def get_jti_from_token(token: str) -> str:
@@ -1,38 +1,123 @@
 """Password hashing utilities."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from auth_service.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# argon2 and bcrypt both release the GIL while hashing, so plain threads
+# scale across cores. A dedicated pool keeps a burst of logins from starving
+# the loop's default executor (DNS lookups, file I/O). Its size is capped by
+# ``password_hash_workers`` because every argon2 hash holds its full memory
+# cost. Created lazily so an app that was cleaned up (tests, restarts) gets a
+# fresh one.
+_hash_executor: ThreadPoolExecutor | None = None
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            thread_name_prefix="password-hash",
+        )
+    return _hash_executor
+
+
+async def run_in_hash_pool(func: Callable[..., _T], *args: object) -> _T:
+    """Run a blocking hashing call (``hash_password``/``verify_password``) off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), func, *args)
+
+
+async def shutdown_hash_pool(_app: object = None) -> None:
+    """Release the hashing threads (aiohttp ``on_cleanup`` hook)."""
+    global _hash_executor
+    executor, _hash_executor = _hash_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# New hashes use argon2id; bcrypt hashes from before the switch still verify
+# and are rehashed on the user's next successful login (see needs_rehash).
+_ARGON2_PREFIX = "$argon2"
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+@functools.lru_cache(maxsize=4)
+def _argon2_hasher(time_cost: int, memory_cost: int, parallelism: int) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def _hasher() -> PasswordHasher:
+    return _argon2_hasher(
+        settings.argon2_time_cost,
+        settings.argon2_memory_cost_kib,
+        settings.argon2_parallelism,
+    )
+
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+    """Hash a password using argon2id."""
+    return _hasher().hash(password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Return True if a valid hash should be replaced on the next login.
+
+    That is every bcrypt hash (migrated to argon2id), and argon2 hashes made
+    with parameters other than the ``argon2_*`` settings.  Malformed hashes
+    return False (they fail verification anyway).
+    """
+    if hashed_password.startswith(_ARGON2_PREFIX):
+        try:
+            return _hasher().check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return False
+    # Modular crypt format: $2b$<cost>$<22-char salt><31-char digest>
+    parts = hashed_password.split("$")
+    return (
+        hashed_password.startswith(_BCRYPT_PREFIXES)
+        and len(parts) == 4
+        and parts[2].isdigit()
+    )
+
+
+def _check(password_bytes: bytes, hashed_password: str, hashed_bytes: bytes) -> bool:
+    if hashed_password.startswith(_ARGON2_PREFIX):
+        try:
+            return _hasher().verify(hashed_password, password_bytes)
+        except VerificationError:
+            return False
+    return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash.
+    """Verify a password against an argon2 or (legacy) bcrypt hash.
 
-    Returns False for invalid hashes or encoding errors.  Only ``bcrypt``
-    specific exceptions (ValueError from malformed hash) are expected;
+    Returns False for invalid hashes or encoding errors.  Only malformed-hash
+    errors (ValueError, including argon2's InvalidHashError) are expected;
     anything else is logged as a warning so it does not go unnoticed.
     """
     try:
-        return bcrypt.checkpw(
-            password.encode("utf-8"),
-            hashed_password.encode("utf-8"),
-        )
+        password_bytes = password.encode("utf-8")
+        hashed_bytes = hashed_password.encode("utf-8")
+        return _check(password_bytes, hashed_password, hashed_bytes)
     except (ValueError, TypeError):
         # Malformed hash or encoding issue - expected failure modes.
         return False
     except Exception:
         logger.warning("Unexpected error during password verification", exc_info=True)
         return False
-
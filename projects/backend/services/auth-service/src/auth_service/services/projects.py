@@ -1,6 +1,8 @@
 """Project service."""
 from __future__ import annotations
 
+import asyncio
+
 import structlog
 from uuid import UUID
 
@@ -68,6 +70,23 @@ class ProjectService:
         except Exception as e:
             logger.warning("Audit log write failed", action=action, error=str(e))
 
+    async def _get_project_checked(
+        self, project_id: UUID, user_id: UUID, permission_id: str,
+    ) -> Project:
+        """Fetch project and check user's permission on it in one query.
+
+        Raises ForbiddenError before NotFoundError, like ensure_permission
+        followed by get_by_id did, so missing projects are not disclosed.
+        """
+        project, allowed = await self.project_repo.get_with_access(
+            project_id, user_id, permission_id,
+        )
+        if not allowed:
+            raise ForbiddenError(f"Missing permission: {permission_id}")
+        if not project:
+            raise NotFoundError(f"Project {project_id} not found")
+        return project
+
     async def create_project(
         self,
         name: str,
@@ -93,13 +112,7 @@ class ProjectService:
 
     async def get_project(self, project_id: UUID, user_id: UUID) -> Project:
         """Get project by ID (user must have 'project.members.view' permission)."""
-        await self.perm_svc.ensure_permission(user_id, "project.members.view", project_id)
-        
-        project = await self.project_repo.get_by_id(project_id)
-        if not project:
-            raise NotFoundError(f"Project {project_id} not found")
-
-        return project
+        return await self._get_project_checked(project_id, user_id, "project.members.view")
 
     async def list_user_projects(
         self,
@@ -135,11 +148,7 @@ class ProjectService:
         description: str | None = None,
     ) -> Project:
         """Update project. Requires 'project.settings.update' permission."""
-        await self.perm_svc.ensure_permission(user_id, "project.settings.update", project_id)
-        
-        project = await self.project_repo.get_by_id(project_id)
-        if not project:
-            raise NotFoundError(f"Project {project_id} not found")
+        await self._get_project_checked(project_id, user_id, "project.settings.update")
 
         return await self.project_repo.update(project_id, name, description)
 
@@ -151,11 +160,7 @@ class ProjectService:
         user_agent: str | None = None,
     ) -> None:
         """Delete project. Requires 'project.settings.delete' permission."""
-        await self.perm_svc.ensure_permission(user_id, "project.settings.delete", project_id)
-
-        project = await self.project_repo.get_by_id(project_id)
-        if not project:
-            raise NotFoundError(f"Project {project_id} not found")
+        project = await self._get_project_checked(project_id, user_id, "project.settings.delete")
 
         await self.project_repo.delete(project_id)
         await self._audit(
@@ -176,13 +181,22 @@ class ProjectService:
         user_agent: str | None = None,
     ) -> UserProjectRole:
         """Add member to project. Requires 'project.members.invite' permission."""
-        await self.perm_svc.ensure_permission(requester_id, "project.members.invite", project_id)
-
-        new_user = await self.user_repo.get_by_id(new_user_id)
+        # The three checks are independent lookups, so run them concurrently
+        # and report failures in the order the sequential code did.
+        permission, new_user, role_check = await asyncio.gather(
+            self.perm_svc.ensure_permission(requester_id, "project.members.invite", project_id),
+            self.user_repo.get_by_id(new_user_id),
+            self.perm_svc.validate_project_role(role_id),
+            return_exceptions=True,
+        )
+        if isinstance(permission, BaseException):
+            raise permission
+        if isinstance(new_user, BaseException):
+            raise new_user
         if not new_user:
             raise NotFoundError(f"User {new_user_id} not found")
-
-        await self.perm_svc.validate_project_role(role_id)
+        if isinstance(role_check, BaseException):
+            raise role_check
 
         assignment = await self.user_role_repo.grant_project_role(
             new_user_id, project_id, role_id, requester_id,
@@ -206,11 +220,7 @@ class ProjectService:
         user_agent: str | None = None,
     ) -> bool:
         """Remove member from project. Requires 'project.members.remove' permission."""
-        await self.perm_svc.ensure_permission(requester_id, "project.members.remove", project_id)
-
-        project = await self.project_repo.get_by_id(project_id)
-        if not project:
-            raise NotFoundError(f"Project {project_id} not found")
+        project = await self._get_project_checked(project_id, requester_id, "project.members.remove")
 
         if member_user_id == project.owner_id:
             raise ForbiddenError("Cannot remove project owner")
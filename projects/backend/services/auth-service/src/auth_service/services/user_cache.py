@@ -0,0 +1,37 @@
+"""In-memory TTL cache of users resolved from access tokens.
+
+``AuthService.get_user_by_token`` runs on every authenticated request, and
+clients reuse one access token for its whole lifetime, so the same user row
+was fetched over and over. Token verification is itself cached briefly in
+``services.jwt``; this caches the ``users`` lookup behind it, keyed by user id.
+
+Only active users are cached. The service drops a user's entry whenever it
+changes that user's password, active flag, or deletes it; other processes
+pick such changes up once the short TTL runs out.
+"""
+from __future__ import annotations
+
+from uuid import UUID
+
+from backend_common.ttl_cache import TTLCache
+
+from auth_service.domain.models import User
+
+
+class UserCache:
+    """TTL cache of ``User`` objects by id."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._cache: TTLCache[UUID, User] = TTLCache(ttl_seconds, max_entries)
+
+    def get(self, user_id: UUID) -> User | None:
+        return self._cache.get(user_id)
+
+    def remember(self, user: User) -> None:
+        self._cache.set(user.id, user)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._cache.pop(user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import warnings
-from functools import lru_cache
 from typing import Literal, cast
 
 from pydantic import Field, PostgresDsn, model_validator
@@ -32,7 +31,18 @@ class Settings(BaseServiceSettings):
     access_token_ttl_sec: int = 900  # 15 minutes
     refresh_token_ttl_sec: int = 1209600  # 14 days
 
-    bcrypt_rounds: int = 12
+    # argon2id cost for new password hashes.  Changing these rehashes users
+    # on their next login, as do legacy bcrypt hashes.
+    argon2_time_cost: int = 2
+    argon2_memory_cost_kib: int = 64 * 1024
+    argon2_parallelism: int = 1
+    # Concurrent hashes; each holds argon2_memory_cost_kib of memory, so peak
+    # hashing memory is workers * memory cost (4 * 64 MiB by default).
+    password_hash_workers: int = 4
+
+    # In-process cache of users behind access tokens (0 disables).
+    user_cache_ttl_seconds: float = 30.0
+    user_cache_max_entries: int = 10_000
 
     registration_mode: Literal["open", "invite"] = "open"
 
@@ -73,13 +83,12 @@ class Settings(BaseServiceSettings):
     @property
     def cors_allowed_origins_list(self) -> list[str]:
         """Get CORS allowed origins list."""
-        return self.cors_allowed_origins
+        return list(self.cors_allowed_origins)
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Process-wide settings instance."""
+    return Settings.instance()
 
 
 settings = get_settings()
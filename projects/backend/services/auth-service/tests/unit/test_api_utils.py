@@ -0,0 +1,103 @@
+"""Unit tests for auth_service.api.utils module."""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from auth_service.api.utils import extract_bearer_token, invalid_request_response, json_response
+from auth_service.domain.dto import UserLoginRequest, UserRegisterRequest
+
+
+def test_json_response_serializes_payload():
+    resp = json_response({"user": {"id": "1", "is_admin": False}, "roles": ["a"]}, status=201)
+
+    assert resp.status == 201
+    assert resp.content_type == "application/json"
+    assert json.loads(resp.body) == {"user": {"id": "1", "is_admin": False}, "roles": ["a"]}
+
+
+def test_json_response_defaults_to_200():
+    assert json_response([]).status == 200
+
+
+def test_json_response_formats_uuid_and_datetime_like_stdlib():
+    uid = uuid4()
+    ts = datetime(2024, 5, 1, 12, 30, 15, 250, tzinfo=timezone.utc)
+
+    resp = json_response({"id": uid, "granted_at": ts, "expires_at": None})
+
+    assert json.loads(resp.body) == {
+        "id": str(uid),
+        "granted_at": ts.isoformat(),
+        "expires_at": None,
+    }
+
+
+class _DriverUUID(UUID):
+    """Stand-in for asyncpg's uuid.UUID subclass (asyncpg.pgproto.pgproto.UUID)."""
+
+
+def test_json_response_encodes_uuid_subclasses():
+    raw = uuid4()
+
+    resp = json_response({"user_id": _DriverUUID(str(raw)), "ids": [_DriverUUID(str(raw))]})
+
+    assert json.loads(resp.body) == {"user_id": str(raw), "ids": [str(raw)]}
+
+
+def test_json_response_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        json_response({"value": object()})
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("Bearer abc.def", "abc.def"),
+        ("Bearer    padded   ", "padded"),
+        ("Bearer ", None),
+        ("Bearer", None),
+        ("bearer abc", None),
+        ("Basic abc", None),
+        (None, None),
+    ],
+)
+def test_extract_bearer_token(header, expected):
+    request = MagicMock()
+    request.headers = {"Authorization": header} if header is not None else {}
+
+    assert extract_bearer_token(request) == expected
+
+
+def test_invalid_request_response_hides_submitted_values():
+    with pytest.raises(ValidationError) as exc_info:
+        UserRegisterRequest.model_validate_json(
+            b'{"username": "bob", "email": "bob@example.com", "password": "Xq7z"}'
+        )
+
+    response = invalid_request_response(exc_info.value)
+
+    assert response.status == 400
+    error = json.loads(response.body)["error"]
+    assert error.startswith("Invalid request: password: ")
+    assert "Xq7z" not in error
+
+
+@pytest.mark.parametrize("payload", [b"", b"not json", b"[1, 2]"])
+def test_invalid_request_response_is_constant_for_malformed_bodies(payload):
+    with pytest.raises(ValidationError) as exc_info:
+        UserLoginRequest.model_validate_json(payload)
+
+    response = invalid_request_response(exc_info.value)
+
+    assert response.status == 400
+    assert json.loads(response.body) == {"error": "Invalid request"}
+
+
+def test_invalid_request_response_for_other_errors():
+    assert json.loads(invalid_request_response(RuntimeError("boom")).body) == {"error": "Invalid request"}
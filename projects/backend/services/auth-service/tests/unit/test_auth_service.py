@@ -1,10 +1,12 @@
 """Unit tests for auth_service.services.auth module."""
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import orjson
 import pytest
 
 from auth_service.core.exceptions import (
@@ -29,6 +31,7 @@ from auth_service.services.auth import AuthService
 def mock_repos():
     """Create mock repositories."""
     user_repo = AsyncMock()
+    user_repo.user_exists = AsyncMock(return_value=False)
     revoked_repo = AsyncMock()
     reset_repo = AsyncMock()
     invite_repo = AsyncMock()
@@ -236,7 +239,6 @@ class TestRegister:
         """Test successful registration in open mode."""
         user_repo, revoked_repo, reset_repo, invite_repo, perm_repo, role_repo, user_role_repo = mock_repos
 
-        user_repo.user_exists = AsyncMock(return_value=False)
         mock_user = MagicMock(
             id=uuid4(),
             username="newuser",
@@ -247,7 +249,7 @@ class TestRegister:
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc),
         )
-        user_repo.create = AsyncMock(return_value=mock_user)
+        user_repo.create_if_absent = AsyncMock(return_value=mock_user)
 
         # Mock _create_tokens to return AuthTokensResponse
         mock_tokens = AuthTokensResponse(
@@ -264,14 +266,31 @@ class TestRegister:
 
         assert user is not None
         assert isinstance(tokens, AuthTokensResponse)
-        user_repo.create.assert_called_once()
+        user_repo.create_if_absent.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_register_user_exists(self, auth_service_open, mock_repos):
-        """Test registration when user already exists."""
+        """Test registration when user already exists: rejected before hashing."""
         user_repo, *_ = mock_repos
         user_repo.user_exists = AsyncMock(return_value=True)
 
+        with patch("auth_service.services.auth.hash_password") as hash_mock:
+            with pytest.raises(UserAlreadyExistsError, match="User with this username or email already exists"):
+                await auth_service_open.register(
+                    username="existing",
+                    email="existing@example.com",
+                    password="password123",
+                )
+
+        hash_mock.assert_not_called()
+        user_repo.create_if_absent.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_register_user_created_concurrently(self, auth_service_open, mock_repos):
+        """Test registration losing the race to a concurrent sign-up after the pre-check."""
+        user_repo, *_ = mock_repos
+        user_repo.create_if_absent = AsyncMock(return_value=None)
+
         with pytest.raises(UserAlreadyExistsError, match="User with this username or email already exists"):
             await auth_service_open.register(
                 username="existing",
@@ -285,8 +304,7 @@ class TestRegister:
         user_repo, *_ = mock_repos
         invite_repo = mock_repos[3]
 
-        user_repo.user_exists = AsyncMock(return_value=False)
-        user_repo.create = AsyncMock(return_value=MagicMock(
+        user_repo.create_if_absent = AsyncMock(return_value=MagicMock(
             id=uuid4(),
             username="newuser",
             email="new@example.com",
@@ -407,6 +425,29 @@ class TestLogin:
         assert isinstance(tokens, AuthTokensResponse)
         user_repo.get_by_username.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_outdated_hash(self, auth_service_open, mock_repos, sample_user):
+        """Successful login migrates a legacy bcrypt or outdated argon2 hash."""
+        user_repo, *_ = mock_repos
+        user_repo.get_by_username = AsyncMock(return_value=sample_user)
+        user_repo.update_password = AsyncMock(return_value=sample_user)
+        auth_service_open._create_tokens = AsyncMock(
+            return_value=AuthTokensResponse(access_token="a", refresh_token="r"),
+        )
+
+        with (
+            patch("auth_service.services.auth.verify_password", return_value=True),
+            patch("auth_service.services.auth.needs_rehash", return_value=True),
+            patch("auth_service.services.auth.hash_password", return_value="new-hash"),
+        ):
+            await auth_service_open.login("testuser", "password123")
+
+        user_repo.update_password.assert_awaited_once_with(
+            sample_user.id,
+            "new-hash",
+            password_change_required=sample_user.password_change_required,
+        )
+
     @pytest.mark.asyncio
     async def test_login_user_not_found(self, auth_service_open, mock_repos):
         """Test login with non-existent user."""
@@ -595,6 +636,48 @@ class TestTokenOperations:
                 await auth_service_open.get_user_by_token("access_token")
 
 
+    @pytest.mark.asyncio
+    async def test_get_user_by_token_caches_user(self, auth_service_open, mock_repos, sample_user):
+        """Repeated lookups for the same user hit the database once."""
+        user_repo, *_ = mock_repos
+        user_repo.get_by_id = AsyncMock(return_value=sample_user)
+
+        with patch("auth_service.services.auth.get_user_id_from_token", return_value=str(sample_user.id)):
+            first = await auth_service_open.get_user_by_token("access_token")
+            second = await auth_service_open.get_user_by_token("access_token")
+
+        assert first is second is sample_user
+        user_repo.get_by_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_token_still_validates_token(self, auth_service_open, mock_repos, sample_user):
+        """A cached user does not bypass token verification."""
+        user_repo, *_ = mock_repos
+        user_repo.get_by_id = AsyncMock(return_value=sample_user)
+
+        with patch("auth_service.services.auth.get_user_id_from_token", return_value=str(sample_user.id)):
+            await auth_service_open.get_user_by_token("access_token")
+        with patch("auth_service.services.auth.get_user_id_from_token", side_effect=ValueError("Token expired")):
+            with pytest.raises(InvalidCredentialsError):
+                await auth_service_open.get_user_by_token("access_token")
+
+    @pytest.mark.asyncio
+    async def test_deactivation_invalidates_cached_user(self, auth_service_open, mock_repos, sample_user):
+        """update_user(is_active=False) drops the cached entry."""
+        user_repo, *_ = mock_repos
+        inactive_user = replace(sample_user, is_active=False)
+        user_repo.get_by_id = AsyncMock(return_value=sample_user)
+        user_repo.set_active = AsyncMock(return_value=inactive_user)
+        auth_service_open._perm_svc.is_superadmin = AsyncMock(return_value=False)
+
+        with patch("auth_service.services.auth.get_user_id_from_token", return_value=str(sample_user.id)):
+            await auth_service_open.get_user_by_token("access_token")
+            await auth_service_open.update_user(uuid4(), sample_user.id, is_active=False)
+            user_repo.get_by_id = AsyncMock(return_value=inactive_user)
+
+            with pytest.raises(ForbiddenError, match="Account is deactivated"):
+                await auth_service_open.get_user_by_token("access_token")
+
 # ---------------------------------------------------------------------------
 # Password Tests
 # ---------------------------------------------------------------------------
@@ -1012,6 +1095,47 @@ class TestInviteManagement:
                 await auth_service_open.revoke_invite("admin_token", uuid4())
 
 
+
+class TestUserPayload:
+    """Tests for dict-based user payload builders."""
+
+    @pytest.mark.asyncio
+    async def test_payload_matches_user_response(self, auth_service_open, mock_permission_service, sample_user):
+        mock_permission_service.list_system_role_names = AsyncMock(return_value=["admin"])
+
+        payload = await auth_service_open.get_user_payload(sample_user)
+        response = await auth_service_open.get_user_response(sample_user)
+
+        assert orjson.loads(orjson.dumps(payload)) == response.model_dump()
+        assert payload["created_at"] is sample_user.created_at
+        assert payload["is_admin"] is True
+
+    @pytest.mark.asyncio
+    async def test_payloads_use_batched_roles(self, auth_service_open, mock_permission_service, sample_user, sample_admin):
+        mock_permission_service.batch_list_system_role_names = AsyncMock(
+            return_value={sample_admin.id: ["superadmin"]},
+        )
+
+        payloads = await auth_service_open.get_user_payloads([sample_user, sample_admin])
+
+        mock_permission_service.batch_list_system_role_names.assert_awaited_once()
+        assert [p["system_roles"] for p in payloads] == [[], ["superadmin"]]
+        assert await auth_service_open.get_user_payloads([]) == []
+
+    def test_user_id_str_is_formatted_once(self, sample_user):
+        first = sample_user.id_str
+
+        assert first == str(sample_user.id)
+        assert sample_user.id_str is first
+        assert sample_user.to_dict()["id"] is first
+
+    def test_user_is_immutable(self, sample_user):
+        """Cached users are shared between requests, so they cannot be mutated."""
+        with pytest.raises(FrozenInstanceError):
+            sample_user.is_active = False
+
+        assert hash(sample_user) == hash(replace(sample_user))
+
 # ---------------------------------------------------------------------------
 # Integration Tests
 # ---------------------------------------------------------------------------
@@ -1025,7 +1149,6 @@ class TestAuthIntegration:
         user_repo, *_ = mock_repos
 
         # Registration
-        user_repo.user_exists = AsyncMock(return_value=False)
         created_user = MagicMock(
             id=uuid4(),
             username="newuser",
@@ -1037,7 +1160,7 @@ class TestAuthIntegration:
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc),
         )
-        user_repo.create = AsyncMock(return_value=created_user)
+        user_repo.create_if_absent = AsyncMock(return_value=created_user)
 
         user, tokens = await auth_service_open.register(
             username="newuser",
@@ -0,0 +1,53 @@
+"""Unit tests for app-scoped service providers."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+from auth_service.services.auth import AuthService
+from auth_service.services.dependencies import (
+    get_auth_service,
+    get_permission_service,
+    get_project_service,
+    init_services,
+)
+from auth_service.services.permission import PermissionService
+from auth_service.services.projects import ProjectService
+
+
+@pytest.mark.asyncio
+async def test_services_are_built_once_per_app():
+    app = web.Application()
+    with patch(
+        "auth_service.services.dependencies.get_pool",
+        new=AsyncMock(return_value=MagicMock()),
+    ) as get_pool:
+        await init_services(app)
+    get_pool.assert_awaited_once()
+
+    first = make_mocked_request("GET", "/", app=app)
+    second = make_mocked_request("GET", "/", app=app)
+
+    auth = await get_auth_service(first)
+    assert isinstance(auth, AuthService)
+    assert auth is await get_auth_service(second)
+    assert isinstance(await get_project_service(first), ProjectService)
+    assert await get_permission_service(first) is await get_permission_service(second)
+    assert isinstance(await get_permission_service(first), PermissionService)
+
+
+@pytest.mark.asyncio
+async def test_registration_mode_follows_settings_when_not_given(monkeypatch):
+    from auth_service.core.exceptions import ForbiddenError
+    from auth_service.settings import settings
+
+    service = AuthService(
+        AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock(), invite_repo=AsyncMock(),
+    )
+    monkeypatch.setattr(settings, "registration_mode", "invite")
+
+    with pytest.raises(ForbiddenError, match="Invite token required"):
+        await service.register(username="u", email="u@example.com", password="password123")
@@ -0,0 +1,48 @@
+"""Unit tests for auth_service.core.exceptions module."""
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from auth_service.core.exceptions import (
+    AuthError,
+    ForbiddenError,
+    InvalidCredentialsError,
+    handle_auth_error,
+)
+
+
+def test_default_message_comes_from_class():
+    error = InvalidCredentialsError()
+
+    assert error.message == "Invalid credentials"
+    assert str(error) == "Invalid credentials"
+    assert "message" not in vars(error)
+
+
+def test_custom_message_overrides_default():
+    error = InvalidCredentialsError("Account locked")
+
+    assert error.message == "Account locked"
+    assert str(error) == "Account locked"
+    assert InvalidCredentialsError.message == "Invalid credentials"
+
+
+def test_empty_message_falls_back_to_default():
+    assert AuthError("").message == "Authentication error"
+
+
+def test_handle_auth_error_uses_prebuilt_default_body():
+    response = handle_auth_error(MagicMock(), InvalidCredentialsError())
+
+    assert response.status == 401
+    assert response.content_type == "application/json"
+    assert response.body is InvalidCredentialsError._default_body
+    assert json.loads(response.body) == {"error": "Invalid credentials"}
+
+
+def test_handle_auth_error_encodes_custom_message():
+    response = handle_auth_error(MagicMock(), ForbiddenError("Only admins"))
+
+    assert response.status == 403
+    assert json.loads(response.body) == {"error": "Only admins"}
@@ -7,7 +7,11 @@ from unittest.mock import patch
 import jwt
 import pytest
 
+from backend_common.ttl_cache import TTLCache
+
+from auth_service.services import jwt as jwt_module
 from auth_service.services.jwt import (
+    clear_verified_tokens,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -17,6 +21,13 @@ from auth_service.services.jwt import (
 from auth_service.settings import settings
 
 
+@pytest.fixture(autouse=True)
+def _clear_verified_tokens():
+    clear_verified_tokens()
+    yield
+    clear_verified_tokens()
+
+
 class TestCreateAccessToken:
     """Tests for create_access_token function."""
 
@@ -357,6 +368,72 @@ class TestGetUserIdFromToken:
             get_user_id_from_token(token)
 
 
+class TestVerifiedTokenCache:
+    """Tests for the verified-token cache behind get_user_id_from_token."""
+
+    def test_repeat_lookup_skips_decode(self):
+        """A verified token is not decoded again while cached."""
+        token = create_access_token("cached-user")
+        assert get_user_id_from_token(token) == "cached-user"
+
+        with patch("auth_service.services.jwt.decode_token") as mock_decode:
+            assert get_user_id_from_token(token) == "cached-user"
+        mock_decode.assert_not_called()
+
+    def test_cached_token_still_expires(self):
+        """A cached token is rejected once its exp has passed."""
+        now = int(time.time())
+        with (
+            patch.object(settings, "access_token_ttl_sec", 5),
+            patch("auth_service.services.jwt.time.time", return_value=now),
+            patch("backend_common.ttl_cache.time.monotonic", return_value=1000.0),
+        ):
+            token = create_access_token("user-id")
+            get_user_id_from_token(token)
+
+        with (
+            patch("backend_common.ttl_cache.time.monotonic", return_value=1006.0),
+            patch(
+                "auth_service.services.jwt.decode_token",
+                side_effect=ValueError("Token expired"),
+            ) as mock_decode,
+        ):
+            with pytest.raises(ValueError, match="Token expired"):
+                get_user_id_from_token(token)
+        mock_decode.assert_called_once_with(token)
+
+    def test_entry_lifetime_is_capped(self):
+        """Cache entries are re-verified after the short cache TTL."""
+        token = create_access_token("user-id")
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=1000.0):
+            get_user_id_from_token(token)
+
+        later = 1000.0 + jwt_module._VERIFIED_TOKEN_TTL_SECONDS + 1
+        with (
+            patch("backend_common.ttl_cache.time.monotonic", return_value=later),
+            patch("auth_service.services.jwt.decode_token", wraps=jwt_module.decode_token) as mock_decode,
+        ):
+            assert get_user_id_from_token(token) == "user-id"
+        mock_decode.assert_called_once_with(token)
+
+    def test_invalid_tokens_are_not_cached(self):
+        """Tokens failing verification never enter the cache."""
+        with pytest.raises(ValueError):
+            get_user_id_from_token("invalid.token.here")
+
+        assert "invalid.token.here" not in jwt_module._verified_tokens
+
+    def test_evicts_when_full(self):
+        """The cache stays within its entry limit."""
+        cache: TTLCache[str, str] = TTLCache(60.0, 2)
+        with patch.object(jwt_module, "_verified_tokens", cache):
+            tokens = [create_access_token(f"user-{i}") for i in range(3)]
+            for token in tokens:
+                get_user_id_from_token(token)
+
+        assert list(cache) == tokens[1:]
+
+
 class TestGetJtiFromToken:
     """Tests for get_jti_from_token function."""
 
@@ -1,11 +1,20 @@
 """Unit tests for auth_service.services.password module."""
 from __future__ import annotations
 
+import threading
 from unittest.mock import patch
 
+import bcrypt
 import pytest
 
-from auth_service.services.password import hash_password, verify_password
+from auth_service.services import password as password_module
+from auth_service.services.password import (
+    hash_password,
+    needs_rehash,
+    run_in_hash_pool,
+    shutdown_hash_pool,
+    verify_password,
+)
 
 
 class TestHashPassword:
@@ -31,22 +40,22 @@ class TestHashPassword:
         """Test same password produces different hashes (due to salt)."""
         hash1 = hash_password("testpassword123")
         hash2 = hash_password("testpassword123")
-        # Bcrypt uses random salt, so hashes should be different
+        # argon2 uses a random salt, so hashes should be different
         assert hash1 != hash2
 
-    def test_hash_starts_with_bcrypt_identifier(self):
-        """Test bcrypt hash starts with $2b$ identifier."""
+    def test_hash_starts_with_argon2id_identifier(self):
+        """Test hash starts with $argon2id$ identifier."""
         result = hash_password("testpassword123")
-        assert result.startswith("$2")
+        assert result.startswith("$argon2id$")
 
     def test_hash_has_correct_format(self):
-        """Test bcrypt hash has correct format."""
+        """Test hash encodes the configured argon2 parameters."""
         result = hash_password("testpassword123")
-        # Bcrypt hash format: $2b$[cost]$[22-char-salt][31-char-hash]
+        # PHC format: $argon2id$v=19$m=<KiB>,t=<iterations>,p=<lanes>$<salt>$<hash>
         parts = result.split("$")
-        assert len(parts) == 4
-        assert parts[1] == "2b" or parts[1] == "2a"
-        assert parts[2] == "12"  # Default bcrypt rounds
+        assert len(parts) == 6
+        assert parts[1] == "argon2id"
+        assert parts[3] == "m=65536,t=2,p=1"  # Default argon2 settings
 
     def test_hash_with_unicode_password(self):
         """Test hashing password with unicode characters."""
@@ -74,11 +83,11 @@ class TestHashPassword:
         assert len(result) > 0
 
     def test_hash_is_deterministic_in_format(self):
-        """Test hash always has bcrypt format."""
+        """Test hash always has argon2id format."""
         for _ in range(5):
             result = hash_password("test")
-            assert result.startswith("$2")
-            assert len(result.split("$")) == 4
+            assert result.startswith("$argon2id$")
+            assert len(result.split("$")) == 6
 
 
 class TestVerifyPassword:
@@ -144,20 +153,27 @@ class TestVerifyPassword:
         """Test empty password and empty hash."""
         assert verify_password("", "") is False
 
-    def test_different_hash_rounds(self):
-        """Test verification works with different bcrypt rounds."""
+    def test_different_hash_parameters(self):
+        """Test verification works with hashes made with other argon2 parameters."""
         password = "testpassword123"
 
-        # Hash with different rounds
-        with patch("auth_service.services.password.settings.bcrypt_rounds", 10):
-            hash_rounds_10 = hash_password(password)
+        with patch("auth_service.services.password.settings.argon2_time_cost", 1):
+            hash_t1 = hash_password(password)
 
-        with patch("auth_service.services.password.settings.bcrypt_rounds", 14):
-            hash_rounds_14 = hash_password(password)
+        with patch("auth_service.services.password.settings.argon2_memory_cost_kib", 8 * 1024):
+            hash_m8 = hash_password(password)
 
         # Both should verify correctly
-        assert verify_password(password, hash_rounds_10) is True
-        assert verify_password(password, hash_rounds_14) is True
+        assert verify_password(password, hash_t1) is True
+        assert verify_password(password, hash_m8) is True
+
+    def test_legacy_bcrypt_hash(self):
+        """Test hashes stored before the argon2 switch still verify."""
+        password = "testpassword123"
+        legacy_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode()
+
+        assert verify_password(password, legacy_hash) is True
+        assert verify_password("wrong", legacy_hash) is False
 
     def test_hash_with_null_bytes(self):
         """Test password with null bytes."""
@@ -282,8 +298,8 @@ class TestPasswordHashingIntegration:
 class TestPasswordErrorHandling:
     """Tests for password error handling."""
 
-    def test_verify_with_invalid_bcrypt_hash(self):
-        """Test verification with invalid bcrypt hash."""
+    def test_verify_with_invalid_hash_identifier(self):
+        """Test verification with an unknown hash identifier."""
         # Invalid bcrypt hash (wrong identifier)
         invalid_hash = "$99$rounds$salt$hashvalue"
         assert verify_password("password", invalid_hash) is False
@@ -302,9 +318,9 @@ class TestPasswordErrorHandling:
         password = "testpassword"
         full_hash = hash_password(password)
         
-        # Corrupt the cost factor (positions 4-6 in $2b$12$...)
+        # Corrupt the parameter block ($argon2id$v=19$m=...,t=...,p=...$)
         # This makes the hash invalid
-        corrupted = full_hash[:4] + "99" + full_hash[6:]
+        corrupted = full_hash.replace("t=2", "t=x")
         assert verify_password(password, corrupted) is False
 
     def test_verify_password_encoding_error_handling(self):
@@ -334,3 +350,59 @@ class TestPasswordErrorHandling:
             hashed = hash_password(password)
             assert isinstance(hashed, str)
             assert len(hashed) > 0
+
+
+class TestNeedsRehash:
+    """Tests for needs_rehash function."""
+
+    def test_current_parameters_do_not_need_rehash(self):
+        hashed = hash_password("testpassword123")
+        assert needs_rehash(hashed) is False
+
+    def test_different_parameters_need_rehash(self):
+        with patch("auth_service.services.password.settings.argon2_time_cost", 1):
+            hashed = hash_password("testpassword123")
+        assert needs_rehash(hashed) is True
+
+    def test_bcrypt_hash_needs_rehash(self):
+        legacy_hash = bcrypt.hashpw(b"testpassword123", bcrypt.gensalt(rounds=4)).decode()
+        assert needs_rehash(legacy_hash) is True
+
+    @pytest.mark.parametrize(
+        "value",
+        ["", "plain", "hashed123", "$2b$xx$abc", "$2b$12", "$argon2id$v=19$garbage"],
+    )
+    def test_malformed_hash_is_not_rehashed(self, value):
+        assert needs_rehash(value) is False
+
+
+class TestRunInHashPool:
+    """Tests for run_in_hash_pool helper."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_thread(self):
+        thread_name = await run_in_hash_pool(lambda: threading.current_thread().name)
+        assert thread_name.startswith("password-hash")
+        assert thread_name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        hashed = await run_in_hash_pool(hash_password, "testpassword123")
+        assert await run_in_hash_pool(verify_password, "testpassword123", hashed) is True
+        assert await run_in_hash_pool(verify_password, "wrong", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_pool_is_recreated_after_shutdown(self):
+        assert await run_in_hash_pool(lambda: 1) == 1
+        await shutdown_hash_pool()
+        await shutdown_hash_pool()  # idempotent
+        assert await run_in_hash_pool(lambda: 2) == 2
+
+    @pytest.mark.asyncio
+    async def test_pool_size_follows_setting(self):
+        await shutdown_hash_pool()
+        with patch.object(password_module.settings, "password_hash_workers", 3):
+            assert await run_in_hash_pool(lambda: 1) == 1
+            assert password_module._hash_executor._max_workers == 3
+        await shutdown_hash_pool()
+
@@ -7,6 +7,7 @@ from uuid import uuid4
 
 import pytest
 
+from auth_service.core.exceptions import ForbiddenError, NotFoundError
 from auth_service.domain.models import Project
 from auth_service.repositories.projects import ProjectRepository
 from auth_service.services.projects import ProjectService
@@ -205,3 +206,139 @@ class TestProjectServiceListUserProjects:
 
         assert total == 1
         assert len(projects) == 1
+
+
+class TestProjectServiceAccessCheck:
+    """Tests for project lookups fused with the permission check."""
+
+    def _make_service(self, repo: MagicMock) -> tuple[ProjectService, MagicMock]:
+        perm_svc = MagicMock()
+        perm_svc.ensure_permission = AsyncMock()
+        service = ProjectService(
+            project_repo=repo,
+            user_repo=MagicMock(),
+            user_role_repo=MagicMock(),
+            permission_service=perm_svc,
+        )
+        return service, perm_svc
+
+    @pytest.mark.asyncio
+    async def test_get_project_single_lookup(self):
+        """get_project uses get_with_access instead of a separate permission check."""
+        project = Project.from_row(_project_row("Alpha"))
+        repo = MagicMock()
+        repo.get_with_access = AsyncMock(return_value=(project, True))
+        service, perm_svc = self._make_service(repo)
+        user_id = uuid4()
+
+        result = await service.get_project(project.id, user_id)
+
+        assert result is project
+        repo.get_with_access.assert_awaited_once_with(project.id, user_id, "project.members.view")
+        perm_svc.ensure_permission.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_forbidden_takes_precedence_over_not_found(self):
+        """Missing permission is reported even when the project does not exist."""
+        repo = MagicMock()
+        repo.get_with_access = AsyncMock(return_value=(None, False))
+        service, _ = self._make_service(repo)
+
+        with pytest.raises(ForbiddenError, match="project.settings.delete"):
+            await service.delete_project(uuid4(), uuid4())
+
+    @pytest.mark.asyncio
+    async def test_not_found_when_allowed(self):
+        """Allowed users (e.g. superadmin) get NotFoundError for missing projects."""
+        repo = MagicMock()
+        repo.get_with_access = AsyncMock(return_value=(None, True))
+        repo.update = AsyncMock()
+        service, _ = self._make_service(repo)
+
+        with pytest.raises(NotFoundError):
+            await service.update_project(uuid4(), uuid4(), name="x")
+        repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_remove_member_rejects_owner(self):
+        """remove_member still protects the owner using the fetched project."""
+        owner_id = uuid4()
+        project = Project.from_row(_project_row(owner_id=owner_id))
+        repo = MagicMock()
+        repo.get_with_access = AsyncMock(return_value=(project, True))
+        service, _ = self._make_service(repo)
+
+        with pytest.raises(ForbiddenError, match="owner"):
+            await service.remove_member(project.id, uuid4(), owner_id, uuid4())
+
+
+class TestProjectServiceAddMember:
+    """Tests for the concurrent pre-checks in ProjectService.add_member."""
+
+    def _make_service(
+        self,
+        *,
+        permission_error: Exception | None = None,
+        user: object | None = None,
+        role_error: Exception | None = None,
+    ) -> tuple[ProjectService, MagicMock]:
+        perm_svc = MagicMock()
+        perm_svc.ensure_permission = AsyncMock(side_effect=permission_error)
+        perm_svc.validate_project_role = AsyncMock(side_effect=role_error)
+        user_repo = MagicMock()
+        user_repo.get_by_id = AsyncMock(return_value=user)
+        user_role_repo = MagicMock()
+        user_role_repo.grant_project_role = AsyncMock(return_value="assignment")
+        service = ProjectService(
+            project_repo=MagicMock(),
+            user_repo=user_repo,
+            user_role_repo=user_role_repo,
+            permission_service=perm_svc,
+        )
+        return service, user_role_repo
+
+    @pytest.mark.asyncio
+    async def test_add_member_runs_checks_and_grants(self):
+        """All checks pass: role is granted."""
+        service, user_role_repo = self._make_service(user=MagicMock())
+
+        result = await service.add_member(uuid4(), uuid4(), uuid4(), uuid4())
+
+        assert result == "assignment"
+        user_role_repo.grant_project_role.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_permission_error_reported_first(self):
+        """Missing permission wins over a missing user and a bad role."""
+        service, user_role_repo = self._make_service(
+            permission_error=ForbiddenError("Missing permission: project.members.invite"),
+            user=None,
+            role_error=ForbiddenError("Cannot assign a system role as a project role"),
+        )
+
+        with pytest.raises(ForbiddenError, match="Missing permission"):
+            await service.add_member(uuid4(), uuid4(), uuid4(), uuid4())
+        user_role_repo.grant_project_role.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_user_reported_before_role_error(self):
+        """A missing user is reported before role validation errors."""
+        service, _ = self._make_service(
+            user=None,
+            role_error=ForbiddenError("Cannot assign a system role as a project role"),
+        )
+
+        with pytest.raises(NotFoundError):
+            await service.add_member(uuid4(), uuid4(), uuid4(), uuid4())
+
+    @pytest.mark.asyncio
+    async def test_role_error_raised(self):
+        """Role validation failure is still raised."""
+        service, user_role_repo = self._make_service(
+            user=MagicMock(),
+            role_error=ForbiddenError("Cannot assign a system role as a project role"),
+        )
+
+        with pytest.raises(ForbiddenError, match="system role"):
+            await service.add_member(uuid4(), uuid4(), uuid4(), uuid4())
+        user_role_repo.grant_project_role.assert_not_called()
@@ -214,6 +214,37 @@ class TestUserRepositoryCreate:
                 hashed_password="hashed123",
             )
 
+    @pytest.mark.asyncio
+    async def test_create_if_absent_returns_user(self, mock_pool_with_conn):
+        """Test create_if_absent inserts with ON CONFLICT DO NOTHING."""
+        mock_pool, mock_conn = mock_pool_with_conn
+        mock_row = {
+            "id": uuid4(),
+            "username": "testuser",
+            "email": "test@example.com",
+            "hashed_password": "hashed123",
+            "password_change_required": False,
+            "is_active": True,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+        mock_conn.fetchrow = AsyncMock(return_value=mock_row)
+
+        repo = UserRepository(mock_pool)
+        user = await repo.create_if_absent("testuser", "test@example.com", "hashed123")
+
+        assert isinstance(user, User)
+        assert "ON CONFLICT DO NOTHING" in mock_conn.fetchrow.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_create_if_absent_returns_none_on_conflict(self, mock_pool_with_conn):
+        """Test create_if_absent returns None when username/email is taken."""
+        mock_pool, mock_conn = mock_pool_with_conn
+        mock_conn.fetchrow = AsyncMock(return_value=None)
+
+        repo = UserRepository(mock_pool)
+
+        assert await repo.create_if_absent("testuser", "test@example.com", "hashed123") is None
 
 class TestUserRepositoryGetters:
     """Tests for UserRepository get methods."""
@@ -428,7 +459,7 @@ class TestUserRepositoryQueries:
     async def test_user_exists_true(self, mock_pool_with_conn):
         """Test user_exists returns True when user exists."""
         mock_pool, mock_conn = mock_pool_with_conn
-        mock_conn.fetchrow = AsyncMock(return_value={"exists": True})
+        mock_conn.fetchval = AsyncMock(return_value=1)
 
         repo = UserRepository(mock_pool)
         exists = await repo.user_exists("testuser", "test@example.com")
@@ -439,7 +470,7 @@ class TestUserRepositoryQueries:
     async def test_user_exists_false(self, mock_pool_with_conn):
         """Test user_exists returns False when user doesn't exist."""
         mock_pool, mock_conn = mock_pool_with_conn
-        mock_conn.fetchrow = AsyncMock(return_value={"exists": False})
+        mock_conn.fetchval = AsyncMock(return_value=None)
 
         repo = UserRepository(mock_pool)
         exists = await repo.user_exists("testuser", "test@example.com")
@@ -447,15 +478,19 @@ class TestUserRepositoryQueries:
         assert exists is False
 
     @pytest.mark.asyncio
-    async def test_user_exists_handles_none(self, mock_pool_with_conn):
-        """Test user_exists handles None response."""
+    async def test_user_exists_fetches_scalar(self, mock_pool_with_conn):
+        """Test user_exists reads a single scalar instead of a row."""
         mock_pool, mock_conn = mock_pool_with_conn
-        mock_conn.fetchrow = AsyncMock(return_value=None)
+        mock_conn.fetchval = AsyncMock(return_value=1)
+        mock_conn.fetchrow = AsyncMock()
 
         repo = UserRepository(mock_pool)
-        exists = await repo.user_exists("testuser", "test@example.com")
+        await repo.user_exists("testuser", "test@example.com")
 
-        assert exists is False
+        query, *args = mock_conn.fetchval.await_args.args
+        assert "LIMIT 1" in query
+        assert args == ["testuser", "test@example.com"]
+        mock_conn.fetchrow.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_list_all_without_search(self, mock_pool_with_conn):
@@ -661,6 +696,53 @@ class TestProjectRepositoryGetters:
 
         assert project is None
 
+    @pytest.mark.asyncio
+    async def test_get_with_access_allowed(self, mock_pool_with_conn):
+        """Test get_with_access returns project and permission in one query."""
+        mock_pool, mock_conn = mock_pool_with_conn
+
+        project_id = uuid4()
+        user_id = uuid4()
+        mock_conn.fetchrow = AsyncMock(return_value={
+            "id": project_id,
+            "name": "Test Project",
+            "description": None,
+            "owner_id": user_id,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+            "allowed": True,
+        })
+
+        repo = ProjectRepository(mock_pool)
+        project, allowed = await repo.get_with_access(project_id, user_id, "project.members.view")
+
+        assert isinstance(project, Project)
+        assert project.id == project_id
+        assert allowed is True
+        mock_conn.fetchrow.assert_called_once()
+        args = mock_conn.fetchrow.call_args.args
+        assert args[1:4] == (project_id, user_id, "project.members.view")
+
+    @pytest.mark.asyncio
+    async def test_get_with_access_missing_project(self, mock_pool_with_conn):
+        """Test get_with_access returns None project when the join finds nothing."""
+        mock_pool, mock_conn = mock_pool_with_conn
+        mock_conn.fetchrow = AsyncMock(return_value={
+            "id": None,
+            "name": None,
+            "description": None,
+            "owner_id": None,
+            "created_at": None,
+            "updated_at": None,
+            "allowed": False,
+        })
+
+        repo = ProjectRepository(mock_pool)
+        project, allowed = await repo.get_with_access(uuid4(), uuid4(), "project.members.view")
+
+        assert project is None
+        assert allowed is False
+
     @pytest.mark.asyncio
     async def test_get_by_id_or_raise_found(self, mock_pool_with_conn):
         """Test get_by_id_or_raise returns Project when found."""
@@ -0,0 +1,72 @@
+"""Unit tests for auth_service.services.user_cache module."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+from auth_service.domain.models import User
+from auth_service.services.user_cache import UserCache
+
+
+def _user() -> User:
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid4(),
+        username="testuser",
+        email="test@example.com",
+        hashed_password="hashed123",
+        password_change_required=False,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestUserCache:
+    """Tests for UserCache."""
+
+    def test_miss_then_hit(self):
+        cache = UserCache(ttl_seconds=60.0, max_entries=10)
+        user = _user()
+
+        assert cache.get(user.id) is None
+        cache.remember(user)
+        assert cache.get(user.id) is user
+
+    def test_expired_entry(self):
+        cache = UserCache(ttl_seconds=10.0, max_entries=10)
+        user = _user()
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=100.0):
+            cache.remember(user)
+        with patch("backend_common.ttl_cache.time.monotonic", return_value=110.0):
+            assert cache.get(user.id) is None
+        assert len(cache._cache) == 0
+
+    def test_invalidate(self):
+        cache = UserCache(ttl_seconds=60.0, max_entries=10)
+        user = _user()
+        cache.remember(user)
+
+        cache.invalidate(user.id)
+        cache.invalidate(user.id)  # absent entries are fine
+
+        assert cache.get(user.id) is None
+
+    def test_evicts_oldest_when_full(self):
+        cache = UserCache(ttl_seconds=60.0, max_entries=2)
+        first, second, third = _user(), _user(), _user()
+        cache.remember(first)
+        cache.remember(second)
+        cache.remember(third)
+
+        assert cache.get(first.id) is None
+        assert cache.get(second.id) is second
+        assert cache.get(third.id) is third
+
+    def test_disabled_with_zero_ttl(self):
+        cache = UserCache(ttl_seconds=0, max_entries=10)
+        user = _user()
+        cache.remember(user)
+
+        assert cache.get(user.id) is None
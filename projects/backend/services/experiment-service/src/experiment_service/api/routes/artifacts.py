@@ -7,6 +7,7 @@ from aiohttp import web
 from pydantic import ValidationError
 
 from experiment_service.api.utils import (
+    json_response,
     paginated_response,
     pagination_params,
     parse_uuid,
@@ -66,7 +67,7 @@ async def create_artifact(request: web.Request) -> web.Response:
         )
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_artifact_response(artifact), status=201)
+    return json_response(_artifact_response(artifact), status=201)
 
 
 @routes.get("/api/v1/runs/{run_id}/artifacts")
@@ -87,13 +88,13 @@ async def list_artifacts(request: web.Request) -> web.Response:
         offset=offset,
     )
     payload = paginated_response(
-        [_artifact_response(a) for a in artifacts],
+        artifacts,
         limit=limit,
         offset=offset,
         key="artifacts",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/artifacts/{artifact_id}")
@@ -109,7 +110,7 @@ async def get_artifact(request: web.Request) -> web.Response:
         artifact = await service.get_artifact(artifact_id)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_artifact_response(artifact))
+    return json_response(_artifact_response(artifact))
 
 
 @routes.delete("/api/v1/artifacts/{artifact_id}")
@@ -143,7 +144,7 @@ async def approve_artifact(request: web.Request) -> web.Response:
         artifact = await service.approve_artifact(artifact_id, user.user_id, note)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_artifact_response(artifact))
+    return json_response(_artifact_response(artifact))
 
 
 @routes.post("/api/v1/runs/{run_id}/artifacts/upload-url")
@@ -206,7 +207,7 @@ async def request_upload_url(request: web.Request) -> web.Response:
     except Exception as exc:
         raise web.HTTPServiceUnavailable(text=f"S3 unavailable: {exc}") from exc
 
-    return web.json_response({
+    return json_response({
         "upload_url": upload_url,
         "artifact_id": str(artifact.id),
         "s3_key": object_key,
@@ -236,7 +237,7 @@ async def get_download_url(request: web.Request) -> web.Response:
     uri = artifact.uri
     if not uri.startswith("s3://"):
         # Legacy artifact — return URI directly (not presigned)
-        return web.json_response({"download_url": uri, "expires_in": None})
+        return json_response({"download_url": uri, "expires_in": None})
 
     object_key = uri[len("s3://"):]
     # Extract filename from key (last path component)
@@ -249,7 +250,7 @@ async def get_download_url(request: web.Request) -> web.Response:
     except Exception as exc:
         raise web.HTTPServiceUnavailable(text=f"S3 unavailable: {exc}") from exc
 
-    return web.json_response({
+    return json_response({
         "download_url": download_url,
         "expires_in": _settings.s3_presign_expire_seconds,
     })
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from aiohttp import web
 
-from experiment_service.api.utils import paginated_response, pagination_params, parse_uuid
+from experiment_service.api.utils import json_response, paginated_response, pagination_params, parse_uuid
 from experiment_service.core.exceptions import NotFoundError
 from experiment_service.services.dependencies import (
     ensure_permission,
@@ -15,20 +15,6 @@ from experiment_service.services.dependencies import (
 routes = web.RouteTableDef()
 
 
-def _serialize_task(task: dict) -> dict:
-    """Convert asyncpg Record / dict values to JSON-safe types."""
-    result = {}
-    for key, value in task.items():
-        if hasattr(value, "isoformat"):
-            result[key] = value.isoformat()
-        elif hasattr(value, "hex"):
-            # UUID
-            result[key] = str(value)
-        else:
-            result[key] = value
-    return result
-
-
 @routes.post("/api/v1/sensors/{sensor_id}/backfill")
 async def start_backfill(request: web.Request):
     user = await require_current_user(request)
@@ -42,7 +28,7 @@ async def start_backfill(request: web.Request):
         )
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_serialize_task(task), status=201)
+    return json_response(task, status=201)
 
 
 @routes.get("/api/v1/sensors/{sensor_id}/backfill")
@@ -55,13 +41,13 @@ async def list_backfill_tasks(request: web.Request):
     limit, offset = pagination_params(request)
     tasks, total = await service.list_tasks(sensor_id, limit=limit, offset=offset)
     payload = paginated_response(
-        [_serialize_task(t) for t in tasks],
+        tasks,
         limit=limit,
         offset=offset,
         key="backfill_tasks",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/sensors/{sensor_id}/backfill/{task_id}")
@@ -75,4 +61,4 @@ async def get_backfill_task(request: web.Request):
         task = await service.get_task(task_id)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_serialize_task(task))
+    return json_response(task)
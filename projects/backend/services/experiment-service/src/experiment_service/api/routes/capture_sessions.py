@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from aiohttp import web
 from pydantic import ValidationError
 
-from experiment_service.api.utils import paginated_response, pagination_params, parse_uuid, read_json
+from experiment_service.api.utils import json_response, paginated_response, pagination_params, parse_uuid, read_json
 from experiment_service.core.exceptions import (
     IdempotencyConflictError,
     InvalidStatusTransitionError,
@@ -61,13 +61,13 @@ async def list_capture_sessions(request: web.Request):
         project_id, run_id, limit=limit, offset=offset
     )
     payload = paginated_response(
-        [_session_response(item) for item in sessions],
+        sessions,
         limit=limit,
         offset=offset,
         key="capture_sessions",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/runs/{run_id}/capture-sessions")
@@ -145,7 +145,7 @@ async def create_capture_session(request: web.Request):
             )
         except IdempotencyConflictError as exc:
             raise web.HTTPConflict(text=str(exc)) from exc
-    return web.json_response(response_payload, status=201)
+    return json_response(response_payload, status=201)
 
 
 @routes.post("/api/v1/runs/{run_id}/capture-sessions/{session_id}/stop")
@@ -201,7 +201,7 @@ async def stop_capture_session(request: web.Request):
             "notes": session.notes,
         },
     )
-    return web.json_response(_session_response(session))
+    return json_response(_session_response(session))
 
 
 @routes.get("/api/v1/runs/{run_id}/capture-sessions/{session_id}/events")
@@ -229,7 +229,7 @@ async def list_capture_session_events(request: web.Request):
         key="events",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/runs/{run_id}/capture-sessions/{session_id}/backfill/start")
@@ -274,7 +274,7 @@ async def start_backfill(request: web.Request):
             "status": session.status.value,
         },
     )
-    return web.json_response(_session_response(session))
+    return json_response(_session_response(session))
 
 
 @routes.post("/api/v1/runs/{run_id}/capture-sessions/{session_id}/backfill/complete")
@@ -323,7 +323,7 @@ async def complete_backfill(request: web.Request):
     )
     resp = _session_response(session)
     resp["attached_records"] = attached
-    return web.json_response(resp)
+    return json_response(resp)
 
 
 @routes.delete("/api/v1/runs/{run_id}/capture-sessions/{session_id}")
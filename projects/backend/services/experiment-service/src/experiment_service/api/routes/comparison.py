@@ -5,7 +5,7 @@ from uuid import UUID
 
 from aiohttp import web
 
-from experiment_service.api.utils import parse_uuid, read_json
+from experiment_service.api.utils import json_response, parse_uuid, read_json
 from experiment_service.core.exceptions import NotFoundError
 from experiment_service.services.dependencies import (
     ensure_permission,
@@ -93,7 +93,7 @@ async def compare_post(request: web.Request) -> web.Response:
         raise web.HTTPBadRequest(text=str(exc)) from exc
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/experiments/{experiment_id}/compare")
@@ -138,7 +138,7 @@ async def compare_get(request: web.Request) -> web.Response:
         raise web.HTTPBadRequest(text=str(exc)) from exc
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/experiments/{experiment_id}/compare/export")
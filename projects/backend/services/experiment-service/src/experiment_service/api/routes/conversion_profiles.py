@@ -4,7 +4,8 @@ from __future__ import annotations
 from aiohttp import web
 from pydantic import ValidationError
 
-from experiment_service.api.utils import paginated_response, pagination_params, parse_uuid, read_json
+from backend_common.conversion import InvalidConversionError
+from experiment_service.api.utils import json_response, paginated_response, pagination_params, parse_uuid, read_json
 from experiment_service.core.exceptions import InvalidStatusTransitionError, NotFoundError
 from experiment_service.domain.dto import ConversionProfileInputDTO
 from experiment_service.domain.models import ConversionProfile
@@ -44,7 +45,7 @@ async def create_profile(request: web.Request):
     except (InvalidStatusTransitionError, NotFoundError) as exc:
         status = web.HTTPBadRequest if isinstance(exc, InvalidStatusTransitionError) else web.HTTPNotFound
         raise status(text=str(exc)) from exc
-    return web.json_response(_profile_response(profile), status=201)
+    return json_response(_profile_response(profile), status=201)
 
 
 @routes.get("/api/v1/sensors/{sensor_id}/conversion-profiles")
@@ -59,13 +60,13 @@ async def list_profiles(request: web.Request):
         project_id, sensor_id, limit=limit, offset=offset
     )
     payload = paginated_response(
-        [_profile_response(profile) for profile in profiles],
+        profiles,
         limit=limit,
         offset=offset,
         key="conversion_profiles",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/sensors/{sensor_id}/conversion-profiles/{profile_id}/publish")
@@ -83,8 +84,8 @@ async def publish_profile(request: web.Request):
             profile_id,
             published_by=user.user_id,
         )
-    except InvalidStatusTransitionError as exc:
+    except (InvalidStatusTransitionError, InvalidConversionError) as exc:
         raise web.HTTPBadRequest(text=str(exc)) from exc
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_profile_response(profile))
+    return json_response(_profile_response(profile))
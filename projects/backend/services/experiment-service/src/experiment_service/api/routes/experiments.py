@@ -8,6 +8,7 @@ from aiohttp import web
 from pydantic import ValidationError
 
 from experiment_service.api.utils import (
+    json_response,
     paginated_response,
     pagination_params,
     parse_datetime,
@@ -78,13 +79,13 @@ async def list_experiments(request: web.Request):
         created_before=created_before,
     )
     payload = paginated_response(
-        [_experiment_response(item) for item in experiments],
+        experiments,
         limit=limit,
         offset=offset,
         key="experiments",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/experiments/search")
@@ -101,13 +102,13 @@ async def search_experiments(request: web.Request):
         project_id, query, limit=limit, offset=offset
     )
     payload = paginated_response(
-        [_experiment_response(item) for item in experiments],
+        experiments,
         limit=limit,
         offset=offset,
         key="experiments",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/experiments")
@@ -152,7 +153,7 @@ async def create_experiment(request: web.Request):
             )
         except IdempotencyConflictError as exc:
             raise web.HTTPConflict(text=str(exc)) from exc
-    return web.json_response(response_payload, status=201)
+    return json_response(response_payload, status=201)
 
 
 @routes.get("/api/v1/experiments/{experiment_id}")
@@ -166,7 +167,7 @@ async def get_experiment(request: web.Request):
         experiment = await service.get_experiment(project_id, experiment_id)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_experiment_response(experiment))
+    return json_response(_experiment_response(experiment))
 
 
 @routes.patch("/api/v1/experiments/{experiment_id}")
@@ -187,7 +188,7 @@ async def update_experiment(request: web.Request):
         raise web.HTTPNotFound(text=str(exc)) from exc
     except InvalidStatusTransitionError as exc:
         raise web.HTTPBadRequest(text=str(exc)) from exc
-    return web.json_response(_experiment_response(experiment))
+    return json_response(_experiment_response(experiment))
 
 
 @routes.post("/api/v1/experiments/{experiment_id}/archive")
@@ -205,7 +206,7 @@ async def archive_experiment(request: web.Request):
         experiment = await service.update_experiment(project_id, experiment_id, dto)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_experiment_response(experiment))
+    return json_response(_experiment_response(experiment))
 
 
 @routes.delete("/api/v1/experiments/{experiment_id}")
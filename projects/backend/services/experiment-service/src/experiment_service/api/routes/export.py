@@ -58,12 +58,33 @@ def _experiments_to_csv(experiments: list[Experiment]) -> str:
     return buf.getvalue()
 
 
-def _experiments_to_json(experiments: list[Experiment]) -> str:
-    return json.dumps(
-        [exp.model_dump(mode="json") for exp in experiments],
-        ensure_ascii=False,
-        indent=2,
+def _dump_json(items: list[dict], *, pretty: bool) -> str:
+    # Compact unless the caller asks for ?pretty=1: indentation roughly doubles
+    # the body and programmatic consumers do not need it.
+    if pretty:
+        return json.dumps(items, ensure_ascii=False, indent=2)
+    return json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+
+
+def _download_response(body: str, content_type: str, filename: str) -> web.Response:
+    response = web.Response(
+        text=body,
+        content_type=content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
     )
+    # gzip/deflate when the client's Accept-Encoding allows it.
+    response.enable_compression()
+    return response
+
+
+def _wants_pretty(request: web.Request) -> bool:
+    return request.rel_url.query.get("pretty", "").lower() in ("1", "true")
+
+
+def _experiments_to_json(experiments: list[Experiment], *, pretty: bool = False) -> str:
+    return _dump_json([exp.model_dump(mode="json") for exp in experiments], pretty=pretty)
 
 
 def _runs_to_csv(runs: list[Run]) -> str:
@@ -96,12 +117,8 @@ def _runs_to_csv(runs: list[Run]) -> str:
     return buf.getvalue()
 
 
-def _runs_to_json(runs: list[Run]) -> str:
-    return json.dumps(
-        [run.model_dump(mode="json") for run in runs],
-        ensure_ascii=False,
-        indent=2,
-    )
+def _runs_to_json(runs: list[Run], *, pretty: bool = False) -> str:
+    return _dump_json([run.model_dump(mode="json") for run in runs], pretty=pretty)
 
 
 @routes.get("/api/v1/experiments/export")
@@ -111,6 +128,7 @@ async def export_experiments(request: web.Request):
     Query params:
       - project_id (required or from header)
       - format: csv | json (default csv)
+      - pretty: 1 | true — indent JSON output (compact by default)
       - status, tags, created_after, created_before — same filters as list
     """
     user = await require_current_user(request)
@@ -145,7 +163,7 @@ async def export_experiments(request: web.Request):
     )
 
     if fmt == "json":
-        body = _experiments_to_json(experiments)
+        body = _experiments_to_json(experiments, pretty=_wants_pretty(request))
         content_type = "application/json"
         filename = "experiments.json"
     else:
@@ -153,13 +171,7 @@ async def export_experiments(request: web.Request):
         content_type = "text/csv"
         filename = "experiments.csv"
 
-    return web.Response(
-        text=body,
-        content_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
-    )
+    return _download_response(body, content_type, filename)
 
 
 @routes.get("/api/v1/experiments/{experiment_id}/runs/export")
@@ -169,6 +181,7 @@ async def export_runs(request: web.Request):
     Query params:
       - project_id (required or from header)
       - format: csv | json (default csv)
+      - pretty: 1 | true — indent JSON output (compact by default)
       - status, tags, created_after, created_before — same filters as list
     """
     user = await require_current_user(request)
@@ -199,7 +212,7 @@ async def export_runs(request: web.Request):
     )
 
     if fmt == "json":
-        body = _runs_to_json(runs)
+        body = _runs_to_json(runs, pretty=_wants_pretty(request))
         content_type = "application/json"
         filename = f"runs_{experiment_id}.json"
     else:
@@ -207,10 +220,4 @@ async def export_runs(request: web.Request):
         content_type = "text/csv"
         filename = f"runs_{experiment_id}.csv"
 
-    return web.Response(
-        text=body,
-        content_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
-    )
+    return _download_response(body, content_type, filename)
@@ -21,6 +21,7 @@ import structlog
 from aiohttp import web
 
 from backend_common.db.pool import get_pool_service as get_pool
+from experiment_service.api.utils import json_response
 from experiment_service.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -57,4 +58,4 @@ async def health_check(_request: web.Request) -> web.Response:
         "db": db_info,
     }
 
-    return web.json_response(body, status=200 if db_ok else 503)
+    return json_response(body, status=200 if db_ok else 503)
@@ -4,7 +4,7 @@ from __future__ import annotations
 from aiohttp import web
 from pydantic import ValidationError
 
-from experiment_service.api.utils import parse_uuid, read_json
+from experiment_service.api.utils import json_response, parse_uuid, read_json
 from experiment_service.core.exceptions import NotFoundError
 from experiment_service.domain.dto import RunMetricPointDTO
 from experiment_service.services.dependencies import (
@@ -58,7 +58,7 @@ async def ingest_metrics(request: web.Request) -> web.Response:
         raise web.HTTPBadRequest(text=str(exc)) from exc
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response({"status": "accepted", "accepted": accepted}, status=202)
+    return json_response({"status": "accepted", "accepted": accepted}, status=202)
 
 
 @routes.get("/api/v1/runs/{run_id}/metrics")
@@ -96,7 +96,7 @@ async def query_metrics(request: web.Request) -> web.Response:
         )
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/runs/{run_id}/metrics/summary")
@@ -113,7 +113,7 @@ async def metrics_summary(request: web.Request) -> web.Response:
         payload = await service.get_summary(project_id, run_id, names=names)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/runs/{run_id}/metrics/aggregations")
@@ -149,4 +149,4 @@ async def metrics_aggregations(request: web.Request) -> web.Response:
         )
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(payload)
+    return json_response(payload)
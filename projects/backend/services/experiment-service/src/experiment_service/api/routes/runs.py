@@ -8,6 +8,7 @@ from aiohttp import web
 from pydantic import ValidationError
 
 from experiment_service.api.utils import (
+    json_response,
     paginated_response,
     pagination_params,
     parse_datetime,
@@ -91,13 +92,13 @@ async def list_runs(request: web.Request):
         created_before=created_before,
     )
     payload = paginated_response(
-        [_run_response(item) for item in runs],
+        runs,
         limit=limit,
         offset=offset,
         key="runs",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/experiments/{experiment_id}/runs")
@@ -147,7 +148,7 @@ async def create_run(request: web.Request):
             )
         except IdempotencyConflictError as exc:
             raise web.HTTPConflict(text=str(exc)) from exc
-    return web.json_response(response_payload, status=201)
+    return json_response(response_payload, status=201)
 
 
 @routes.get("/api/v1/runs/{run_id}")
@@ -161,7 +162,7 @@ async def get_run(request: web.Request):
         run = await service.get_run(project_id, run_id)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_run_response(run))
+    return json_response(_run_response(run))
 
 
 @routes.patch("/api/v1/runs/{run_id}")
@@ -219,7 +220,7 @@ async def update_run(request: web.Request):
                     "status": run.status.value,
                 },
             )
-    return web.json_response(_run_response(run))
+    return json_response(_run_response(run))
 
 
 @routes.post("/api/v1/runs:batch-status")
@@ -285,7 +286,7 @@ async def batch_update_status(request: web.Request):
                 },
             )
     response_runs = [_run_response(run) for run in updated_runs]
-    return web.json_response({"runs": response_runs})
+    return json_response({"runs": response_runs})
 
 
 @routes.post("/api/v1/runs:bulk-tags")
@@ -370,7 +371,7 @@ async def bulk_update_tags(request: web.Request):
             },
         )
 
-    return web.json_response({"runs": [_run_response(run) for run in updated]})
+    return json_response({"runs": [_run_response(run) for run in updated]})
 
 
 @routes.get("/api/v1/runs/{run_id}/events")
@@ -395,7 +396,7 @@ async def list_run_events(request: web.Request):
         key="events",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.delete("/api/v1/runs/{run_id}")
@@ -425,7 +426,7 @@ async def list_run_sensors(request: web.Request) -> web.Response:
     pool = await _get_pool()
     run_repo = RunRepository(pool)
     sensors = await run_repo.list_sensors(run_id)
-    return web.json_response({"sensors": [s.model_dump(mode="json") for s in sensors]})
+    return json_response({"sensors": [s.model_dump(mode="json") for s in sensors]})
 
 
 @routes.post("/api/v1/runs/{run_id}/sensors/{sensor_id}")
@@ -448,7 +449,7 @@ async def attach_run_sensor(request: web.Request) -> web.Response:
         created_by=user.user_id,
         mode=mode,
     )
-    return web.json_response(rs.model_dump(mode="json"), status=201)
+    return json_response(rs.model_dump(mode="json"), status=201)
 
 
 @routes.delete("/api/v1/runs/{run_id}/sensors/{sensor_id}")
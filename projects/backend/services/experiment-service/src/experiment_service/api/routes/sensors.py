@@ -7,6 +7,7 @@ from aiohttp import web
 from pydantic import ValidationError
 
 from experiment_service.api.utils import (
+    json_response,
     paginated_response,
     pagination_params,
     parse_datetime,
@@ -89,7 +90,7 @@ async def register_sensor(request: web.Request):
             201,
             payload,
         )
-    return web.json_response(payload, status=201)
+    return json_response(payload, status=201)
 
 
 def _parse_project_ids_header(header_value: str | None) -> list[UUID]:
@@ -151,13 +152,13 @@ async def list_sensors(request: web.Request):
             sensors, total = [], 0
 
     payload = paginated_response(
-        [_sensor_response(sensor) for sensor in sensors],
+        sensors,
         limit=limit,
         offset=offset,
         key="sensors",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.get("/api/v1/sensors/{sensor_id}")
@@ -171,7 +172,7 @@ async def get_sensor(request: web.Request):
         sensor = await service.get_sensor(project_id, sensor_id)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_sensor_response(sensor))
+    return json_response(_sensor_response(sensor))
 
 
 @routes.patch("/api/v1/sensors/{sensor_id}")
@@ -190,7 +191,7 @@ async def update_sensor(request: web.Request):
         sensor = await service.update_sensor(project_id, sensor_id, dto)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response(_sensor_response(sensor))
+    return json_response(_sensor_response(sensor))
 
 
 @routes.delete("/api/v1/sensors/{sensor_id}")
@@ -220,7 +221,7 @@ async def rotate_sensor_token(request: web.Request):
         sensor, token = await service.rotate_token(project_id, sensor_id)
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
-    return web.json_response({"sensor": _sensor_response(sensor), "token": token})
+    return json_response({"sensor": _sensor_response(sensor), "token": token})
 
 
 @routes.post("/api/v1/sensors/{sensor_id}/projects")
@@ -285,7 +286,7 @@ async def get_sensor_status_summary(request: web.Request):
     ensure_permission(user, "experiments.view")
     service = await get_sensor_service(request)
     summary = await service.get_status_summary(project_id)
-    return web.json_response(summary)
+    return json_response(summary)
 
 
 @routes.get("/api/v1/sensors/{sensor_id}/heartbeat-history")
@@ -307,7 +308,7 @@ async def get_sensor_heartbeat_history(request: web.Request):
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
     timestamps = await service.get_heartbeat_history(sensor_id, minutes)
-    return web.json_response(
+    return json_response(
         {
             "sensor_id": str(sensor_id),
             "timestamps": [ts.isoformat() for ts in timestamps],
@@ -328,6 +329,6 @@ async def get_sensor_projects(request: web.Request):
         project_ids = await service.get_sensor_projects(sensor_id)
         if not project_ids:
             raise web.HTTPNotFound(text="Sensor not found")
-        return web.json_response({"project_ids": [str(pid) for pid in project_ids]})
+        return json_response({"project_ids": [str(pid) for pid in project_ids]})
     except NotFoundError as exc:
         raise web.HTTPNotFound(text=str(exc)) from exc
@@ -1,29 +1,36 @@
-"""Telemetry data export endpoints (CSV / JSON) — streaming via aiohttp StreamResponse."""
+"""Telemetry data export endpoints (CSV / JSON / Arrow) — streaming via aiohttp StreamResponse."""
 from __future__ import annotations
 
-import csv
+import functools
 import io
-import json
 from uuid import UUID
 
+import orjson
 from aiohttp import web
 
 from backend_common.db.pool import get_pool_service as get_pool
 from experiment_service.api.utils import parse_uuid
-from experiment_service.core.exceptions import NotFoundError
 from experiment_service.middleware.export_rate_limit import ExportRateLimiter
+from experiment_service.repositories.base import iso_utc_sql
 from experiment_service.services.dependencies import (
     ensure_permission,
-    get_capture_session_service,
-    get_run_service,
     require_current_user,
     resolve_project_id,
 )
 from experiment_service.settings import settings
 
+try:
+    import pyarrow as pa  # type: ignore[import-untyped,import-not-found]
+
+    HAS_ARROW = True
+except ImportError:  # pragma: no cover
+    HAS_ARROW = False
+
 routes = web.RouteTableDef()
 
 STREAM_BATCH_SIZE = 5_000
+ARROW_BATCH_SIZE = 65_536
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
 
 _export_limiter = ExportRateLimiter(
     max_requests=settings.export_rate_limit_requests,
@@ -43,153 +50,286 @@ def _parse_value_mode(raw: str | None) -> str:
     return mode
 
 
-def _val(v) -> str:
-    return str(v) if v is not None else ""
+def _parse_format(raw: str | None) -> str:
+    fmt = (raw or "csv").lower()
+    if fmt in ("csv", "json") or (fmt == "arrow" and HAS_ARROW):
+        return fmt
+    if HAS_ARROW:
+        raise web.HTTPBadRequest(text="format must be csv, json, or arrow")
+    raise web.HTTPBadRequest(text="format must be csv or json")
 
 
-def _fval(v):
-    return float(v) if v is not None else None
+async def _ensure_run(conn, project_id: UUID, run_id: UUID) -> None:
+    # Existence probes run on the export's own connection, so a request costs
+    # one pool checkout instead of one per lookup plus one for the stream.
+    found = await conn.fetchval(
+        "SELECT 1 FROM runs WHERE project_id = $1 AND id = $2", project_id, run_id,
+    )
+    if found is None:
+        raise web.HTTPNotFound(text="Run not found")
+
+
+_RUN_SESSION_EXISTS_QUERY = """
+    SELECT
+        EXISTS (SELECT 1 FROM runs WHERE project_id = $1 AND id = $2) AS run_found,
+        EXISTS (
+            SELECT 1 FROM capture_sessions
+            WHERE project_id = $1 AND run_id = $2 AND id = $3
+        ) AS session_found
+"""
+
+
+async def _ensure_run_session(
+    conn, project_id: UUID, run_id: UUID, session_id: UUID,
+) -> None:
+    """Check the run and its capture session in a single round-trip."""
+    row = await conn.fetchrow(_RUN_SESSION_EXISTS_QUERY, project_id, run_id, session_id)
+    if not row["run_found"]:
+        raise web.HTTPNotFound(text="Run not found")
+    if not row["session_found"]:
+        raise web.HTTPNotFound(text="Capture session not found")
+
+
+# UUIDs are cast to text so asyncpg hands back str and orjson writes them
+# without a per-value Python hook.
+_RAW_COLUMNS = """
+            timestamp, sensor_id::text AS sensor_id, signal,
+            raw_value, physical_value,
+            conversion_status, capture_session_id::text AS capture_session_id"""
 
+_AGG_COLUMNS = """
+            bucket, sensor_id::text AS sensor_id, signal,
+            capture_session_id::text AS capture_session_id,
+            sample_count,
+            avg_raw, min_raw, max_raw,
+            avg_physical, min_physical, max_physical"""
 
-def _build_raw_query(
-    capture_session_ids: list[UUID],
+
+@functools.lru_cache(maxsize=None)
+def _raw_csv_columns(value_mode: str) -> str:
+    """Projection for COPY ... CSV: aliases double as the header row.
+
+    They shadow the source columns, hence the qualified ORDER BY below.
+    """
+    columns = [f'{iso_utc_sql("timestamp")} AS "timestamp"', "sensor_id", "signal"]
+    if value_mode in ("raw", "both"):
+        columns.append("raw_value")
+    if value_mode in ("physical", "both"):
+        columns.append("physical_value")
+    columns.extend(["conversion_status", "capture_session_id"])
+    return ", ".join(columns)
+
+
+_AGG_CSV_COLUMNS = (
+    f"{iso_utc_sql('bucket')} AS bucket, sensor_id, signal, capture_session_id, "
+    "coalesce(sample_count, 0) AS sample_count, "
+    "avg_raw, min_raw, max_raw, avg_physical, min_physical, max_physical"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _raw_arrow_layout(value_mode: str) -> tuple[str, pa.Schema]:
+    """Projection and schema for format=arrow.
+
+    UUIDs and the status enum are cast to text in SQL, so each batch converts
+    column-wise without per-value Python calls.
+    """
+    layout = [
+        ("timestamp", "timestamp", pa.timestamp("us", tz="UTC")),
+        ("sensor_id", "sensor_id::text", pa.string()),
+        ("signal", "signal", pa.string()),
+    ]
+    if value_mode in ("raw", "both"):
+        layout.append(("raw_value", "raw_value", pa.float64()))
+    if value_mode in ("physical", "both"):
+        layout.append(("physical_value", "physical_value", pa.float64()))
+    layout.extend([
+        ("conversion_status", "conversion_status::text", pa.string()),
+        ("capture_session_id", "capture_session_id::text", pa.string()),
+    ])
+    return _arrow_projection(layout)
+
+
+@functools.lru_cache(maxsize=None)
+def _agg_arrow_layout() -> tuple[str, pa.Schema]:
+    """Projection and schema for format=arrow with aggregation=1m."""
+    layout = [
+        ("bucket", "bucket", pa.timestamp("us", tz="UTC")),
+        ("sensor_id", "sensor_id::text", pa.string()),
+        ("signal", "signal", pa.string()),
+        ("capture_session_id", "capture_session_id::text", pa.string()),
+        ("sample_count", "coalesce(sample_count, 0)", pa.int64()),
+    ]
+    layout.extend(
+        (name, name, pa.float64())
+        for name in (
+            "avg_raw", "min_raw", "max_raw",
+            "avg_physical", "min_physical", "max_physical",
+        )
+    )
+    return _arrow_projection(layout)
+
+
+def _arrow_projection(layout: list[tuple[str, str, pa.DataType]]) -> tuple[str, pa.Schema]:
+    columns = ", ".join(f'{expr} AS "{name}"' for name, expr, _ in layout)
+    schema = pa.schema([(name, type_) for name, _, type_ in layout])
+    return columns, schema
+
+
+@functools.lru_cache(maxsize=128)
+def _export_query(
+    table: str,
+    order_by: str,
+    columns: str,
     *,
-    sensor_id: UUID | None = None,
-    signal: str | None = None,
-    include_late: bool = True,
-) -> tuple[str, list]:
-    conditions = ["capture_session_id = ANY($1::uuid[])"]
-    params: list = [capture_session_ids]
-    idx = 2
+    by_run: bool,
+    has_sensor: bool,
+    has_signal: bool,
+    exclude_late: bool = False,
+) -> str:
+    """SQL text for one filter shape.
+
+    Parameters: the session ids (``$1``) or, with ``by_run``, project and run
+    id (``$1``, ``$2``), then sensor id and signal when present.  Cached so
+    every request of a shape sends the same text, which keeps asyncpg's
+    prepared-statement cache warm.
+    """
+    if by_run:
+        conditions = [
+            "capture_session_id IN ("
+            "SELECT id FROM capture_sessions WHERE project_id = $1 AND run_id = $2)"
+        ]
+        idx = 3
+    else:
+        conditions = ["capture_session_id = ANY($1::uuid[])"]
+        idx = 2
 
-    if not include_late:
+    if exclude_late:
         conditions.append(
             "NOT coalesce((meta->'__system'->>'late')::boolean, false)"
         )
 
-    if sensor_id is not None:
+    if has_sensor:
         conditions.append(f"sensor_id = ${idx}")
-        params.append(sensor_id)
         idx += 1
 
-    if signal is not None:
+    if has_signal:
         conditions.append(f"signal = ${idx}")
-        params.append(signal)
         idx += 1
 
     where = " AND ".join(conditions)
-    query = f"""
-        SELECT
-            timestamp, sensor_id, signal,
-            raw_value, physical_value,
-            conversion_status, capture_session_id
-        FROM telemetry_records
+    return f"""
+        SELECT {columns}
+        FROM {table}
         WHERE {where}
-        ORDER BY timestamp ASC
+        ORDER BY {order_by} ASC
     """
-    return query, params
 
 
-def _build_agg_query(
-    capture_session_ids: list[UUID],
+def _export_params(
+    capture_session_ids: list[UUID] | None,
+    run_scope: tuple[UUID, UUID] | None,
+    sensor_id: UUID | None,
+    signal: str | None,
+) -> list:
+    """Parameters in the order _export_query numbers them."""
+    if capture_session_ids is not None:
+        params: list = [capture_session_ids]
+    elif run_scope is not None:
+        params = list(run_scope)
+    else:
+        raise ValueError("capture_session_ids or run_scope is required")
+    if sensor_id is not None:
+        params.append(sensor_id)
+    if signal is not None:
+        params.append(signal)
+    return params
+
+
+def _build_raw_query(
+    capture_session_ids: list[UUID] | None,
     *,
+    run_scope: tuple[UUID, UUID] | None = None,
     sensor_id: UUID | None = None,
     signal: str | None = None,
+    include_late: bool = True,
+    columns: str = _RAW_COLUMNS,
 ) -> tuple[str, list]:
-    conditions = ["capture_session_id = ANY($1::uuid[])"]
-    params: list = [capture_session_ids]
-    idx = 2
+    """Session ids select the exported sessions; without them ``run_scope`` =
+    (project_id, run_id) selects every session of the run inside the query."""
+    query = _export_query(
+        "telemetry_records", "telemetry_records.timestamp", columns,
+        by_run=capture_session_ids is None,
+        has_sensor=sensor_id is not None,
+        has_signal=signal is not None,
+        exclude_late=not include_late,
+    )
+    return query, _export_params(capture_session_ids, run_scope, sensor_id, signal)
 
-    if sensor_id is not None:
-        conditions.append(f"sensor_id = ${idx}")
-        params.append(sensor_id)
-        idx += 1
 
-    if signal is not None:
-        conditions.append(f"signal = ${idx}")
-        params.append(signal)
-        idx += 1
-
-    where = " AND ".join(conditions)
-    query = f"""
-        SELECT
-            bucket, sensor_id, signal, capture_session_id,
-            sample_count,
-            avg_raw, min_raw, max_raw,
-            avg_physical, min_physical, max_physical
-        FROM telemetry_1m
-        WHERE {where}
-        ORDER BY bucket ASC
-    """
-    return query, params
+def _build_agg_query(
+    capture_session_ids: list[UUID] | None,
+    *,
+    run_scope: tuple[UUID, UUID] | None = None,
+    sensor_id: UUID | None = None,
+    signal: str | None = None,
+    columns: str = _AGG_COLUMNS,
+) -> tuple[str, list]:
+    query = _export_query(
+        "telemetry_1m", "telemetry_1m.bucket", columns,
+        by_run=capture_session_ids is None,
+        has_sensor=sensor_id is not None,
+        has_signal=signal is not None,
+    )
+    return query, _export_params(capture_session_ids, run_scope, sensor_id, signal)
 
 
 # ---------------------------------------------------------------------------
-# Row formatters (used inside streaming helpers)
+# JSON row formatters (CSV is formatted by PostgreSQL, see _stream_csv)
 # ---------------------------------------------------------------------------
 
 
-def _write_raw_csv_row(writer, row, value_mode: str) -> None:
-    line = [
-        row["timestamp"].isoformat() if row["timestamp"] else "",
-        str(row["sensor_id"]),
-        row["signal"] or "",
-    ]
-    if value_mode in ("raw", "both"):
-        line.append(_val(row["raw_value"]))
-    if value_mode in ("physical", "both"):
-        line.append(_val(row["physical_value"]))
-    line.extend([
-        row["conversion_status"] or "",
-        str(row["capture_session_id"]) if row["capture_session_id"] else "",
-    ])
-    writer.writerow(line)
+# The JSON dicts keep datetimes as-is: orjson formats them itself (same
+# text as isoformat()); UUIDs already arrive as text, see _RAW_COLUMNS.
+# Rows are unpacked positionally (column order of _RAW_COLUMNS/_AGG_COLUMNS),
+# which skips the per-field name lookup on the Record.  Value columns (and
+# their 1m aggregates) are double precision, already float or None.
+def _raw_row_formatter(value_mode: str):
+    """Return a row -> dict callable with the value_mode checks resolved once."""
+    want_raw = value_mode in ("raw", "both")
+    want_physical = value_mode in ("physical", "both")
 
+    def to_dict(row) -> dict:
+        timestamp, sensor_id, signal, raw_value, physical_value, status, session_id = row
+        item: dict = {"timestamp": timestamp, "sensor_id": sensor_id, "signal": signal}
+        if want_raw:
+            item["raw_value"] = raw_value
+        if want_physical:
+            item["physical_value"] = physical_value
+        item["conversion_status"] = status
+        item["capture_session_id"] = session_id
+        return item
 
-def _raw_row_to_dict(row, value_mode: str) -> dict:
-    item: dict = {
-        "timestamp": row["timestamp"].isoformat() if row["timestamp"] else None,
-        "sensor_id": str(row["sensor_id"]),
-        "signal": row["signal"],
-    }
-    if value_mode in ("raw", "both"):
-        item["raw_value"] = _fval(row["raw_value"])
-    if value_mode in ("physical", "both"):
-        item["physical_value"] = _fval(row["physical_value"])
-    item["conversion_status"] = row["conversion_status"]
-    item["capture_session_id"] = (
-        str(row["capture_session_id"]) if row["capture_session_id"] else None
-    )
-    return item
-
-
-def _write_agg_csv_row(writer, row) -> None:
-    writer.writerow([
-        row["bucket"].isoformat() if row["bucket"] else "",
-        str(row["sensor_id"]),
-        row["signal"] or "",
-        str(row["capture_session_id"]) if row["capture_session_id"] else "",
-        row["sample_count"] or 0,
-        _val(row["avg_raw"]), _val(row["min_raw"]), _val(row["max_raw"]),
-        _val(row["avg_physical"]), _val(row["min_physical"]), _val(row["max_physical"]),
-    ])
+    return to_dict
 
 
 def _agg_row_to_dict(row) -> dict:
+    (
+        bucket, sensor_id, signal, session_id, sample_count,
+        avg_raw, min_raw, max_raw, avg_physical, min_physical, max_physical,
+    ) = row
     return {
-        "bucket": row["bucket"].isoformat() if row["bucket"] else None,
-        "sensor_id": str(row["sensor_id"]),
-        "signal": row["signal"],
-        "capture_session_id": (
-            str(row["capture_session_id"]) if row["capture_session_id"] else None
-        ),
-        "sample_count": row["sample_count"] or 0,
-        "avg_raw": _fval(row["avg_raw"]),
-        "min_raw": _fval(row["min_raw"]),
-        "max_raw": _fval(row["max_raw"]),
-        "avg_physical": _fval(row["avg_physical"]),
-        "min_physical": _fval(row["min_physical"]),
-        "max_physical": _fval(row["max_physical"]),
+        "bucket": bucket,
+        "sensor_id": sensor_id,
+        "signal": signal,
+        "capture_session_id": session_id,
+        "sample_count": sample_count or 0,
+        "avg_raw": avg_raw,
+        "min_raw": min_raw,
+        "max_raw": max_raw,
+        "avg_physical": avg_physical,
+        "min_physical": min_physical,
+        "max_physical": max_physical,
     }
 
 
@@ -198,43 +338,36 @@ def _agg_row_to_dict(row) -> dict:
 # ---------------------------------------------------------------------------
 
 
+async def _start_download(
+    request: web.Request, content_type: str, filename: str,
+) -> web.StreamResponse:
+    response = web.StreamResponse()
+    response.content_type = content_type
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    # Coding negotiated from Accept-Encoding (gzip/deflate); telemetry text is
+    # highly repetitive and shrinks several-fold.  No-op for clients without it.
+    response.enable_compression()
+    await response.prepare(request)
+    return response
+
+
 async def _stream_csv(
     request: web.Request,
-    pool,
+    conn,
     query: str,
     params: list,
     filename: str,
-    header: list[str],
-    row_fn,  # callable(writer, row) -> None
 ) -> web.StreamResponse:
-    response = web.StreamResponse()
-    response.content_type = "text/csv"
-    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
-    await response.prepare(request)
+    """Stream ``COPY (query) TO STDOUT`` output as the response body.
 
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(header)
-    await response.write(buf.getvalue().encode())
+    PostgreSQL formats the CSV (header from the column aliases) and the
+    chunks are forwarded as they arrive, so no row is decoded in Python.
+    """
+    response = await _start_download(request, "text/csv", filename)
 
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            batch: list = []
-            async for row in conn.cursor(query, *params, prefetch=STREAM_BATCH_SIZE):
-                batch.append(row)
-                if len(batch) >= STREAM_BATCH_SIZE:
-                    buf = io.StringIO()
-                    writer = csv.writer(buf)
-                    for r in batch:
-                        row_fn(writer, r)
-                    await response.write(buf.getvalue().encode())
-                    batch = []
-            if batch:
-                buf = io.StringIO()
-                writer = csv.writer(buf)
-                for r in batch:
-                    row_fn(writer, r)
-                await response.write(buf.getvalue().encode())
+    await conn.copy_from_query(
+        query, *params, output=response.write, format="csv", header=True,
+    )
 
     await response.write_eof()
     return response
@@ -242,30 +375,65 @@ async def _stream_csv(
 
 async def _stream_json(
     request: web.Request,
-    pool,
+    conn,
     query: str,
     params: list,
     filename: str,
     row_fn,  # callable(row) -> dict
 ) -> web.StreamResponse:
-    response = web.StreamResponse()
-    response.content_type = "application/json"
-    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
-    await response.prepare(request)
+    response = await _start_download(request, "application/json", filename)
 
-    await response.write(b"[")
+    # Rows come off the cursor STREAM_BATCH_SIZE at a time and their items are
+    # joined per batch, so the array goes out in a few large writes instead of
+    # one per row.
+    chunks: list[bytes] = [b"["]
     first = True
+    async with conn.transaction():
+        async for row in conn.cursor(query, *params, prefetch=STREAM_BATCH_SIZE):
+            chunks.append(b"\n  " if first else b",\n  ")
+            chunks.append(orjson.dumps(row_fn(row)))
+            first = False
+            if len(chunks) >= 2 * STREAM_BATCH_SIZE:
+                await response.write(b"".join(chunks))
+                chunks = []
+    chunks.append(b"]" if first else b"\n]")
+    await response.write(b"".join(chunks))
+
+    await response.write_eof()
+    return response
 
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            async for row in conn.cursor(query, *params, prefetch=STREAM_BATCH_SIZE):
-                chunk = ("\n  " if first else ",\n  ") + json.dumps(
-                    row_fn(row), ensure_ascii=False
-                )
-                await response.write(chunk.encode())
-                first = False
 
-    await response.write(b"]" if first else b"\n]")
+async def _stream_arrow(
+    request: web.Request,
+    conn,
+    query: str,
+    params: list,
+    filename: str,
+    schema: pa.Schema,
+) -> web.StreamResponse:
+    """Stream rows as an Arrow IPC stream, one record batch per ARROW_BATCH_SIZE rows."""
+    response = await _start_download(request, ARROW_CONTENT_TYPE, filename)
+
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    async def flush() -> None:
+        await response.write(sink.getvalue())
+        sink.seek(0)
+        sink.truncate()
+
+    async with conn.transaction():
+        cursor = await conn.cursor(query, *params)
+        while records := await cursor.fetch(ARROW_BATCH_SIZE):
+            arrays = [
+                pa.array(values, type=field.type)
+                for values, field in zip(zip(*records), schema)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            await flush()
+    writer.close()
+    await flush()
+
     await response.write_eof()
     return response
 
@@ -283,7 +451,7 @@ async def export_session_telemetry(request: web.Request):
 
     Query params:
       - project_id (required or from header)
-      - format: csv | json (default csv)
+      - format: csv | json | arrow (default csv; arrow needs pyarrow installed)
       - sensor_id: filter by sensor (optional)
       - signal: filter by signal name (optional)
       - include_late: true | false (default true)
@@ -300,20 +468,7 @@ async def export_session_telemetry(request: web.Request):
     run_id = parse_uuid(request.match_info["run_id"], "run_id")
     session_id = parse_uuid(request.match_info["session_id"], "session_id")
 
-    run_service = await get_run_service(request)
-    try:
-        await run_service.get_run(project_id, run_id)
-    except NotFoundError as exc:
-        raise web.HTTPNotFound(text=str(exc)) from exc
-    cs_service = await get_capture_session_service(request)
-    try:
-        await cs_service.get_session(project_id, session_id)
-    except NotFoundError as exc:
-        raise web.HTTPNotFound(text=str(exc)) from exc
-
-    fmt = request.rel_url.query.get("format", "csv").lower()
-    if fmt not in ("csv", "json"):
-        raise web.HTTPBadRequest(text="format must be csv or json")
+    fmt = _parse_format(request.rel_url.query.get("format"))
 
     value_mode = _parse_value_mode(request.rel_url.query.get("raw_or_physical"))
     include_late = (
@@ -325,40 +480,48 @@ async def export_session_telemetry(request: web.Request):
     signal_filter = request.rel_url.query.get("signal") or None
 
     pool = await get_pool()
+    async with pool.acquire() as conn:
+        await _ensure_run_session(conn, project_id, run_id, session_id)
 
-    if aggregation == "1m":
-        query, params = _build_agg_query(
-            [session_id], sensor_id=sensor_id, signal=signal_filter,
-        )
-        filename = f"telemetry_agg_{session_id}.{fmt}"
+        if aggregation == "1m":
+            filename = f"telemetry_agg_{session_id}.{fmt}"
+            if fmt == "json":
+                query, params = _build_agg_query(
+                    [session_id], sensor_id=sensor_id, signal=signal_filter,
+                )
+                return await _stream_json(request, conn, query, params, filename, _agg_row_to_dict)
+            if fmt == "arrow":
+                columns, schema = _agg_arrow_layout()
+                query, params = _build_agg_query(
+                    [session_id], sensor_id=sensor_id, signal=signal_filter, columns=columns,
+                )
+                return await _stream_arrow(request, conn, query, params, filename, schema)
+            query, params = _build_agg_query(
+                [session_id], sensor_id=sensor_id, signal=signal_filter,
+                columns=_AGG_CSV_COLUMNS,
+            )
+            return await _stream_csv(request, conn, query, params, filename)
+
+        filename = f"telemetry_{session_id}.{fmt}"
         if fmt == "json":
-            return await _stream_json(request, pool, query, params, filename, _agg_row_to_dict)
-        header = [
-            "bucket", "sensor_id", "signal", "capture_session_id", "sample_count",
-            "avg_raw", "min_raw", "max_raw",
-            "avg_physical", "min_physical", "max_physical",
-        ]
-        return await _stream_csv(request, pool, query, params, filename, header, _write_agg_csv_row)
-
-    query, params = _build_raw_query(
-        [session_id], sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
-    )
-    filename = f"telemetry_{session_id}.{fmt}"
-    if fmt == "json":
-        return await _stream_json(
-            request, pool, query, params, filename,
-            lambda row: _raw_row_to_dict(row, value_mode),
+            query, params = _build_raw_query(
+                [session_id], sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
+            )
+            return await _stream_json(
+                request, conn, query, params, filename, _raw_row_formatter(value_mode),
+            )
+        if fmt == "arrow":
+            columns, schema = _raw_arrow_layout(value_mode)
+            query, params = _build_raw_query(
+                [session_id], sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
+                columns=columns,
+            )
+            return await _stream_arrow(request, conn, query, params, filename, schema)
+        query, params = _build_raw_query(
+            [session_id], sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
+            columns=_raw_csv_columns(value_mode),
         )
-    csv_header = ["timestamp", "sensor_id", "signal"]
-    if value_mode in ("raw", "both"):
-        csv_header.append("raw_value")
-    if value_mode in ("physical", "both"):
-        csv_header.append("physical_value")
-    csv_header.extend(["conversion_status", "capture_session_id"])
-    return await _stream_csv(
-        request, pool, query, params, filename, csv_header,
-        lambda writer, row: _write_raw_csv_row(writer, row, value_mode),
-    )
+        return await _stream_csv(request, conn, query, params, filename)
 
 
 @routes.get("/api/v1/runs/{run_id}/telemetry/export")
@@ -367,7 +530,7 @@ async def export_run_telemetry(request: web.Request):
 
     Query params:
       - project_id (required or from header)
-      - format: csv | json (default csv)
+      - format: csv | json | arrow (default csv; arrow needs pyarrow installed)
       - capture_session_id: filter to specific session (optional)
       - sensor_id: filter by sensor (optional)
       - signal: filter by signal name (optional)
@@ -383,15 +546,8 @@ async def export_run_telemetry(request: web.Request):
     ensure_permission(user, "experiments.view")
 
     run_id = parse_uuid(request.match_info["run_id"], "run_id")
-    run_service = await get_run_service(request)
-    try:
-        await run_service.get_run(project_id, run_id)
-    except NotFoundError as exc:
-        raise web.HTTPNotFound(text=str(exc)) from exc
 
-    fmt = request.rel_url.query.get("format", "csv").lower()
-    if fmt not in ("csv", "json"):
-        raise web.HTTPBadRequest(text="format must be csv or json")
+    fmt = _parse_format(request.rel_url.query.get("format"))
 
     value_mode = _parse_value_mode(request.rel_url.query.get("raw_or_physical"))
     include_late = (
@@ -402,59 +558,63 @@ async def export_run_telemetry(request: web.Request):
     sensor_id = parse_uuid(sensor_id_raw, "sensor_id") if sensor_id_raw else None
     signal_filter = request.rel_url.query.get("signal") or None
 
-    # Resolve capture session IDs
+    # Either the one requested session, or all sessions of the run, looked up
+    # by the telemetry query itself (no separate session listing round-trip).
     cs_filter_raw = request.rel_url.query.get("capture_session_id")
-    if cs_filter_raw:
-        session_ids = [parse_uuid(cs_filter_raw, "capture_session_id")]
-    else:
-        cs_service = await get_capture_session_service(request)
-        sessions, _total = await cs_service.list_sessions_for_run(
-            project_id, run_id, limit=500, offset=0,
-        )
-        session_ids = [s.id for s in sessions]
-
-    if not session_ids:
-        content_type = "application/json" if fmt == "json" else "text/csv"
-        return web.Response(
-            text="[]" if fmt == "json" else "",
-            content_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="telemetry_run_{run_id}.{fmt}"',
-            },
-        )
+    session_id = parse_uuid(cs_filter_raw, "capture_session_id") if cs_filter_raw else None
+    session_ids = [session_id] if session_id is not None else None
+    run_scope = (project_id, run_id)
 
     pool = await get_pool()
-
-    if aggregation == "1m":
-        query, params = _build_agg_query(
-            session_ids, sensor_id=sensor_id, signal=signal_filter,
-        )
-        filename = f"telemetry_run_{run_id}_agg.{fmt}"
+    async with pool.acquire() as conn:
+        if session_id is not None:
+            # The query filters by session id alone, so the session must be
+            # checked to belong to this run (and project) first.
+            await _ensure_run_session(conn, project_id, run_id, session_id)
+        else:
+            await _ensure_run(conn, project_id, run_id)
+
+        if aggregation == "1m":
+            filename = f"telemetry_run_{run_id}_agg.{fmt}"
+            if fmt == "json":
+                query, params = _build_agg_query(
+                    session_ids, run_scope=run_scope,
+                    sensor_id=sensor_id, signal=signal_filter,
+                )
+                return await _stream_json(request, conn, query, params, filename, _agg_row_to_dict)
+            if fmt == "arrow":
+                columns, schema = _agg_arrow_layout()
+                query, params = _build_agg_query(
+                    session_ids, run_scope=run_scope,
+                    sensor_id=sensor_id, signal=signal_filter, columns=columns,
+                )
+                return await _stream_arrow(request, conn, query, params, filename, schema)
+            query, params = _build_agg_query(
+                session_ids, run_scope=run_scope,
+                sensor_id=sensor_id, signal=signal_filter, columns=_AGG_CSV_COLUMNS,
+            )
+            return await _stream_csv(request, conn, query, params, filename)
+
+        filename = f"telemetry_run_{run_id}.{fmt}"
         if fmt == "json":
-            return await _stream_json(request, pool, query, params, filename, _agg_row_to_dict)
-        header = [
-            "bucket", "sensor_id", "signal", "capture_session_id", "sample_count",
-            "avg_raw", "min_raw", "max_raw",
-            "avg_physical", "min_physical", "max_physical",
-        ]
-        return await _stream_csv(request, pool, query, params, filename, header, _write_agg_csv_row)
-
-    query, params = _build_raw_query(
-        session_ids, sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
-    )
-    filename = f"telemetry_run_{run_id}.{fmt}"
-    if fmt == "json":
-        return await _stream_json(
-            request, pool, query, params, filename,
-            lambda row: _raw_row_to_dict(row, value_mode),
+            query, params = _build_raw_query(
+                session_ids, run_scope=run_scope,
+                sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
+            )
+            return await _stream_json(
+                request, conn, query, params, filename, _raw_row_formatter(value_mode),
+            )
+        if fmt == "arrow":
+            columns, schema = _raw_arrow_layout(value_mode)
+            query, params = _build_raw_query(
+                session_ids, run_scope=run_scope,
+                sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
+                columns=columns,
+            )
+            return await _stream_arrow(request, conn, query, params, filename, schema)
+        query, params = _build_raw_query(
+            session_ids, run_scope=run_scope,
+            sensor_id=sensor_id, signal=signal_filter, include_late=include_late,
+            columns=_raw_csv_columns(value_mode),
         )
-    csv_header = ["timestamp", "sensor_id", "signal"]
-    if value_mode in ("raw", "both"):
-        csv_header.append("raw_value")
-    if value_mode in ("physical", "both"):
-        csv_header.append("physical_value")
-    csv_header.extend(["conversion_status", "capture_session_id"])
-    return await _stream_csv(
-        request, pool, query, params, filename, csv_header,
-        lambda writer, row: _write_raw_csv_row(writer, row, value_mode),
-    )
+        return await _stream_csv(request, conn, query, params, filename)
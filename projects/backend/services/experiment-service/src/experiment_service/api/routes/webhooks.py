@@ -4,7 +4,7 @@ from __future__ import annotations
 from aiohttp import web
 from pydantic import BaseModel, Field, ValidationError
 
-from experiment_service.api.utils import paginated_response, pagination_params, parse_uuid, read_json
+from experiment_service.api.utils import json_response, paginated_response, pagination_params, parse_uuid, read_json
 from experiment_service.core.exceptions import NotFoundError
 from experiment_service.services.dependencies import (
     ensure_permission,
@@ -37,7 +37,7 @@ async def list_webhooks(request: web.Request):
         key="webhooks",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/webhooks")
@@ -64,7 +64,7 @@ async def create_webhook(request: web.Request):
         event_types=event_types,
         secret=dto.secret,
     )
-    return web.json_response(sub.model_dump(mode="json"), status=201)
+    return json_response(sub.model_dump(mode="json"), status=201)
 
 
 @routes.delete("/api/v1/webhooks/{webhook_id}")
@@ -97,7 +97,7 @@ async def list_webhook_deliveries(request: web.Request):
         key="deliveries",
         total=total,
     )
-    return web.json_response(payload)
+    return json_response(payload)
 
 
 @routes.post("/api/v1/webhooks/deliveries/{delivery_id}:retry")
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 from typing import Any
+from uuid import UUID
+
+import orjson
+from aiohttp import web
+from pydantic import BaseModel
 
 # Re-export shared utilities from backend_common so existing imports keep working.
 from backend_common.aiohttp_app import read_json as read_json  # noqa: F401
@@ -35,3 +40,21 @@ def paginated_response(
         "page_size": limit,
     }
 
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, UUID):
+        # asyncpg отдаёт uuid как свой подкласс uuid.UUID, а orjson
+        # сериализует только точный тип.
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_response(data: Any, *, status: int = 200) -> web.Response:
+    """Serialize ``data`` (pydantic models included) with orjson."""
+    return web.Response(
+        body=orjson.dumps(data, default=_orjson_default, option=orjson.OPT_UTC_Z),
+        status=status,
+        content_type="application/json",
+    )
@@ -1,11 +1,12 @@
 """Pydantic models representing key domain entities."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from experiment_service.domain.enums import (
     CaptureSessionStatus,
@@ -17,8 +18,14 @@ from experiment_service.domain.enums import (
     TelemetryConversionStatus,
 )
 
+# Entities loaded from the DB are read-only snapshots: no assignment
+# validation, and extra columns from joins/window functions are dropped.
+_ENTITY_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
 
 class Experiment(BaseModel):
+    model_config = _ENTITY_CONFIG
+
     id: UUID
     project_id: UUID
     name: str
@@ -32,8 +39,28 @@ class Experiment(BaseModel):
     updated_at: datetime
     archived_at: datetime | None = None
 
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> "Experiment":
+        """Build from a trusted DB row (JSONB columns already decoded)."""
+        return cls.model_construct(
+            id=record["id"],
+            project_id=record["project_id"],
+            name=record["name"],
+            description=record["description"],
+            experiment_type=record["experiment_type"],
+            tags=list(record["tags"] or []),
+            metadata=record["metadata"] or {},
+            status=ExperimentStatus(record["status"]),
+            owner_id=record["owner_id"],
+            created_at=record["created_at"],
+            updated_at=record["updated_at"],
+            archived_at=record["archived_at"],
+        )
+
 
 class Run(BaseModel):
+    model_config = _ENTITY_CONFIG
+
     id: UUID
     experiment_id: UUID
     project_id: UUID
@@ -53,6 +80,30 @@ class Run(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> "Run":
+        """Build from a trusted DB row (JSONB columns already decoded)."""
+        return cls.model_construct(
+            id=record["id"],
+            experiment_id=record["experiment_id"],
+            project_id=record["project_id"],
+            created_by=record["created_by"],
+            name=record["name"],
+            params=record["params"],
+            git_sha=record["git_sha"],
+            env=record["env"],
+            notes=record["notes"],
+            tags=list(record["tags"] or []),
+            metadata=record["metadata"] or {},
+            status=RunStatus(record["status"]),
+            started_at=record["started_at"],
+            finished_at=record["finished_at"],
+            duration_seconds=record["duration_seconds"],
+            auto_complete_after_minutes=record["auto_complete_after_minutes"],
+            created_at=record["created_at"],
+            updated_at=record["updated_at"],
+        )
+
 
 class RunSensor(BaseModel):
     run_id: UUID
@@ -65,6 +116,8 @@ class RunSensor(BaseModel):
 
 
 class CaptureSession(BaseModel):
+    model_config = _ENTITY_CONFIG
+
     id: UUID
     run_id: UUID
     project_id: UUID
@@ -78,8 +131,33 @@ class CaptureSession(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> "CaptureSession":
+        """Build from a trusted DB row without re-running field validation.
+
+        asyncpg already decodes UUID/timestamp columns into the right Python
+        types; only the status needs converting to the enum.  Extra columns
+        (e.g. ``total_count``) are ignored.
+        """
+        return cls.model_construct(
+            id=record["id"],
+            run_id=record["run_id"],
+            project_id=record["project_id"],
+            ordinal_number=record["ordinal_number"],
+            started_at=record["started_at"],
+            stopped_at=record["stopped_at"],
+            status=CaptureSessionStatus(record["status"]),
+            initiated_by=record["initiated_by"],
+            notes=record["notes"],
+            archived=record["archived"],
+            created_at=record["created_at"],
+            updated_at=record["updated_at"],
+        )
+
 
 class Sensor(BaseModel):
+    model_config = _ENTITY_CONFIG
+
     id: UUID
     project_id: UUID
     name: str
@@ -97,6 +175,8 @@ class Sensor(BaseModel):
 
 
 class ConversionProfile(BaseModel):
+    model_config = _ENTITY_CONFIG
+
     id: UUID
     sensor_id: UUID
     project_id: UUID
@@ -13,11 +13,15 @@ from aiohttp.web import middleware
 from aiohttp.web_response import StreamResponse
 
 from experiment_service.services.audit_client import AuditClient
+from experiment_service.services.dependencies import USER_CONTEXT_KEY, UserContext
 
 logger = structlog.get_logger(__name__)
 
 _AUDIT_CLIENT_KEY = "audit_client"
 
+# Only these methods can produce an audit entry; checked before anything else.
+_MUTATING_METHODS: frozenset[str] = frozenset({"POST", "PATCH", "PUT", "DELETE"})
+
 # (METHOD, resource_canonical) → (target_type, action)
 _AUDIT_MAP: dict[tuple[str, str], tuple[str, str]] = {
     ("POST",   "/api/v1/experiments"):                                         ("experiment",       "experiment.create"),
@@ -73,7 +77,7 @@ async def audit_middleware(  # type: ignore[misc]
     response = await handler(request)
 
     # Only audit successful mutating requests
-    if request.method not in ("POST", "PATCH", "PUT", "DELETE"):
+    if request.method not in _MUTATING_METHODS:
         return response
     if response.status >= 400:
         return response
@@ -92,23 +96,29 @@ async def audit_middleware(  # type: ignore[misc]
     if client is None:
         return response
 
-    # Extract user context from headers
-    user_id_str = request.headers.get("X-User-Id")
-    if not user_id_str:
-        return response
-    try:
-        actor_id = UUID(user_id_str)
-    except ValueError:
-        return response
-
-    # Project scope
-    project_id_str = request.headers.get("X-Project-Id")
-    scope_id: UUID | None = None
-    if project_id_str:
+    # Reuse the context parsed by require_current_user; fall back to headers.
+    user: UserContext | None = request.get(USER_CONTEXT_KEY)
+    scope_id: UUID | None
+    if user is not None:
+        actor_id = user.user_id
+        scope_id = user.active_project_id
+    else:
+        user_id_str = request.headers.get("X-User-Id")
+        if not user_id_str:
+            return response
         try:
-            scope_id = UUID(project_id_str)
+            actor_id = UUID(user_id_str)
         except ValueError:
-            pass
+            return response
+
+        # Project scope
+        project_id_str = request.headers.get("X-Project-Id")
+        scope_id = None
+        if project_id_str:
+            try:
+                scope_id = UUID(project_id_str)
+            except ValueError:
+                pass
 
     # Target entity ID from URL params
     id_param = _TARGET_ID_PARAMS.get(target_type)
@@ -1,7 +1,6 @@
 """Artifact repository layer."""
 from __future__ import annotations
 
-import json
 from typing import Any
 from uuid import UUID
 
@@ -21,11 +20,7 @@ class ArtifactRepository(BaseRepository):
 
     @staticmethod
     def _to_model(record: Record) -> Artifact:
-        payload = dict(record)
-        value = payload.get("metadata")
-        if isinstance(value, str):
-            payload["metadata"] = json.loads(value)
-        return Artifact.model_validate(payload)
+        return Artifact.model_validate(dict(record))
 
     async def create(
         self,
@@ -63,7 +58,7 @@ class ArtifactRepository(BaseRepository):
             uri,
             checksum,
             size_bytes,
-            json.dumps(metadata or {}),
+            metadata or {},
             created_by,
             is_restricted,
         )
@@ -105,17 +100,8 @@ class ArtifactRepository(BaseRepository):
             LIMIT ${idx} OFFSET ${idx + 1}
         """
         records = await self._fetch(query, *params)
-        items: list[Artifact] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            value = rec_dict.get("metadata")
-            if isinstance(value, str):
-                rec_dict["metadata"] = json.loads(value)
-            items.append(Artifact.model_validate(rec_dict))
+        items = [self._to_model(rec) for rec in records]
+        total: int | None = int(records[0]["total_count"]) if records else None
         if total is None:
             count_params = params[: -(2)]
             record = await self._fetchrow(
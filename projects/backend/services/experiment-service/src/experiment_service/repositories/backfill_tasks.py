@@ -62,23 +62,28 @@ class BackfillTaskRepository(BaseRepository):
         )
         return [dict(r) for r in rows], total
 
-    async def claim_pending(self) -> dict[str, Any] | None:
-        """Atomically pick one pending task and mark it as running."""
-        row = await self._fetchrow(
+    async def claim_pending_batch(self, *, limit: int) -> list[dict[str, Any]]:
+        """Atomically pick up to ``limit`` pending tasks and mark them as running.
+
+        FOR UPDATE SKIP LOCKED lets several workers claim concurrently without
+        handing out the same task twice.
+        """
+        rows = await self._fetch(
             """
             UPDATE conversion_backfill_tasks
             SET status = 'running', started_at = now()
-            WHERE id = (
+            WHERE id IN (
                 SELECT id FROM conversion_backfill_tasks
                 WHERE status = 'pending'
                 ORDER BY created_at ASC
-                LIMIT 1
+                LIMIT $1
                 FOR UPDATE SKIP LOCKED
             )
             RETURNING *
             """,
+            limit,
         )
-        return dict(row) if row else None
+        return sorted((dict(r) for r in rows), key=lambda task: task["created_at"])
 
     async def set_total(self, task_id: UUID, total: int) -> None:
         await self._execute(
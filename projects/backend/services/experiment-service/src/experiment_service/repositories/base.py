@@ -1,7 +1,81 @@
 """Shared asyncpg helpers for repositories."""
 from __future__ import annotations
 
+import functools
+from typing import Any, Sequence
+
+from asyncpg import Record  # type: ignore[import-untyped]
+
 from backend_common.repositories.base import BaseRepository
 
-__all__ = ["BaseRepository"]
+__all__ = [
+    "BaseRepository",
+    "iso_utc_sql",
+    "page_with_total_query",
+    "scoped_update_query",
+    "split_page",
+]
+
+
+@functools.lru_cache(maxsize=256)
+def scoped_update_query(
+    table: str,
+    columns: tuple[str, ...],
+    jsonb_columns: frozenset[str] = frozenset(),
+) -> str:
+    """``UPDATE ... WHERE project_id = $n AND id = $n+1 RETURNING *`` for a column shape.
+
+    Parameters ``$1..$len(columns)`` follow ``columns`` order; JSONB columns get
+    a ``::jsonb`` cast.  Cached so each PATCH shape is built once and sends the
+    same SQL text, which keeps asyncpg's prepared-statement cache warm.
+    """
+    assignments = [
+        f"{column} = ${idx}::jsonb" if column in jsonb_columns else f"{column} = ${idx}"
+        for idx, column in enumerate(columns, start=1)
+    ]
+    assignments.append("updated_at = now()")
+    idx = len(columns) + 1
+    return f"""
+            UPDATE {table}
+            SET {', '.join(assignments)}
+            WHERE project_id = ${idx} AND id = ${idx + 1}
+            RETURNING *
+        """
+
+
+def iso_utc_sql(column: str) -> str:
+    """SQL rendering ``column`` (timestamptz) like ``datetime.isoformat()`` in UTC.
+
+    Lets bulk readers take timestamps as ready-made text instead of calling
+    ``isoformat()`` once per row.
+    """
+    return (
+        f"to_char({column} AT TIME ZONE 'UTC', "
+        f"CASE WHEN extract(microseconds FROM {column})::bigint % 1000000 = 0 "
+        """THEN 'YYYY-MM-DD"T"HH24:MI:SS"+00:00"' """
+        """ELSE 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"' END)"""
+    )
+
+
+def page_with_total_query(page_sql: str, count_sql: str, order_by: str) -> str:
+    """Return a page and its total in one round-trip, even when the page is empty.
+
+    ``count_sql`` must yield a single count; ``page_sql`` is LEFT JOINed onto it,
+    so an empty page still produces one row (page columns NULL) carrying
+    ``total_count``.  ``order_by`` refers to the page columns as ``page.<col>``.
+    Use :func:`split_page` on the result.
+    """
+    return f"""
+        SELECT page.*, total.n AS total_count
+        FROM ({count_sql}) AS total(n)
+        LEFT JOIN ({page_sql}) AS page ON true
+        ORDER BY {order_by}
+    """
+
 
+def split_page(records: Sequence[Record]) -> tuple[list[Any], int]:
+    """Split :func:`page_with_total_query` rows into page records and the total."""
+    if not records:
+        return [], 0
+    total = int(records[0]["total_count"])
+    return [rec for rec in records if rec["id"] is not None], total
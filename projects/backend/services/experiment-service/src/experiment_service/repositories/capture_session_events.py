@@ -1,7 +1,7 @@
 """Capture session event (audit log) repository."""
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any, List, Tuple
 from uuid import UUID
 
@@ -19,11 +19,8 @@ class CaptureSessionEventRepository(BaseRepository):
 
     @staticmethod
     def _to_model(record: Record) -> CaptureSessionEvent:
-        payload = dict(record)
-        value = payload.get("payload")
-        if isinstance(value, str):
-            payload["payload"] = json.loads(value)
-        return CaptureSessionEvent.model_validate(payload)
+        # payload arrives as a dict: the pool decodes jsonb (backend_common.db.pool).
+        return CaptureSessionEvent.model_validate(dict(record))
 
     async def create(
         self,
@@ -50,7 +47,7 @@ class CaptureSessionEventRepository(BaseRepository):
             event_type,
             actor_id,
             actor_role,
-            json.dumps(payload or {}),
+            payload or {},
         )
         assert record is not None
         return self._to_model(record)
@@ -62,33 +59,25 @@ class CaptureSessionEventRepository(BaseRepository):
         limit: int = 50,
         offset: int = 0,
     ) -> Tuple[List[CaptureSessionEvent], int]:
-        records = await self._fetch(
-            """
-            SELECT *,
-                   COUNT(*) OVER() AS total_count
-            FROM capture_session_events
-            WHERE capture_session_id = $1
-            ORDER BY created_at ASC, id ASC
-            LIMIT $2 OFFSET $3
-            """,
-            capture_session_id,
-            limit,
-            offset,
+        # Page and total run as two concurrent queries: a COUNT(*) OVER()
+        # window would count the whole session again on every page and copy
+        # the total into each row.
+        records, total = await asyncio.gather(
+            self._fetch(
+                """
+                SELECT *
+                FROM capture_session_events
+                WHERE capture_session_id = $1
+                ORDER BY created_at ASC, id ASC
+                LIMIT $2 OFFSET $3
+                """,
+                capture_session_id,
+                limit,
+                offset,
+            ),
+            self._count_by_session(capture_session_id),
         )
-        items: List[CaptureSessionEvent] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            value = rec_dict.get("payload")
-            if isinstance(value, str):
-                rec_dict["payload"] = json.loads(value)
-            items.append(CaptureSessionEvent.model_validate(rec_dict))
-        if total is None:
-            total = await self._count_by_session(capture_session_id)
-        return items, total
+        return [self._to_model(rec) for rec in records], total
 
     async def _count_by_session(self, capture_session_id: UUID) -> int:
         record = await self._fetchrow(
@@ -96,4 +85,3 @@ class CaptureSessionEventRepository(BaseRepository):
             capture_session_id,
         )
         return int(record["total"]) if record else 0
-
@@ -13,7 +13,7 @@ from experiment_service.domain.dto import (
     CaptureSessionUpdateDTO,
 )
 from experiment_service.domain.models import CaptureSession
-from experiment_service.repositories.base import BaseRepository
+from experiment_service.repositories.base import BaseRepository, scoped_update_query
 
 
 class CaptureSessionRepository(BaseRepository):
@@ -24,7 +24,7 @@ class CaptureSessionRepository(BaseRepository):
 
     @staticmethod
     def _to_model(record: Record) -> CaptureSession:
-        return CaptureSession.model_validate(dict(record))
+        return CaptureSession.from_record(record)
 
     async def create(self, data: CaptureSessionCreateDTO) -> CaptureSession:
         query = """
@@ -69,6 +69,17 @@ class CaptureSessionRepository(BaseRepository):
             raise NotFoundError("Capture session not found")
         return self._to_model(record)
 
+    @staticmethod
+    def _collect(records: List[Record]) -> Tuple[List[CaptureSession], int | None]:
+        items: List[CaptureSession] = []
+        total: int | None = None
+        for rec in records:
+            total_value = rec["total_count"]
+            if total_value is not None:
+                total = int(total_value)
+            items.append(CaptureSession.from_record(rec))
+        return items, total
+
     async def list_by_project(
         self, project_id: UUID, *, limit: int = 50, offset: int = 0
     ) -> Tuple[List[CaptureSession], int]:
@@ -78,21 +89,14 @@ class CaptureSessionRepository(BaseRepository):
                    COUNT(*) OVER() AS total_count
             FROM capture_sessions
             WHERE project_id = $1
-            ORDER BY created_at DESC
+            ORDER BY created_at DESC, id DESC
             LIMIT $2 OFFSET $3
             """,
             project_id,
             limit,
             offset,
         )
-        items: List[CaptureSession] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            items.append(CaptureSession.model_validate(rec_dict))
+        items, total = self._collect(records)
         if total is None:
             total = await self._count_by_project(project_id)
         return items, total
@@ -114,18 +118,39 @@ class CaptureSessionRepository(BaseRepository):
             limit,
             offset,
         )
-        items: List[CaptureSession] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            items.append(CaptureSession.model_validate(rec_dict))
+        items, total = self._collect(records)
         if total is None:
             total = await self._count_by_run(project_id, run_id)
         return items, total
 
+    async def list_by_run_after(
+        self,
+        project_id: UUID,
+        run_id: UUID,
+        *,
+        after_ordinal: int | None = None,
+        limit: int = 1_000,
+    ) -> List[CaptureSession]:
+        """Sessions of a run that follow ``after_ordinal``, by ordinal number.
+
+        Keyset page on UNIQUE (run_id, ordinal_number) for walking a whole run;
+        no total is computed.
+        """
+        records = await self._fetch(
+            """
+            SELECT *
+            FROM capture_sessions
+            WHERE project_id = $1 AND run_id = $2 AND ordinal_number > $3
+            ORDER BY ordinal_number ASC
+            LIMIT $4
+            """,
+            project_id,
+            run_id,
+            after_ordinal if after_ordinal is not None else -1,
+            limit,
+        )
+        return [CaptureSession.from_record(rec) for rec in records]
+
     async def _count_by_project(self, project_id: UUID) -> int:
         record = await self._fetchrow(
             "SELECT COUNT(*) AS total FROM capture_sessions WHERE project_id = $1",
@@ -184,22 +209,8 @@ class CaptureSessionRepository(BaseRepository):
         if not payload:
             raise ValueError("No fields provided for update")
 
-        assignments = []
-        values = []
-        idx = 1
-        for column, value in payload.items():
-            assignments.append(f"{column} = ${idx}")
-            values.append(value)
-            idx += 1
-        assignments.append("updated_at = now()")
-        values.extend([project_id, capture_session_id])
-
-        query = f"""
-            UPDATE capture_sessions
-            SET {', '.join(assignments)}
-            WHERE project_id = ${idx} AND id = ${idx + 1}
-            RETURNING *
-        """
+        query = scoped_update_query("capture_sessions", tuple(payload))
+        values = [*payload.values(), project_id, capture_session_id]
         record = await self._fetchrow(query, *values)
         if record is None:
             raise NotFoundError("Capture session not found")
@@ -1,7 +1,6 @@
 """Conversion profile repository."""
 from __future__ import annotations
 
-import json
 from typing import Any, List, Tuple
 from uuid import UUID
 
@@ -17,19 +16,12 @@ from experiment_service.repositories.base import BaseRepository
 class ConversionProfileRepository(BaseRepository):
     """CRUD helpers for conversion profiles."""
 
-    JSONB_COLUMNS = {"payload"}
-
     def __init__(self, pool: Pool):
         super().__init__(pool)
 
     @staticmethod
     def _to_model(record: Record) -> ConversionProfile:
-        payload = dict(record)
-        for column in ConversionProfileRepository.JSONB_COLUMNS:
-            value = payload.get(column)
-            if isinstance(value, str):
-                payload[column] = json.loads(value)
-        return ConversionProfile.model_validate(payload)
+        return ConversionProfile.model_validate(dict(record))
 
     async def create(self, data: ConversionProfileCreateDTO) -> ConversionProfile:
         record = await self._fetchrow(
@@ -52,7 +44,7 @@ class ConversionProfileRepository(BaseRepository):
             data.project_id,
             data.version,
             data.kind,
-            json.dumps(data.payload),
+            data.payload,
             data.status.value,
             data.valid_from,
             data.valid_to,
@@ -127,18 +119,8 @@ class ConversionProfileRepository(BaseRepository):
             limit,
             offset,
         )
-        items: List[ConversionProfile] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            for column in self.JSONB_COLUMNS:
-                value = rec_dict.get(column)
-                if isinstance(value, str):
-                    rec_dict[column] = json.loads(value)
-            items.append(ConversionProfile.model_validate(rec_dict))
+        items = [self._to_model(rec) for rec in records]
+        total: int | None = int(records[0]["total_count"]) if records else None
         if total is None:
             total = await self._count_by_sensor(project_id, sensor_id)
         return items, total
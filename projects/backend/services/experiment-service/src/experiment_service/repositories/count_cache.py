@@ -0,0 +1,113 @@
+"""In-process TTL cache of list totals.
+
+Paging through a list re-ran the same ``COUNT(*)`` for every page, and on
+large projects that count, not the page itself, dominates the request. The
+first page still fetches page and total in one round-trip
+(:func:`page_with_total_query`); following pages within the TTL only run the
+page query and reuse the remembered total.
+
+Entries are keyed by table, scope (usually the project id) and the count
+query with its parameters, so different filters never share a total.
+Repositories drop a table's (or one scope's) entries whenever they insert,
+update or delete rows there; writes from other processes, such as
+telemetry-ingest moving sensor status, show up once the short TTL runs out.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, Hashable, Sequence
+
+from asyncpg import Record  # type: ignore[import-untyped]
+
+from experiment_service.repositories.base import page_with_total_query, split_page
+from experiment_service.settings import settings
+
+_CountKey = tuple[str, Hashable, str, tuple[Any, ...]]
+
+
+class CountCache:
+    """TTL cache of list totals keyed by table, scope and count query."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._cache: dict[_CountKey, tuple[float, int]] = {}
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+
+    @staticmethod
+    def key(table: str, scope: Hashable, sql: str, params: Sequence[Any]) -> _CountKey:
+        # Array parameters (tags, project id lists) arrive as lists.
+        frozen = tuple(tuple(p) if isinstance(p, list) else p for p in params)
+        return (table, scope, sql, frozen)
+
+    def get(self, key: _CountKey) -> int | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, total = entry
+        if expires_at <= time.monotonic():
+            self._cache.pop(key, None)
+            return None
+        return total
+
+    def remember(self, key: _CountKey, total: int) -> None:
+        if self._ttl <= 0 or self._max_entries <= 0:
+            return
+        now = time.monotonic()
+        if len(self._cache) >= self._max_entries:
+            self._evict(now)
+        self._cache[key] = (now + self._ttl, total)
+
+    def invalidate(self, table: str, *scopes: Hashable) -> None:
+        """Drop the totals of *table*, or only those of the given scopes."""
+        stale = [
+            key
+            for key in self._cache
+            if key[0] == table and (not scopes or key[1] in scopes)
+        ]
+        for key in stale:
+            del self._cache[key]
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _evict(self, now: float) -> None:
+        expired = [key for key, (expires_at, _) in self._cache.items() if expires_at <= now]
+        for key in expired:
+            del self._cache[key]
+        # Still full: drop the oldest insertions (dicts keep insertion order).
+        while len(self._cache) >= self._max_entries:
+            del self._cache[next(iter(self._cache))]
+
+
+list_counts = CountCache(
+    settings.list_count_cache_ttl_seconds,
+    settings.list_count_cache_max_entries,
+)
+
+
+async def fetch_counted_page(
+    fetch: Callable[..., Awaitable[list[Record]]],
+    *,
+    table: str,
+    scope: Hashable,
+    page_sql: str,
+    count_sql: str,
+    order_by: str,
+    params: Sequence[Any],
+    page_params: Sequence[Any],
+) -> tuple[list[Record], int]:
+    """Fetch one page and the list total, reusing a remembered total if fresh.
+
+    ``count_sql`` may only reference ``params``; ``page_sql`` references
+    ``params`` followed by ``page_params`` (limit/offset).  ``order_by`` is as
+    for :func:`page_with_total_query`.
+    """
+    key = CountCache.key(table, scope, count_sql, params)
+    total = list_counts.get(key)
+    if total is not None:
+        return list(await fetch(page_sql, *params, *page_params)), total
+    records, total = split_page(
+        await fetch(page_with_total_query(page_sql, count_sql, order_by), *params, *page_params)
+    )
+    list_counts.remember(key, total)
+    return records, total
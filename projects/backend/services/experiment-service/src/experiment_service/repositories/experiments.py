@@ -1,7 +1,6 @@
 """Experiment repository backed by asyncpg."""
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, List, Tuple
 from uuid import UUID
@@ -12,25 +11,23 @@ from experiment_service.core.exceptions import NotFoundError
 from experiment_service.domain.dto import ExperimentCreateDTO, ExperimentUpdateDTO
 from experiment_service.domain.enums import ExperimentStatus
 from experiment_service.domain.models import Experiment
-from experiment_service.repositories.base import BaseRepository
+from experiment_service.repositories.base import BaseRepository, scoped_update_query
+from experiment_service.repositories.count_cache import fetch_counted_page, list_counts
 
 
 class ExperimentRepository(BaseRepository):
     """CRUD operations for experiments."""
 
-    JSONB_COLUMNS = {"metadata"}
+    JSONB_COLUMNS = frozenset({"metadata"})
 
     def __init__(self, pool: Pool):
         super().__init__(pool)
 
     @staticmethod
     def _to_model(record: Record) -> Experiment:
-        payload = dict(record)
-        for column in ExperimentRepository.JSONB_COLUMNS:
-            value = payload.get(column)
-            if isinstance(value, str):
-                payload[column] = json.loads(value)
-        return Experiment.model_validate(payload)
+        # JSONB columns arrive decoded (pool codec); extra columns such as
+        # total_count are ignored by from_record.
+        return Experiment.from_record(record)
 
     async def create(self, data: ExperimentCreateDTO) -> Experiment:
         query = """
@@ -55,10 +52,11 @@ class ExperimentRepository(BaseRepository):
             data.description,
             data.experiment_type,
             data.tags,
-            json.dumps(data.metadata),
+            data.metadata,
             data.status.value,
         )
         assert record is not None
+        list_counts.invalidate("experiments", data.project_id)
         return self._to_model(record)
 
     async def get(self, project_id: UUID, experiment_id: UUID) -> Experiment:
@@ -102,34 +100,22 @@ class ExperimentRepository(BaseRepository):
             params.append(created_before)
             idx += 1
         where = " AND ".join(conditions)
-        params.extend([limit, offset])
-        query = f"""
-            SELECT *,
-                   COUNT(*) OVER() AS total_count
-            FROM experiments
+        records, total = await fetch_counted_page(
+            self._fetch,
+            table="experiments",
+            scope=project_id,
+            page_sql=f"""
+            SELECT * FROM experiments
             WHERE {where}
             ORDER BY created_at DESC
             LIMIT ${idx} OFFSET ${idx + 1}
-        """
-        records = await self._fetch(query, *params)
-        items: List[Experiment] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            for column in self.JSONB_COLUMNS:
-                value = rec_dict.get(column)
-                if isinstance(value, str):
-                    rec_dict[column] = json.loads(value)
-            items.append(Experiment.model_validate(rec_dict))
-        if total is None:
-            count_query = f"SELECT COUNT(*) AS total FROM experiments WHERE {where}"
-            count_params = params[: -(2)]  # exclude limit/offset
-            record = await self._fetchrow(count_query, *count_params)
-            total = int(record["total"]) if record else 0
-        return items, total
+            """,
+            count_sql=f"SELECT COUNT(*) FROM experiments WHERE {where}",
+            order_by="page.created_at DESC",
+            params=params,
+            page_params=(limit, offset),
+        )
+        return [self._to_model(rec) for rec in records], total
 
     async def search_experiments(
         self,
@@ -141,53 +127,29 @@ class ExperimentRepository(BaseRepository):
     ) -> Tuple[List[Experiment], int]:
         """Search experiments by name and description."""
         search_pattern = f"%{query}%"
-        records = await self._fetch(
-            """
-            SELECT *,
-                   COUNT(*) OVER() AS total_count
-            FROM experiments
-            WHERE project_id = $1
-              AND (
-                  name ILIKE $2
-                  OR description ILIKE $2
-              )
+        where = """
+            project_id = $1
+            AND (
+                name ILIKE $2
+                OR description ILIKE $2
+            )
+        """
+        records, total = await fetch_counted_page(
+            self._fetch,
+            table="experiments",
+            scope=project_id,
+            page_sql=f"""
+            SELECT * FROM experiments
+            WHERE {where}
             ORDER BY created_at DESC
             LIMIT $3 OFFSET $4
             """,
-            project_id,
-            search_pattern,
-            limit,
-            offset,
+            count_sql=f"SELECT COUNT(*) FROM experiments WHERE {where}",
+            order_by="page.created_at DESC",
+            params=(project_id, search_pattern),
+            page_params=(limit, offset),
         )
-        items: List[Experiment] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            for column in self.JSONB_COLUMNS:
-                value = rec_dict.get(column)
-                if isinstance(value, str):
-                    rec_dict[column] = json.loads(value)
-            items.append(Experiment.model_validate(rec_dict))
-        if total is None:
-            # Fallback count if window function didn't work
-            count_record = await self._fetchrow(
-                """
-                SELECT COUNT(*) AS total
-                FROM experiments
-                WHERE project_id = $1
-                  AND (
-                      name ILIKE $2
-                      OR description ILIKE $2
-                  )
-                """,
-                project_id,
-                search_pattern,
-            )
-            total = int(count_record["total"]) if count_record else 0
-        return items, total
+        return [self._to_model(rec) for rec in records], total
 
     async def update(
         self,
@@ -199,31 +161,12 @@ class ExperimentRepository(BaseRepository):
         if not payload:
             raise ValueError("No fields provided for update")
 
-        assignments = []
-        values: list[Any] = []
-        idx = 1
-        for column, value in payload.items():
-            column_expr = f"{column} = ${idx}"
-            if column in self.JSONB_COLUMNS:
-                column_expr += "::jsonb"
-            assignments.append(column_expr)
-            if column in self.JSONB_COLUMNS:
-                values.append(json.dumps(value))  # type: ignore[arg-type]
-            else:
-                values.append(value)
-            idx += 1
-        assignments.append("updated_at = now()")
-        values.extend([project_id, experiment_id])
-
-        query = f"""
-            UPDATE experiments
-            SET {', '.join(assignments)}
-            WHERE project_id = ${idx} AND id = ${idx + 1}
-            RETURNING *
-        """
-        record = await self._fetchrow(query, *values)
+        query = scoped_update_query("experiments", tuple(payload), self.JSONB_COLUMNS)
+        # The pool's jsonb codec encodes dict values itself.
+        record = await self._fetchrow(query, *payload.values(), project_id, experiment_id)
         if record is None:
             raise NotFoundError("Experiment not found")
+        list_counts.invalidate("experiments", project_id)
         return self._to_model(record)
 
     async def delete(self, project_id: UUID, experiment_id: UUID) -> None:
@@ -234,4 +177,5 @@ class ExperimentRepository(BaseRepository):
         )
         if record is None:
             raise NotFoundError("Experiment not found")
+        list_counts.invalidate("experiments", project_id)
 
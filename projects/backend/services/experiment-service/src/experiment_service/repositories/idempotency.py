@@ -82,16 +82,13 @@ class IdempotencyRepository(BaseRepository):
 
     @staticmethod
     def _to_record(record: Record) -> IdempotencyRecord:
-        body = record["response_body"]
-        if isinstance(body, str):
-            body = json.loads(body)
         return IdempotencyRecord(
             key=record["idempotency_key"],
             user_id=record["user_id"],
             request_path=record["request_path"],
             request_body_hash=record["request_body_hash"],
             response_status=record["response_status"],
-            response_body=body,
+            response_body=record["response_body"],
         )
 
 
@@ -1,7 +1,6 @@
 """Run event (audit log) repository."""
 from __future__ import annotations
 
-import json
 from typing import Any, List, Tuple
 from uuid import UUID
 
@@ -19,11 +18,7 @@ class RunEventRepository(BaseRepository):
 
     @staticmethod
     def _to_model(record: Record) -> RunEvent:
-        payload = dict(record)
-        value = payload.get("payload")
-        if isinstance(value, str):
-            payload["payload"] = json.loads(value)
-        return RunEvent.model_validate(payload)
+        return RunEvent.model_validate(dict(record))
 
     async def create(
         self,
@@ -50,7 +45,7 @@ class RunEventRepository(BaseRepository):
             event_type,
             actor_id,
             actor_role,
-            json.dumps(payload or {}),
+            payload or {},
         )
         assert record is not None
         return self._to_model(record)
@@ -75,17 +70,8 @@ class RunEventRepository(BaseRepository):
             limit,
             offset,
         )
-        items: List[RunEvent] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            value = rec_dict.get("payload")
-            if isinstance(value, str):
-                rec_dict["payload"] = json.loads(value)
-            items.append(RunEvent.model_validate(rec_dict))
+        items = [self._to_model(rec) for rec in records]
+        total: int | None = int(records[0]["total_count"]) if records else None
         if total is None:
             total = await self._count_by_run(run_id)
         return items, total
@@ -11,6 +11,9 @@ from experiment_service.domain.models import RunMetric
 from experiment_service.repositories.base import BaseRepository
 
 
+_COPY_COLUMNS = ("project_id", "run_id", "name", "step", "value", "timestamp")
+
+
 class RunMetricsRepository(BaseRepository):
     """Stores and fetches run metrics."""
 
@@ -33,20 +36,16 @@ class RunMetricsRepository(BaseRepository):
             )
             for point in payload.points
         ]
-        query = """
-            INSERT INTO run_metrics (
-                project_id,
-                run_id,
-                name,
-                step,
-                value,
-                timestamp
-            )
-            VALUES ($1, $2, $3, $4, $5, $6)
-            ON CONFLICT DO NOTHING
-        """
+        if not values:
+            return
+        # run_metrics has no unique constraint besides the surrogate id, so
+        # binary COPY is equivalent to INSERT ... ON CONFLICT DO NOTHING here.
         async with self._pool.acquire() as conn:
-            await conn.executemany(query, values)
+            await conn.copy_records_to_table(
+                "run_metrics",
+                records=values,
+                columns=_COPY_COLUMNS,
+            )
 
     async def fetch_series(
         self,
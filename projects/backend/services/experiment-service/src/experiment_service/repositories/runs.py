@@ -1,7 +1,6 @@
 """Run repository layer."""
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, List, Tuple
 from uuid import UUID
@@ -12,25 +11,22 @@ from experiment_service.core.exceptions import NotFoundError
 from experiment_service.domain.dto import RunCreateDTO, RunUpdateDTO
 from experiment_service.domain.enums import RunStatus
 from experiment_service.domain.models import Run, RunSensor
-from experiment_service.repositories.base import BaseRepository
+from experiment_service.repositories.base import BaseRepository, scoped_update_query
 
 
 class RunRepository(BaseRepository):
     """CRUD helpers for runs."""
 
-    JSONB_COLUMNS = {"params", "metadata"}
+    JSONB_COLUMNS = frozenset({"params", "metadata"})
 
     def __init__(self, pool: Pool):
         super().__init__(pool)
 
     @staticmethod
     def _to_model(record: Record) -> Run:
-        payload = dict(record)
-        for column in RunRepository.JSONB_COLUMNS:
-            value = payload.get(column)
-            if isinstance(value, str):
-                payload[column] = json.loads(value)
-        return Run.model_validate(payload)
+        # JSONB columns arrive decoded (pool codec); extra columns such as
+        # total_count are ignored by from_record.
+        return Run.from_record(record)
 
     async def create(self, data: RunCreateDTO) -> Run:
         query = """
@@ -74,11 +70,11 @@ class RunRepository(BaseRepository):
             data.project_id,
             data.created_by,
             data.name,
-            json.dumps(data.params),
+            data.params,
             data.git_sha,
             data.env,
             data.notes,
-            json.dumps(data.metadata),
+            data.metadata,
             data.status.value,
             data.started_at,
             data.finished_at,
@@ -114,18 +110,8 @@ class RunRepository(BaseRepository):
             limit,
             offset,
         )
-        items: List[Run] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            for column in self.JSONB_COLUMNS:
-                value = rec_dict.get(column)
-                if isinstance(value, str):
-                    rec_dict[column] = json.loads(value)
-            items.append(Run.model_validate(rec_dict))
+        items = [self._to_model(rec) for rec in records]
+        total: int | None = int(records[0]["total_count"]) if records else None
         if total is None:
             total = await self._count_by_project(project_id)
         return items, total
@@ -172,18 +158,8 @@ class RunRepository(BaseRepository):
             LIMIT ${idx} OFFSET ${idx + 1}
         """
         records = await self._fetch(query, *params)
-        items: List[Run] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            for column in self.JSONB_COLUMNS:
-                value = rec_dict.get(column)
-                if isinstance(value, str):
-                    rec_dict[column] = json.loads(value)
-            items.append(Run.model_validate(rec_dict))
+        items = [self._to_model(rec) for rec in records]
+        total: int | None = int(records[0]["total_count"]) if records else None
         if total is None:
             count_query = f"SELECT COUNT(*) AS total FROM runs WHERE {where}"
             count_params = params[: -(2)]
@@ -234,28 +210,9 @@ class RunRepository(BaseRepository):
         if not payload:
             raise ValueError("No fields provided for update")
 
-        assignments = []
-        values: list[Any] = []
-        idx = 1
-        for column, value in payload.items():
-            if column in self.JSONB_COLUMNS:
-                column_expr = f"{column} = ${idx}::jsonb"
-                values.append(json.dumps(value))  # type: ignore[arg-type]
-            else:
-                column_expr = f"{column} = ${idx}"
-                values.append(value)
-            assignments.append(column_expr)
-            idx += 1
-        assignments.append("updated_at = now()")
-        values.extend([project_id, run_id])
-
-        query = f"""
-            UPDATE runs
-            SET {', '.join(assignments)}
-            WHERE project_id = ${idx} AND id = ${idx + 1}
-            RETURNING *
-        """
-        record = await self._fetchrow(query, *values)
+        query = scoped_update_query("runs", tuple(payload), self.JSONB_COLUMNS)
+        # The pool's jsonb codec encodes dict values itself.
+        record = await self._fetchrow(query, *payload.values(), project_id, run_id)
         if record is None:
             raise NotFoundError("Run not found")
         return self._to_model(record)
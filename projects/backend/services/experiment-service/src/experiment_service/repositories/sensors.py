@@ -1,6 +1,7 @@
 """Sensor repository backed by asyncpg."""
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from typing import Any, List, Tuple
 from uuid import UUID
@@ -12,6 +13,7 @@ from experiment_service.domain.dto import SensorCreateDTO, SensorUpdateDTO
 from experiment_service.domain.enums import SensorStatus
 from experiment_service.domain.models import Sensor
 from experiment_service.repositories.base import BaseRepository
+from experiment_service.repositories.count_cache import fetch_counted_page, list_counts
 from experiment_service.settings import settings
 
 _CONNECTION_STATUS_EXPR = f"""
@@ -23,6 +25,50 @@ _CONNECTION_STATUS_EXPR = f"""
     END AS connection_status
 """
 
+# Fixed read SQL built once: asyncpg's per-connection statement cache is keyed
+# by query text, so hot reads reuse one prepared statement (and one string).
+_GET_QUERY = f"""
+    SELECT s.*, {_CONNECTION_STATUS_EXPR}
+    FROM sensors s
+    LEFT JOIN sensor_projects sp
+      ON s.id = sp.sensor_id
+     AND sp.project_id = $2
+    WHERE s.id = $1
+      AND (s.project_id = $2 OR sp.project_id = $2)
+"""
+_GET_BY_ID_QUERY = f"SELECT s.*, {_CONNECTION_STATUS_EXPR} FROM sensors s WHERE s.id = $1"
+
+
+def _in_project_sql(param: int) -> str:
+    """Membership of the ``sensors`` row in project ``$param`` (primary or linked)."""
+    return f"""(
+        sensors.project_id = ${param}
+        OR EXISTS (
+            SELECT 1
+            FROM sensor_projects sp
+            WHERE sp.sensor_id = sensors.id
+              AND sp.project_id = ${param}
+        )
+    )"""
+
+
+@functools.lru_cache(maxsize=64)
+def _update_query(columns: tuple[str, ...]) -> str:
+    """``UPDATE sensors`` for a column shape, scoped to one sensor in one project.
+
+    Parameters ``$1..$len(columns)`` follow ``columns`` order, then sensor id
+    and project id.
+    """
+    assignments = [f"{column} = ${idx}" for idx, column in enumerate(columns, start=1)]
+    assignments.append("updated_at = now()")
+    idx = len(columns) + 1
+    return f"""
+            UPDATE sensors
+            SET {', '.join(assignments)}
+            WHERE id = ${idx} AND {_in_project_sql(idx + 1)}
+            RETURNING *
+        """
+
 
 class SensorRepository(BaseRepository):
     """CRUD operations for sensors."""
@@ -42,48 +88,43 @@ class SensorRepository(BaseRepository):
         token_hash: bytes | None = None,
         token_preview: str | None = None,
     ) -> Sensor:
-        async with self._pool.acquire() as conn:
-            async with conn.transaction():
-                record = await conn.fetchrow(
-                    """
-                    INSERT INTO sensors (
-                        project_id,
-                        name,
-                        type,
-                        input_unit,
-                        display_unit,
-                        status,
-                        token_hash,
-                        token_preview,
-                        calibration_notes
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                    RETURNING *
-                    """,
-                    data.project_id,
-                    data.name,
-                    data.type,
-                    data.input_unit,
-                    data.display_unit,
-                    data.status.value,
+        # One statement (hence atomic): the sensor and its sensor_projects row.
+        record = await self._fetchrow(
+            """
+            WITH new_sensor AS (
+                INSERT INTO sensors (
+                    project_id,
+                    name,
+                    type,
+                    input_unit,
+                    display_unit,
+                    status,
                     token_hash,
                     token_preview,
-                    data.calibration_notes,
-                )
-                assert record is not None
-                sensor = self._to_model(record)
-                # Add sensor to sensor_projects table
-                await conn.execute(
-                    """
-                    INSERT INTO sensor_projects (sensor_id, project_id, created_at)
-                    VALUES ($1, $2, $3)
-                    ON CONFLICT (sensor_id, project_id) DO NOTHING
-                    """,
-                    sensor.id,
-                    data.project_id,
-                    sensor.created_at,
+                    calibration_notes
                 )
-                return sensor
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                RETURNING *
+            ), link AS (
+                INSERT INTO sensor_projects (sensor_id, project_id, created_at)
+                SELECT id, project_id, created_at FROM new_sensor
+                ON CONFLICT (sensor_id, project_id) DO NOTHING
+            )
+            SELECT * FROM new_sensor
+            """,
+            data.project_id,
+            data.name,
+            data.type,
+            data.input_unit,
+            data.display_unit,
+            data.status.value,
+            token_hash,
+            token_preview,
+            data.calibration_notes,
+        )
+        assert record is not None
+        list_counts.invalidate("sensors")
+        return self._to_model(record)
 
     async def get(self, project_id: UUID, sensor_id: UUID) -> Sensor:
         # Check if sensor exists and is associated with the project.
@@ -94,29 +135,14 @@ class SensorRepository(BaseRepository):
         #
         # In practice, older deployments may have sensors without a backfilled `sensor_projects`
         # row. Treat `sensors.project_id` as authoritative membership as well.
-        record = await self._fetchrow(
-            f"""
-            SELECT s.*, {_CONNECTION_STATUS_EXPR}
-            FROM sensors s
-            LEFT JOIN sensor_projects sp
-              ON s.id = sp.sensor_id
-             AND sp.project_id = $2
-            WHERE s.id = $1
-              AND (s.project_id = $2 OR sp.project_id = $2)
-            """,
-            sensor_id,
-            project_id,
-        )
+        record = await self._fetchrow(_GET_QUERY, sensor_id, project_id)
         if record is None:
             raise NotFoundError("Sensor not found")
         return self._to_model(record)
 
     async def get_by_id(self, sensor_id: UUID) -> Sensor:
         """Get sensor by ID without project check (for internal use)."""
-        record = await self._fetchrow(
-            f"SELECT s.*, {_CONNECTION_STATUS_EXPR} FROM sensors s WHERE s.id = $1",
-            sensor_id,
-        )
+        record = await self._fetchrow(_GET_BY_ID_QUERY, sensor_id)
         if record is None:
             raise NotFoundError("Sensor not found")
         return self._to_model(record)
@@ -149,59 +175,42 @@ class SensorRepository(BaseRepository):
             filter_values.append(("created_at", "<=", created_before))
 
         if project_id is None:
-            conditions = []
+            conditions: list[str] = []
             params: list[Any] = []
             idx = 1
-            for col, op, val in filter_values:
-                conditions.append(f"s.{col} {op} ${idx}")
-                params.append(val)
-                idx += 1
-            where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
-            params.extend([limit, offset])
-            query = f"""
-                SELECT s.*,
-                       {_CONNECTION_STATUS_EXPR},
-                       COUNT(*) OVER() AS total_count
-                FROM sensors s
-                {where}
-                ORDER BY s.created_at DESC
-                LIMIT ${idx} OFFSET ${idx + 1}
-            """
-            records = await self._fetch(query, *params)
+            from_clause = "FROM sensors s"
         else:
             conditions = ["(s.project_id = $1 OR sp.project_id = $1)"]
             params = [project_id]
             idx = 2
-            for col, op, val in filter_values:
-                conditions.append(f"s.{col} {op} ${idx}")
-                params.append(val)
-                idx += 1
-            where = " AND ".join(conditions)
-            params.extend([limit, offset])
-            query = f"""
-                SELECT s.*,
-                       {_CONNECTION_STATUS_EXPR},
-                       COUNT(*) OVER() AS total_count
+            from_clause = """
                 FROM sensors s
                 LEFT JOIN sensor_projects sp
                   ON s.id = sp.sensor_id
                  AND sp.project_id = $1
-                WHERE {where}
-                ORDER BY s.created_at DESC
-                LIMIT ${idx} OFFSET ${idx + 1}
             """
-            records = await self._fetch(query, *params)
-        items: List[Sensor] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            items.append(Sensor.model_validate(rec_dict))
-        if total is None:
-            total = await self._count_by_project(project_id)
-        return items, total
+        for col, op, val in filter_values:
+            conditions.append(f"s.{col} {op} ${idx}")
+            params.append(val)
+            idx += 1
+        where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        records, total = await fetch_counted_page(
+            self._fetch,
+            table="sensors",
+            scope=project_id,
+            page_sql=f"""
+            SELECT s.*, {_CONNECTION_STATUS_EXPR}
+            {from_clause}
+            {where}
+            ORDER BY s.created_at DESC
+            LIMIT ${idx} OFFSET ${idx + 1}
+            """,
+            count_sql=f"SELECT COUNT(*) {from_clause} {where}",
+            order_by="page.created_at DESC",
+            params=params,
+            page_params=(limit, offset),
+        )
+        return [self._to_model(rec) for rec in records], total
 
     async def list_by_projects(
         self, project_ids: List[UUID], *, limit: int = 50, offset: int = 0
@@ -209,69 +218,7 @@ class SensorRepository(BaseRepository):
         """List sensors that belong to any of the given projects."""
         if not project_ids:
             return [], 0
-        records = await self._fetch(
-            f"""
-            WITH filtered AS (
-                SELECT s.*,
-                       {_CONNECTION_STATUS_EXPR}
-                FROM sensors s
-                WHERE s.project_id = ANY($1::uuid[])
-                   OR EXISTS (
-                        SELECT 1
-                        FROM sensor_projects sp
-                        WHERE sp.sensor_id = s.id
-                          AND sp.project_id = ANY($1::uuid[])
-                   )
-            )
-            SELECT filtered.*,
-                   COUNT(*) OVER() AS total_count
-            FROM filtered
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $3
-            """,
-            project_ids,
-            limit,
-            offset,
-        )
-        items: List[Sensor] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            items.append(Sensor.model_validate(rec_dict))
-        if total is None:
-            total = await self._count_by_projects(project_ids)
-        return items, total
-
-    async def _count_by_project(self, project_id: UUID | None) -> int:
-        if project_id is None:
-            record = await self._fetchrow("SELECT COUNT(*) AS total FROM sensors")
-        else:
-            record = await self._fetchrow(
-                """
-                SELECT COUNT(*) AS total
-                FROM sensors s
-                WHERE s.project_id = $1
-                   OR EXISTS (
-                        SELECT 1
-                        FROM sensor_projects sp
-                        WHERE sp.sensor_id = s.id
-                          AND sp.project_id = $1
-                   )
-                """,
-                project_id,
-            )
-        return int(record["total"]) if record else 0
-
-    async def _count_by_projects(self, project_ids: List[UUID]) -> int:
-        if not project_ids:
-            return 0
-        record = await self._fetchrow(
-            """
-            SELECT COUNT(*) AS total
-            FROM sensors s
+        where = """
             WHERE s.project_id = ANY($1::uuid[])
                OR EXISTS (
                     SELECT 1
@@ -279,10 +226,24 @@ class SensorRepository(BaseRepository):
                     WHERE sp.sensor_id = s.id
                       AND sp.project_id = ANY($1::uuid[])
                )
+        """
+        records, total = await fetch_counted_page(
+            self._fetch,
+            table="sensors",
+            scope=tuple(project_ids),
+            page_sql=f"""
+            SELECT s.*, {_CONNECTION_STATUS_EXPR}
+            FROM sensors s
+            {where}
+            ORDER BY s.created_at DESC
+            LIMIT $2 OFFSET $3
             """,
-            project_ids,
+            count_sql=f"SELECT COUNT(*) FROM sensors s {where}",
+            order_by="page.created_at DESC",
+            params=(project_ids,),
+            page_params=(limit, offset),
         )
-        return int(record["total"]) if record else 0
+        return [self._to_model(rec) for rec in records], total
 
     async def update(
         self,
@@ -290,45 +251,31 @@ class SensorRepository(BaseRepository):
         sensor_id: UUID,
         updates: SensorUpdateDTO,
     ) -> Sensor:
-        # Verify sensor is associated with project
-        await self.get(project_id, sensor_id)
         payload = updates.model_dump(exclude_none=True)
         if not payload:
             raise ValueError("No fields provided for update")
-        assignments = []
-        values: list[Any] = []
-        idx = 1
-        for column, value in payload.items():
-            if column == "status" and hasattr(value, "value"):
-                value = value.value
-            assignments.append(f"{column} = ${idx}")
-            values.append(value)
-            idx += 1
-        assignments.append("updated_at = now()")
-        values.append(sensor_id)
+        values: list[Any] = [
+            value.value if column == "status" and hasattr(value, "value") else value
+            for column, value in payload.items()
+        ]
         record = await self._fetchrow(
-            f"""
-            UPDATE sensors
-            SET {', '.join(assignments)}
-            WHERE id = ${idx}
-            RETURNING *
-            """,
-            *values,
+            _update_query(tuple(payload)), *values, sensor_id, project_id
         )
         if record is None:
             raise NotFoundError("Sensor not found")
+        list_counts.invalidate("sensors")
         return self._to_model(record)
 
     async def delete(self, project_id: UUID, sensor_id: UUID) -> None:
-        # Verify sensor is associated with project
-        await self.get(project_id, sensor_id)
         # Delete sensor (cascade will remove from sensor_projects)
         record = await self._fetchrow(
-            "DELETE FROM sensors WHERE id = $1 RETURNING id",
+            f"DELETE FROM sensors WHERE id = $1 AND {_in_project_sql(2)} RETURNING id",
             sensor_id,
+            project_id,
         )
         if record is None:
             raise NotFoundError("Sensor not found")
+        list_counts.invalidate("sensors")
 
     async def has_active_capture_sessions(self, project_id: UUID, sensor_id: UUID) -> bool:
         """Check whether this sensor participates in any active capture sessions.
@@ -421,20 +368,19 @@ class SensorRepository(BaseRepository):
         token_hash: bytes,
         token_preview: str,
     ) -> Sensor:
-        # Verify sensor is associated with project
-        await self.get(project_id, sensor_id)
         record = await self._fetchrow(
-            """
+            f"""
             UPDATE sensors
             SET token_hash = $2,
                 token_preview = $3,
                 updated_at = now()
-            WHERE id = $1
+            WHERE id = $1 AND {_in_project_sql(4)}
             RETURNING *
             """,
             sensor_id,
             token_hash,
             token_preview,
+            project_id,
         )
         if record is None:
             raise NotFoundError("Sensor not found")
@@ -459,18 +405,17 @@ class SensorRepository(BaseRepository):
         sensor_id: UUID,
         profile_id: UUID | None,
     ) -> Sensor:
-        # Verify sensor is associated with project
-        await self.get(project_id, sensor_id)
         record = await self._fetchrow(
-            """
+            f"""
             UPDATE sensors
             SET active_profile_id = $2,
                 updated_at = now()
-            WHERE id = $1
+            WHERE id = $1 AND {_in_project_sql(3)}
             RETURNING *
             """,
             sensor_id,
             profile_id,
+            project_id,
         )
         if record is None:
             raise NotFoundError("Sensor not found")
@@ -479,22 +424,26 @@ class SensorRepository(BaseRepository):
     # Methods for managing sensor-project relationships
     async def get_sensor_projects(self, sensor_id: UUID) -> List[UUID]:
         """Get all project IDs associated with a sensor."""
-        records = await self._fetch(
-            "SELECT project_id FROM sensor_projects WHERE sensor_id = $1 ORDER BY created_at",
-            sensor_id,
-        )
-        if records:
-            return [UUID(str(record["project_id"])) for record in records]
-
         # Backward compatibility: older DBs might not have sensor_projects backfilled.
-        # Fall back to the primary project from `sensors.project_id`.
-        record = await self._fetchrow(
-            "SELECT project_id FROM sensors WHERE id = $1",
+        # Fall back to the primary project from `sensors.project_id` in the same query.
+        records = await self._fetch(
+            """
+            SELECT project_id
+            FROM (
+                SELECT project_id, created_at
+                FROM sensor_projects
+                WHERE sensor_id = $1
+                UNION ALL
+                SELECT project_id, created_at
+                FROM sensors
+                WHERE id = $1
+                  AND NOT EXISTS (SELECT 1 FROM sensor_projects WHERE sensor_id = $1)
+            ) AS memberships
+            ORDER BY created_at
+            """,
             sensor_id,
         )
-        if record is None:
-            return []
-        return [UUID(str(record["project_id"]))]
+        return [UUID(str(record["project_id"])) for record in records]
 
     async def add_sensor_project(self, sensor_id: UUID, project_id: UUID) -> None:
         """Add a sensor to a project."""
@@ -509,6 +458,7 @@ class SensorRepository(BaseRepository):
             sensor_id,
             project_id,
         )
+        list_counts.invalidate("sensors")
 
     async def remove_sensor_project(self, sensor_id: UUID, project_id: UUID) -> None:
         """Remove a sensor from a project."""
@@ -523,3 +473,4 @@ class SensorRepository(BaseRepository):
         )
         if record is None:
             raise NotFoundError("Sensor-project relationship not found")
+        list_counts.invalidate("sensors")
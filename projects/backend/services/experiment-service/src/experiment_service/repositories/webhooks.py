@@ -116,14 +116,7 @@ class WebhookDeliveryRepository(BaseRepository):
 
     @staticmethod
     def _to_model(record: Record) -> WebhookDelivery:
-        return WebhookDelivery.model_validate(WebhookDeliveryRepository._normalize(dict(record)))
-
-    @staticmethod
-    def _normalize(payload: dict[str, Any]) -> dict[str, Any]:
-        value = payload.get("request_body")
-        if isinstance(value, str):
-            payload["request_body"] = json.loads(value)
-        return payload
+        return WebhookDelivery.model_validate(dict(record))
 
     async def enqueue(
         self,
@@ -262,14 +255,8 @@ class WebhookDeliveryRepository(BaseRepository):
         """
         values.extend([limit, offset])
         records = await self._fetch(query, *values)
-        items: List[WebhookDelivery] = []
-        total: int | None = None
-        for rec in records:
-            rec_dict = dict(rec)
-            total_value = rec_dict.pop("total_count", None)
-            if total_value is not None:
-                total = int(total_value)
-            items.append(WebhookDelivery.model_validate(self._normalize(rec_dict)))
+        items = [self._to_model(rec) for rec in records]
+        total: int | None = int(records[0]["total_count"]) if records else None
         if total is None:
             total = await self._count_by_project(project_id, status=status)
         return items, total
@@ -62,6 +62,9 @@ IS_SUPERADMIN_HEADER = "X-User-Is-Superadmin"
 SYSTEM_PERMISSIONS_HEADER = "X-User-System-Permissions"
 PROJECT_PERMISSIONS_HEADER = "X-User-Permissions"
 
+# Request-scoped key under which require_current_user memoizes UserContext.
+USER_CONTEXT_KEY = "user_context"
+
 
 @dataclass
 class UserContext:
@@ -79,7 +82,15 @@ def _parse_permissions(header_value: str | None) -> frozenset[str]:
 
 
 async def require_current_user(request: web.Request) -> UserContext:
-    """Auth hook: reads RBAC v2 headers provided by auth-proxy."""
+    """Auth hook: reads RBAC v2 headers provided by auth-proxy.
+
+    The parsed context is memoized on the request, so repeated calls
+    (handler helpers, audit middleware) do not re-parse the headers.
+    """
+    cached = request.get(USER_CONTEXT_KEY)
+    if cached is not None:
+        return cached
+
     user_header = request.headers.get(USER_ID_HEADER)
     if user_header is None:
         raise web.HTTPUnauthorized(
@@ -104,13 +115,15 @@ async def require_current_user(request: web.Request) -> UserContext:
     system_permissions = _parse_permissions(request.headers.get(SYSTEM_PERMISSIONS_HEADER))
     project_permissions = _parse_permissions(request.headers.get(PROJECT_PERMISSIONS_HEADER))
 
-    return UserContext(
+    user = UserContext(
         user_id=user_id,
         is_superadmin=is_superadmin,
         system_permissions=system_permissions,
         project_permissions=project_permissions,
         active_project_id=project_id,
     )
+    request[USER_CONTEXT_KEY] = user
+    return user
 
 
 def ensure_permission(user: UserContext, permission: str) -> None:
@@ -5,13 +5,15 @@ import csv
 import io
 import json
 import zipfile
-from typing import Any
+from typing import IO, Any
 from uuid import UUID
 
-from asyncpg import Pool  # type: ignore[import-untyped]
+from asyncpg import Pool, Record  # type: ignore[import-untyped]
 
 from experiment_service.core.exceptions import NotFoundError
+from experiment_service.domain.models import CaptureSession
 from experiment_service.repositories.artifacts import ArtifactRepository
+from experiment_service.repositories.base import iso_utc_sql
 from experiment_service.repositories.capture_sessions import CaptureSessionRepository
 from experiment_service.repositories.experiments import ExperimentRepository
 from experiment_service.repositories.run_metrics import RunMetricsRepository
@@ -39,6 +41,22 @@ _TELEMETRY_COLUMNS = [
     "capture_session_id",
 ]
 
+_TELEMETRY_SCHEMA = (
+    pa.schema(
+        [
+            ("timestamp", pa.string()),
+            ("sensor_id", pa.string()),
+            ("signal", pa.string()),
+            ("raw_value", pa.float64()),
+            ("physical_value", pa.float64()),
+            ("conversion_status", pa.string()),
+            ("capture_session_id", pa.string()),
+        ]
+    )
+    if HAS_PARQUET
+    else None
+)
+
 _METRICS_COLUMNS = ["name", "step", "value", "timestamp"]
 
 
@@ -63,22 +81,38 @@ def _to_parquet_or_csv(
     buf_str = io.StringIO()
     writer = csv.writer(buf_str)
     writer.writerow(columns)
-    for row in rows:
-        writer.writerow([row.get(col, "") for col in columns])
+    writer.writerows([row.get(col, "") for col in columns] for row in rows)
     return buf_str.getvalue().encode(), ".csv"
 
 
-def _serialize(value: Any) -> Any:
-    """Convert asyncpg-returned values to JSON-serialisable types."""
-    if hasattr(value, "isoformat"):
-        return value.isoformat()
-    if isinstance(value, UUID):
-        return str(value)
-    return value
+class _TelemetryWriter:
+    """Appends telemetry record batches to an open archive member.
 
+    Parquet gets one row group per batch (fixed schema, so every batch
+    agrees on the column types); the CSV fallback writes rows as they come.
+    """
 
-def _record_to_dict(record: Any, columns: list[str]) -> dict[str, Any]:
-    return {col: _serialize(record[col]) for col in columns}
+    def __init__(self, member: IO[bytes]) -> None:
+        if HAS_PARQUET:
+            self._parquet = pq.ParquetWriter(member, _TELEMETRY_SCHEMA)
+        else:
+            self._text = io.TextIOWrapper(member, encoding="utf-8", newline="")
+            self._csv = csv.writer(self._text)
+            self._csv.writerow(_TELEMETRY_COLUMNS)
+
+    def write(self, records: list[Record]) -> None:
+        if HAS_PARQUET:
+            columns = dict(zip(_TELEMETRY_COLUMNS, map(list, zip(*records))))
+            self._parquet.write_table(pa.Table.from_pydict(columns, schema=_TELEMETRY_SCHEMA))
+        else:
+            self._csv.writerows(records)
+
+    def close(self) -> None:
+        if HAS_PARQUET:
+            self._parquet.close()
+        else:
+            self._text.flush()
+            self._text.detach()
 
 
 # ---------------------------------------------------------------------------
@@ -91,7 +125,9 @@ class FullExportService:
 
     # Maximum rows fetched per telemetry session to keep memory bounded.
     _TELEMETRY_LIMIT = 500_000
+    _TELEMETRY_BATCH = 5_000
     _METRICS_LIMIT = 100_000
+    _SESSIONS_PAGE_SIZE = 1_000
 
     def __init__(self, pool: Pool) -> None:
         self._pool = pool
@@ -140,9 +176,7 @@ class FullExportService:
                 await self._write_metrics(zf, project_id, run.id, run_dir)
 
                 # telemetry per capture session
-                sessions, _ = await self._cs_repo.list_by_run(
-                    project_id, run.id, limit=1_000, offset=0
-                )
+                sessions = await self._list_run_sessions(project_id, run.id)
                 all_sessions.extend(sessions)
 
                 for session in sessions:
@@ -167,6 +201,22 @@ class FullExportService:
     # Private helpers
     # ------------------------------------------------------------------
 
+    async def _list_run_sessions(self, project_id: UUID, run_id: UUID) -> list[CaptureSession]:
+        """All capture sessions of a run, paged by ordinal number (keyset)."""
+        sessions: list[CaptureSession] = []
+        after_ordinal: int | None = None
+        while True:
+            page = await self._cs_repo.list_by_run_after(
+                project_id,
+                run_id,
+                after_ordinal=after_ordinal,
+                limit=self._SESSIONS_PAGE_SIZE,
+            )
+            sessions.extend(page)
+            if len(page) < self._SESSIONS_PAGE_SIZE:
+                return sessions
+            after_ordinal = page[-1].ordinal_number
+
     async def _write_metrics(
         self,
         zf: zipfile.ZipFile,
@@ -201,25 +251,33 @@ class FullExportService:
         session_id: UUID,
         run_dir: str,
     ) -> None:
-        query = """
+        # Every column arrives as text or a number, so records are written
+        # as they are, without per-value conversion.
+        query = f"""
             SELECT
-                timestamp, sensor_id, signal,
-                raw_value, physical_value,
-                conversion_status, capture_session_id
+                {iso_utc_sql("timestamp")} AS timestamp_iso, sensor_id::text AS sensor_id,
+                signal, raw_value, physical_value,
+                conversion_status, capture_session_id::text AS capture_session_id
             FROM telemetry_records
             WHERE capture_session_id = $1
             ORDER BY timestamp ASC
             LIMIT $2
         """
+        # Server-side cursor: each batch of _TELEMETRY_BATCH records goes
+        # straight into the archive member, so at most one batch is held.
+        ext = ".parquet" if HAS_PARQUET else ".csv"
         async with self._pool.acquire() as conn:
-            records = await conn.fetch(query, session_id, self._TELEMETRY_LIMIT)
-
-        if not records:
-            return
-
-        rows = [_record_to_dict(r, _TELEMETRY_COLUMNS) for r in records]
-        data, ext = _to_parquet_or_csv(rows, _TELEMETRY_COLUMNS)
-        zf.writestr(f"{run_dir}/telemetry/sensor_{session_id}{ext}", data)
+            async with conn.transaction():
+                cursor = await conn.cursor(query, session_id, self._TELEMETRY_LIMIT)
+                batch = await cursor.fetch(self._TELEMETRY_BATCH)
+                if not batch:
+                    return
+                with zf.open(f"{run_dir}/telemetry/sensor_{session_id}{ext}", "w") as member:
+                    writer = _TelemetryWriter(member)
+                    while batch:
+                        writer.write(batch)
+                        batch = await cursor.fetch(self._TELEMETRY_BATCH)
+                    writer.close()
 
     async def _write_artifacts(
         self,
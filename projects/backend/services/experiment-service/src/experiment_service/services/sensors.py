@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
+from backend_common.conversion import compile_validated_conversion
 from experiment_service.domain.dto import (
     ConversionProfileCreateDTO,
     ConversionProfileInputDTO,
@@ -254,6 +255,8 @@ class ConversionProfileService:
             profile.status,
             ConversionProfileStatus.ACTIVE,
         )
+        # Reject payloads that ingest could not apply; raises InvalidConversionError.
+        compile_validated_conversion(profile.kind, profile.payload or {})
         updated = await self._profile_repository.update_status(
             project_id,
             sensor_id,
@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from backend_common.conversion import apply_conversion
+from backend_common.conversion import Converter, compile_conversion
 
 from experiment_service.domain.dto import (
     SensorUpdateDTO,
@@ -76,6 +76,12 @@ class TelemetryService:
                 raise ScopeMismatchError("Capture session is archived")
 
         active_profile = await self._get_active_profile(sensor)
+        # Parse the profile payload once for the whole batch of readings.
+        converter = (
+            compile_conversion(active_profile.kind, active_profile.payload or {})
+            if active_profile is not None
+            else None
+        )
         records = []
         for reading in payload.readings:
             conversion_status = TelemetryConversionStatus.RAW_ONLY
@@ -84,7 +90,7 @@ class TelemetryService:
 
             if physical_value is None and active_profile is not None:
                 physical_value, conversion_status = self._apply_conversion(
-                    active_profile, reading.raw_value
+                    converter, reading.raw_value
                 )
                 conversion_profile_id = active_profile.id if active_profile else None
             elif physical_value is not None:
@@ -157,9 +163,9 @@ class TelemetryService:
 
     @staticmethod
     def _apply_conversion(
-        profile: ConversionProfile, raw_value: float
+        converter: Converter | None, raw_value: float
     ) -> tuple[float | None, TelemetryConversionStatus]:
-        result = apply_conversion(profile.kind, profile.payload or {}, raw_value)
+        result = converter(raw_value) if converter is not None else None
         if result is not None:
             return result, TelemetryConversionStatus.CONVERTED
         return None, TelemetryConversionStatus.CONVERSION_FAILED
@@ -1,7 +1,6 @@
 """Application settings."""
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import cast
 
 from pydantic import AnyHttpUrl, Field, PostgresDsn
@@ -46,6 +45,10 @@ class Settings(BaseServiceSettings):
     export_rate_limit_requests: int = 10   # max requests per window
     export_rate_limit_window_seconds: float = 60.0
 
+    # Per-process cache of list totals reused while paging (0 disables)
+    list_count_cache_ttl_seconds: float = 60.0
+    list_count_cache_max_entries: int = 1024
+
     # Sensor connection status thresholds
     sensor_online_threshold_seconds: int = 30
     sensor_delayed_threshold_seconds: int = 300
@@ -59,10 +62,9 @@ class Settings(BaseServiceSettings):
     audit_retention_days: int = 365  # delete run_events/capture_session_events older than this
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Process-wide settings instance."""
+    return Settings.instance()
 
 
 settings = get_settings()
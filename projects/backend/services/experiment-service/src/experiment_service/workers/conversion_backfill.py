@@ -5,30 +5,41 @@ telemetry records using the specified conversion profile.
 """
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from uuid import UUID
 
 import structlog
+from asyncpg import Pool  # type: ignore[import-untyped]
 
-from backend_common.conversion import apply_conversion
+from backend_common.conversion import apply_conversion_batch
 from backend_common.db.pool import get_pool_service as get_pool
 from experiment_service.repositories.backfill_tasks import BackfillTaskRepository
 
 logger = structlog.get_logger(__name__)
 
 BATCH_SIZE = 1000
+# Tasks claimed per sweep.  Claimed tasks show as running (and are off limits
+# to other replicas) until their turn comes, so this stays small.
+CLAIM_BATCH_SIZE = 4
 
 
 async def conversion_backfill(now: datetime) -> str | None:
-    """Process one pending backfill task (called periodically by BackgroundWorker)."""
+    """Process pending backfill tasks (called periodically by BackgroundWorker).
+
+    Up to CLAIM_BATCH_SIZE tasks are claimed in one round-trip and run in order.
+    """
     pool = await get_pool()
     repo = BackfillTaskRepository(pool)
 
-    task = await repo.claim_pending()
-    if task is None:
+    tasks = await repo.claim_pending_batch(limit=CLAIM_BATCH_SIZE)
+    if not tasks:
         return None
 
+    summaries = [await _process_task(pool, repo, task) for task in tasks]
+    return "; ".join(summaries)
+
+
+async def _process_task(pool: Pool, repo: BackfillTaskRepository, task: dict) -> str:
     task_id: UUID = task["id"]
     sensor_id: UUID = task["sensor_id"]
     profile_id: UUID = task["conversion_profile_id"]
@@ -48,8 +59,6 @@ async def conversion_backfill(now: datetime) -> str | None:
 
         kind: str = profile_row["kind"]
         payload = profile_row["payload"]
-        if isinstance(payload, str):
-            payload = json.loads(payload)
 
         # Count records to process.
         async with pool.acquire() as conn:
@@ -97,10 +106,11 @@ async def conversion_backfill(now: datetime) -> str | None:
             if not rows:
                 break
 
+            results = apply_conversion_batch(
+                kind, payload, [float(row["raw_value"]) for row in rows]
+            )
             updates: list[tuple] = []
-            for row in rows:
-                raw_value = float(row["raw_value"])
-                result = apply_conversion(kind, payload, raw_value)
+            for row, result in zip(rows, results):
                 if result is not None:
                     updates.append((result, "converted", profile_id, row["id"], sensor_id, row["timestamp"]))
                 else:
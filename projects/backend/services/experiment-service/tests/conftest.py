@@ -5,6 +5,7 @@ import pytest
 from testsuite.databases.pgsql import discover, service as pgsql_service
 
 from experiment_service.main import create_app
+from experiment_service.repositories.count_cache import list_counts
 from experiment_service.settings import settings
 
 pytest_plugins = (
@@ -47,6 +48,14 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def _reset_list_counts():
+    """Tables are truncated between tests; don't carry cached totals across."""
+    list_counts.clear()
+    yield
+    list_counts.clear()
+
+
 @pytest.fixture(scope="session")
 def pgsql_local(pgsql_local_create):
     databases = discover.find_schemas(
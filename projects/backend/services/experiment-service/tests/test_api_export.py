@@ -91,6 +91,36 @@ async def test_export_experiments_json(service_client):
     assert exp["id"] in ids
 
 
+@pytest.mark.asyncio
+async def test_export_experiments_json_compact_unless_pretty(service_client):
+    project_id = uuid.uuid4()
+    headers = make_headers(project_id)
+    await _create_experiment(service_client, project_id, headers)
+
+    url = f"/api/v1/experiments/export?project_id={project_id}&format=json"
+    compact = await (await service_client.get(url, headers=headers)).text()
+    pretty = await (await service_client.get(url + "&pretty=1", headers=headers)).text()
+
+    assert "\n" not in compact
+    assert pretty.startswith("[\n  {")
+    assert json.loads(compact) == json.loads(pretty)
+
+
+@pytest.mark.asyncio
+async def test_export_experiments_compressed_when_accepted(service_client):
+    project_id = uuid.uuid4()
+    headers = make_headers(project_id)
+    await _create_experiment(service_client, project_id, headers)
+
+    url = f"/api/v1/experiments/export?project_id={project_id}&format=json"
+    gzipped = await service_client.get(url, headers={**headers, "Accept-Encoding": "gzip"})
+    plain = await service_client.get(url, headers={**headers, "Accept-Encoding": "identity"})
+
+    assert gzipped.headers.get("Content-Encoding") == "gzip"
+    assert "Content-Encoding" not in plain.headers
+    assert await gzipped.json() == await plain.json()
+
+
 @pytest.mark.asyncio
 async def test_export_experiments_default_format_is_csv(service_client):
     project_id = uuid.uuid4()
@@ -102,7 +102,7 @@ async def _build(
     svc._run_repo.list_by_experiment = AsyncMock(return_value=(runs, len(runs)))
 
     svc._cs_repo = MagicMock()
-    svc._cs_repo.list_by_run = AsyncMock(return_value=(sessions, len(sessions)))
+    svc._cs_repo.list_by_run_after = AsyncMock(return_value=sessions)
 
     svc._metrics_repo = MagicMock()
     svc._metrics_repo.fetch_series = AsyncMock(return_value=metrics)
@@ -110,17 +110,31 @@ async def _build(
     svc._artifact_repo = MagicMock()
     svc._artifact_repo.list_by_run = AsyncMock(return_value=(artifacts, len(artifacts)))
 
-    # Mock telemetry query (pool.acquire)
-    conn = AsyncMock()
-    conn.fetch = AsyncMock(return_value=telemetry_records or [])
-
-    class _AcquireCM:
+    # Mock telemetry query (pool.acquire -> transaction -> cursor)
+    class _AsyncCM:
+        def __init__(self, value=None):
+            self._value = value
         async def __aenter__(self):
-            return conn
+            return self._value
         async def __aexit__(self, *a):
             pass
 
-    pool.acquire = lambda: _AcquireCM()
+    class _Cursor:
+        def __init__(self, records):
+            self._records = list(records)
+
+        async def fetch(self, n):
+            batch, self._records = self._records[:n], self._records[n:]
+            return batch
+
+    async def _cursor(query, *args):
+        return _Cursor(telemetry_records or [])
+
+    conn = MagicMock()
+    conn.transaction = lambda: _AsyncCM()
+    conn.cursor = _cursor
+
+    pool.acquire = lambda: _AsyncCM(conn)
 
     return await svc.build_zip(project_id, experiment_id)
 
@@ -213,6 +227,35 @@ async def test_export_no_metrics_skips_file():
         assert len(metrics_files) == 0
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch", [FullExportService._TELEMETRY_BATCH, 2])
+async def test_export_writes_session_telemetry(batch):
+    rid, sid, sensor_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    session = _FakeObj(_data={"id": str(sid)})
+    session.id = sid  # type: ignore[attr-defined]
+    session.ordinal_number = 1  # type: ignore[attr-defined]
+    ts = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+    # Rows as the query returns them: timestamp and UUIDs already rendered as text.
+    records = [
+        (ts.isoformat(), str(sensor_id), "temp", float(i), None, "raw_only", str(sid))
+        for i in range(3)
+    ]
+
+    with (
+        patch("experiment_service.services.full_export.HAS_PARQUET", False),
+        patch.object(FullExportService, "_TELEMETRY_BATCH", batch),
+    ):
+        data = await _build(runs=[_run(rid)], sessions=[session], telemetry_records=records)
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        (name,) = [n for n in zf.namelist() if "/telemetry/" in n]
+        assert name.endswith(f"sensor_{sid}.csv")
+        lines = zf.read(name).decode().splitlines()
+    assert lines[0].split(",")[0] == "timestamp"
+    assert len(lines) == 4
+    assert lines[1].startswith(f"{ts.isoformat()},{sensor_id},temp,0.0,")
+
+
 @pytest.mark.asyncio
 async def test_export_csv_fallback():
     """Without pyarrow, metrics should be written as CSV."""
@@ -226,3 +269,26 @@ async def test_export_csv_fallback():
     with zipfile.ZipFile(io.BytesIO(data)) as zf:
         csv_files = [n for n in zf.namelist() if n.endswith(".csv")]
         assert len(csv_files) >= 1
+
+
+@pytest.mark.asyncio
+async def test_list_run_sessions_pages_by_ordinal():
+    """Runs with more sessions than one page are exported completely."""
+    svc = FullExportService(MagicMock())
+    svc._SESSIONS_PAGE_SIZE = 2  # type: ignore[misc]
+
+    def _session(ordinal: int) -> MagicMock:
+        s = MagicMock()
+        s.ordinal_number = ordinal
+        return s
+
+    pages = [[_session(1), _session(2)], [_session(3), _session(4)], [_session(5)]]
+    svc._cs_repo = MagicMock()
+    svc._cs_repo.list_by_run_after = AsyncMock(side_effect=pages)
+
+    project_id, run_id = uuid.uuid4(), uuid.uuid4()
+    sessions = await svc._list_run_sessions(project_id, run_id)
+
+    assert [s.ordinal_number for s in sessions] == [1, 2, 3, 4, 5]
+    cursors = [c.kwargs["after_ordinal"] for c in svc._cs_repo.list_by_run_after.await_args_list]
+    assert cursors == [None, 2, 4]
@@ -26,6 +26,7 @@ import uuid
 from datetime import datetime, timezone
 
 import asyncpg
+import orjson
 import pytest
 
 from experiment_service.services.idempotency import IDEMPOTENCY_HEADER
@@ -251,6 +252,87 @@ async def test_export_session_csv_values_correct(service_client, pgsql):
     assert data[sensor_idx] == ctx["sensor_id"]
 
 
+@pytest.mark.asyncio
+async def test_export_session_csv_timestamps_match_json(service_client, pgsql):
+    """CSV (formatted by PostgreSQL) and JSON render timestamps identically."""
+    from datetime import timedelta
+
+    ctx = await _setup_context(service_client)
+    project_id = ctx["project_id"]
+    run_id = ctx["run_id"]
+    session_id = ctx["capture_session_id"]
+    headers = ctx["headers"]
+
+    await _insert_telemetry(
+        pgsql,
+        project_id=project_id,
+        sensor_id=ctx["sensor_uuid"],
+        run_id=uuid.UUID(run_id),
+        capture_session_id=uuid.UUID(session_id),
+        records=[
+            {"timestamp": _ts(0), "raw_value": 1.0},
+            {"timestamp": _ts(1) + timedelta(microseconds=250), "raw_value": 2.0},
+        ],
+    )
+
+    url = (
+        f"/api/v1/runs/{run_id}/capture-sessions/{session_id}/telemetry/export"
+        f"?project_id={project_id}&format="
+    )
+    resp = await service_client.get(url + "csv", headers=headers)
+    assert resp.status == 200
+    csv_ts = [r["timestamp"] for r in csv.DictReader(io.StringIO(await resp.text()))]
+    resp = await service_client.get(url + "json", headers=headers)
+    assert resp.status == 200
+    json_ts = [item["timestamp"] for item in json.loads(await resp.text())]
+
+    assert csv_ts == json_ts == [
+        _ts(0).isoformat(),
+        (_ts(1) + timedelta(microseconds=250)).isoformat(),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_session_arrow(service_client, pgsql):
+    """format=arrow returns a typed Arrow IPC stream with the same rows as JSON."""
+    pa = pytest.importorskip("pyarrow")
+    ctx = await _setup_context(service_client)
+    project_id = ctx["project_id"]
+    run_id = ctx["run_id"]
+    session_id = ctx["capture_session_id"]
+    headers = ctx["headers"]
+
+    await _insert_telemetry(
+        pgsql,
+        project_id=project_id,
+        sensor_id=ctx["sensor_uuid"],
+        run_id=uuid.UUID(run_id),
+        capture_session_id=uuid.UUID(session_id),
+        records=[
+            {"timestamp": _ts(i), "raw_value": float(i), "physical_value": 10.0 * i}
+            for i in range(3)
+        ],
+    )
+
+    resp = await service_client.get(
+        f"/api/v1/runs/{run_id}/capture-sessions/{session_id}/telemetry/export"
+        f"?format=arrow&raw_or_physical=raw&project_id={project_id}",
+        headers=headers,
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(await resp.read()).read_all()
+
+    assert table.schema.names == [
+        "timestamp", "sensor_id", "signal", "raw_value",
+        "conversion_status", "capture_session_id",
+    ]
+    assert table.schema.field("timestamp").type == pa.timestamp("us", tz="UTC")
+    assert table.column("raw_value").to_pylist() == [0.0, 1.0, 2.0]
+    assert table.column("timestamp").to_pylist() == [_ts(i) for i in range(3)]
+    assert set(table.column("capture_session_id").to_pylist()) == {session_id}
+
+
 # ---------------------------------------------------------------------------
 # Session export — JSON
 # ---------------------------------------------------------------------------
@@ -713,6 +795,30 @@ async def test_export_run_filter_by_capture_session(service_client, pgsql):
     assert data[0]["capture_session_id"] == session1_id
 
 
+@pytest.mark.asyncio
+async def test_export_run_filter_rejects_session_of_another_run(service_client, pgsql):
+    """capture_session_id from another project's run is 404, not exported."""
+    ctx = await _setup_context(service_client)
+    other = await _setup_context(service_client)
+
+    await _insert_telemetry(
+        pgsql,
+        project_id=other["project_id"],
+        sensor_id=other["sensor_uuid"],
+        run_id=uuid.UUID(other["run_id"]),
+        capture_session_id=uuid.UUID(other["capture_session_id"]),
+        records=[{"timestamp": _ts(0), "raw_value": 1.0}],
+    )
+
+    resp = await service_client.get(
+        f"/api/v1/runs/{ctx['run_id']}/telemetry/export"
+        f"?format=json&capture_session_id={other['capture_session_id']}"
+        f"&project_id={ctx['project_id']}",
+        headers=ctx["headers"],
+    )
+    assert resp.status == 404
+
+
 # ---------------------------------------------------------------------------
 # RBAC
 # ---------------------------------------------------------------------------
@@ -835,6 +941,59 @@ async def test_export_run_not_found(service_client, pgsql):
     assert resp.status == 404
 
 
+async def test_existence_probes_use_the_given_connection():
+    from aiohttp import web
+
+    from experiment_service.api.routes.telemetry_export import _ensure_run
+
+    class _Conn:
+        def __init__(self, result):
+            self.result = result
+            self.calls = []
+
+        async def fetchval(self, query, *args):
+            self.calls.append((query, args))
+            return self.result
+
+    project_id, run_id = uuid.uuid4(), uuid.uuid4()
+    conn = _Conn(1)
+    await _ensure_run(conn, project_id, run_id)
+    assert conn.calls == [
+        ("SELECT 1 FROM runs WHERE project_id = $1 AND id = $2", (project_id, run_id)),
+    ]
+
+    with pytest.raises(web.HTTPNotFound):
+        await _ensure_run(_Conn(None), project_id, run_id)
+
+
+async def test_run_session_probe_is_one_round_trip():
+    from aiohttp import web
+
+    from experiment_service.api.routes.telemetry_export import _ensure_run_session
+
+    class _Conn:
+        def __init__(self, row):
+            self.row = row
+            self.calls = 0
+
+        async def fetchrow(self, query, *args):
+            self.calls += 1
+            return self.row
+
+    ids = (uuid.uuid4(), uuid.uuid4(), uuid.uuid4())
+    conn = _Conn({"run_found": True, "session_found": True})
+    await _ensure_run_session(conn, *ids)
+    assert conn.calls == 1
+
+    for row, text in (
+        ({"run_found": False, "session_found": False}, "Run not found"),
+        ({"run_found": True, "session_found": False}, "Capture session not found"),
+    ):
+        with pytest.raises(web.HTTPNotFound) as exc_info:
+            await _ensure_run_session(_Conn(row), *ids)
+        assert exc_info.value.text == text
+
+
 # ---------------------------------------------------------------------------
 # Streaming — no truncation
 # ---------------------------------------------------------------------------
@@ -901,6 +1060,45 @@ async def test_export_not_truncated_header_absent(service_client, pgsql):
     assert "X-Export-Truncated" not in resp.headers
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+async def test_export_spans_multiple_batches(service_client, pgsql, monkeypatch, fmt):
+    """Rows split across several write batches come out complete and in order."""
+    monkeypatch.setattr(
+        "experiment_service.api.routes.telemetry_export.STREAM_BATCH_SIZE", 4,
+    )
+    ctx = await _setup_context(service_client)
+    project_id = ctx["project_id"]
+    run_id = ctx["run_id"]
+    session_id = ctx["capture_session_id"]
+    headers = ctx["headers"]
+
+    row_count = 10  # two full batches and a partial one
+    await _insert_telemetry(
+        pgsql,
+        project_id=project_id,
+        sensor_id=ctx["sensor_uuid"],
+        run_id=uuid.UUID(run_id),
+        capture_session_id=uuid.UUID(session_id),
+        records=[
+            {"timestamp": _ts(i), "raw_value": float(i)} for i in range(row_count)
+        ],
+    )
+
+    resp = await service_client.get(
+        f"/api/v1/runs/{run_id}/capture-sessions/{session_id}/telemetry/export"
+        f"?format={fmt}&raw_or_physical=raw&project_id={project_id}",
+        headers=headers,
+    )
+    assert resp.status == 200
+    text = await resp.text()
+    if fmt == "json":
+        raw_values = [item["raw_value"] for item in json.loads(text)]
+    else:
+        raw_values = [float(r["raw_value"]) for r in csv.DictReader(io.StringIO(text))]
+    assert raw_values == [float(i) for i in range(row_count)]
+
+
 # ---------------------------------------------------------------------------
 # Ordering
 # ---------------------------------------------------------------------------
@@ -941,6 +1139,100 @@ async def test_export_session_ordered_by_timestamp_asc(service_client, pgsql):
     assert raw_values == sorted(raw_values), "Records must be in ascending timestamp order"
 
 
+def test_json_item_encoding_matches_isoformat_and_str():
+    """orjson-encoded export items keep the isoformat()/str() text of the old encoder."""
+    from experiment_service.api.routes.telemetry_export import _raw_row_formatter
+
+    sensor_id, session_id = uuid.uuid4(), uuid.uuid4()
+    ts = datetime(2025, 1, 1, 12, 0, 0, 250, tzinfo=timezone.utc)
+    # Column order of the export SELECT; UUIDs are cast to text in SQL.
+    row = (ts, str(sensor_id), "temp", 1.5, None, "raw_only", str(session_id))
+
+    encoded = orjson.dumps(_raw_row_formatter("both")(row))
+
+    assert json.loads(encoded) == {
+        "timestamp": ts.isoformat(),
+        "sensor_id": str(sensor_id),
+        "signal": "temp",
+        "raw_value": 1.5,
+        "physical_value": None,
+        "conversion_status": "raw_only",
+        "capture_session_id": str(session_id),
+    }
+
+
+def test_run_scope_resolves_sessions_inside_the_query():
+    from experiment_service.api.routes.telemetry_export import _build_raw_query
+
+    project_id, run_id, sensor_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    query, params = _build_raw_query(
+        None, run_scope=(project_id, run_id), sensor_id=sensor_id,
+    )
+
+    assert "SELECT id FROM capture_sessions WHERE project_id = $1 AND run_id = $2" in query
+    assert "sensor_id = $3" in query
+    assert params == [project_id, run_id, sensor_id]
+
+
+def test_query_text_is_shared_per_filter_shape():
+    """Same filter shape -> identical SQL text (one asyncpg prepared statement)."""
+    from experiment_service.api.routes.telemetry_export import _build_raw_query
+
+    first, first_params = _build_raw_query([uuid.uuid4()], signal="a", include_late=False)
+    second, second_params = _build_raw_query([uuid.uuid4()], signal="b", include_late=False)
+    other, _ = _build_raw_query([uuid.uuid4()], include_late=False)
+
+    assert first is second
+    assert first_params[1:] == ["a"] and second_params[1:] == ["b"]
+    assert other != first
+
+
+@pytest.mark.parametrize(
+    ("value_mode", "keys"),
+    [
+        ("raw", {"raw_value"}),
+        ("physical", {"physical_value"}),
+        ("both", {"raw_value", "physical_value"}),
+    ],
+)
+def test_raw_row_formatter_value_modes(value_mode, keys):
+    from experiment_service.api.routes.telemetry_export import _raw_row_formatter
+
+    row = (_ts(0), uuid.uuid4(), "temp", 1.0, 2.0, "converted", uuid.uuid4())
+    item = _raw_row_formatter(value_mode)(row)
+
+    assert list(item) == [
+        k for k in (
+            "timestamp", "sensor_id", "signal", "raw_value", "physical_value",
+            "conversion_status", "capture_session_id",
+        )
+        if k in keys or k not in {"raw_value", "physical_value"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_session_csv_gzip_when_accepted(service_client, pgsql):
+    ctx = await _setup_context(service_client)
+    await _insert_telemetry(
+        pgsql,
+        project_id=ctx["project_id"],
+        sensor_id=ctx["sensor_uuid"],
+        run_id=uuid.UUID(ctx["run_id"]),
+        capture_session_id=uuid.UUID(ctx["capture_session_id"]),
+        records=[{"timestamp": _ts(i), "raw_value": float(i)} for i in range(50)],
+    )
+
+    resp = await service_client.get(
+        f"/api/v1/runs/{ctx['run_id']}/capture-sessions/{ctx['capture_session_id']}"
+        f"/telemetry/export?format=csv&project_id={ctx['project_id']}",
+        headers={**ctx["headers"], "Accept-Encoding": "gzip"},
+    )
+    assert resp.status == 200
+    assert resp.headers.get("Content-Encoding") == "gzip"
+    rows = list(csv.reader(io.StringIO(await resp.text())))
+    assert len(rows) == 51
+
+
 # ---------------------------------------------------------------------------
 # Default format
 # ---------------------------------------------------------------------------
@@ -0,0 +1,84 @@
+"""Tests for API helper utilities."""
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from experiment_service.api.utils import json_response, paginated_response
+from experiment_service.domain.enums import ExperimentStatus
+from experiment_service.domain.models import Experiment
+
+
+def _experiment() -> Experiment:
+    now = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    return Experiment(
+        id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        owner_id=uuid.uuid4(),
+        name="exp",
+        status=ExperimentStatus.RUNNING,
+        tags=["a"],
+        metadata={"k": [1, 2]},
+        created_at=now,
+        updated_at=now.replace(microsecond=0),
+    )
+
+
+def test_json_response_matches_pydantic_json_mode():
+    experiment = _experiment()
+    payload = paginated_response([experiment], limit=10, offset=0, key="experiments", total=1)
+
+    response = json_response(payload)
+
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    body = json.loads(response.body)
+    assert body["experiments"] == [experiment.model_dump(mode="json")]
+    assert body["total"] == 1
+
+
+class _DriverUUID(uuid.UUID):
+    """Stand-in for asyncpg's uuid.UUID subclass (asyncpg.pgproto.pgproto.UUID)."""
+
+
+def test_json_response_encodes_uuid_subclasses():
+    raw = uuid.uuid4()
+    experiment = _experiment().model_copy(update={"id": _DriverUUID(str(raw))})
+
+    body = json.loads(json_response({"item": experiment, "owner": _DriverUUID(str(raw))}).body)
+
+    assert body["item"]["id"] == str(raw)
+    assert body["owner"] == str(raw)
+
+
+def test_json_response_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        json_response({"value": object()})
+
+
+def test_json_response_encodes_backfill_task_rows():
+    """Backfill task rows (plain dicts from asyncpg) are encoded without a pre-pass."""
+    task_id = uuid.uuid4()
+    created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    task = {
+        "id": task_id,
+        "status": "running",
+        "total_records": None,
+        "processed_records": 42,
+        "error_message": None,
+        "created_at": created_at,
+        "completed_at": None,
+    }
+
+    body = json.loads(json_response(task, status=201).body)
+
+    assert body == {
+        "id": str(task_id),
+        "status": "running",
+        "total_records": None,
+        "processed_records": 42,
+        "error_message": None,
+        "created_at": "2024-01-02T03:04:05Z",
+        "completed_at": None,
+    }
@@ -163,6 +163,59 @@ async def test_webhook_purge_succeeded_returns_summary(mock_pool_purge):
     assert result == "purged=10"
 
 
+# ---------------------------------------------------------------------------
+# conversion_backfill
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def mock_pool_backfill():
+    with patch(
+        "experiment_service.workers.conversion_backfill.get_pool",
+        new_callable=AsyncMock,
+        return_value=AsyncMock(),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_conversion_backfill_processes_claimed_batch(mock_pool_backfill):
+    now = datetime.now(timezone.utc)
+    tasks = [{"id": "t1"}, {"id": "t2"}]
+    with patch(
+        "experiment_service.workers.conversion_backfill.BackfillTaskRepository"
+    ) as MockRepo, patch(
+        "experiment_service.workers.conversion_backfill._process_task",
+        new_callable=AsyncMock,
+        side_effect=["task=t1 completed: 0 records", "task=t2 completed: 0 records"],
+    ) as process:
+        instance = MockRepo.return_value
+        instance.claim_pending_batch = AsyncMock(return_value=tasks)
+
+        from experiment_service.workers.conversion_backfill import (
+            CLAIM_BATCH_SIZE,
+            conversion_backfill,
+        )
+        result = await conversion_backfill(now)
+
+    instance.claim_pending_batch.assert_awaited_once_with(limit=CLAIM_BATCH_SIZE)
+    assert [c.args[2] for c in process.await_args_list] == tasks
+    assert result == "task=t1 completed: 0 records; task=t2 completed: 0 records"
+
+
+@pytest.mark.asyncio
+async def test_conversion_backfill_returns_none_when_nothing_pending(mock_pool_backfill):
+    now = datetime.now(timezone.utc)
+    with patch(
+        "experiment_service.workers.conversion_backfill.BackfillTaskRepository"
+    ) as MockRepo:
+        MockRepo.return_value.claim_pending_batch = AsyncMock(return_value=[])
+
+        from experiment_service.workers.conversion_backfill import conversion_backfill
+        result = await conversion_backfill(now)
+
+    assert result is None
+
+
 # ---------------------------------------------------------------------------
 # worker assembly
 # ---------------------------------------------------------------------------
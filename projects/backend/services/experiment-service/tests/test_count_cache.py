@@ -0,0 +1,94 @@
+"""Unit tests for experiment_service.repositories.count_cache module."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from experiment_service.repositories.count_cache import CountCache, fetch_counted_page
+
+_SQL = "SELECT COUNT(*) FROM experiments WHERE project_id = $1"
+
+
+class TestCountCache:
+    """Tests for CountCache."""
+
+    def test_miss_then_hit(self):
+        cache = CountCache(ttl_seconds=60.0, max_entries=10)
+        key = CountCache.key("experiments", "p", _SQL, ["p"])
+
+        assert cache.get(key) is None
+        cache.remember(key, 42)
+        assert cache.get(key) == 42
+
+    def test_key_freezes_array_params(self):
+        ids = [uuid4(), uuid4()]
+        key = CountCache.key("sensors", tuple(ids), _SQL, [ids])
+
+        assert hash(key)
+        assert key == CountCache.key("sensors", tuple(ids), _SQL, [list(ids)])
+
+    def test_expired_entry(self):
+        cache = CountCache(ttl_seconds=10.0, max_entries=10)
+        key = CountCache.key("experiments", "p", _SQL, ["p"])
+        target = "experiment_service.repositories.count_cache.time.monotonic"
+        with patch(target, return_value=100.0):
+            cache.remember(key, 1)
+        with patch(target, return_value=110.0):
+            assert cache.get(key) is None
+        assert cache._cache == {}
+
+    def test_invalidate_scope_and_table(self):
+        cache = CountCache(ttl_seconds=60.0, max_entries=10)
+        a = CountCache.key("experiments", "a", _SQL, ["a"])
+        b = CountCache.key("experiments", "b", _SQL, ["b"])
+        s = CountCache.key("sensors", None, "SELECT COUNT(*) FROM sensors s", [])
+        for key in (a, b, s):
+            cache.remember(key, 1)
+
+        cache.invalidate("experiments", "a")
+        assert (cache.get(a), cache.get(b), cache.get(s)) == (None, 1, 1)
+
+        cache.invalidate("sensors")
+        assert (cache.get(b), cache.get(s)) == (1, None)
+
+    def test_evicts_oldest_when_full(self):
+        cache = CountCache(ttl_seconds=60.0, max_entries=2)
+        keys = [CountCache.key("experiments", i, _SQL, [i]) for i in range(3)]
+        for key in keys:
+            cache.remember(key, 1)
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == 1
+        assert cache.get(keys[2]) == 1
+
+    def test_disabled_with_zero_ttl(self):
+        cache = CountCache(ttl_seconds=0, max_entries=10)
+        key = CountCache.key("experiments", "p", _SQL, ["p"])
+        cache.remember(key, 1)
+        assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_counted_page_reuses_total_for_later_pages():
+    page_sql = "SELECT * FROM experiments WHERE project_id = $1 LIMIT $2 OFFSET $3"
+    first = [{"id": uuid4(), "total_count": 3}, {"id": uuid4(), "total_count": 3}]
+    second = [{"id": uuid4()}]
+    fetch = AsyncMock(side_effect=[first, second])
+    kwargs = dict(
+        table="experiments", scope="p", page_sql=page_sql, count_sql=_SQL,
+        order_by="page.created_at DESC", params=["p"],
+    )
+
+    with patch(
+        "experiment_service.repositories.count_cache.list_counts",
+        CountCache(ttl_seconds=60.0, max_entries=10),
+    ):
+        records, total = await fetch_counted_page(fetch, page_params=(2, 0), **kwargs)
+        assert (records, total) == (first, 3)
+        assert "total_count" in fetch.await_args_list[0].args[0]
+
+        records, total = await fetch_counted_page(fetch, page_params=(2, 2), **kwargs)
+        assert (records, total) == (second, 3)
+        assert fetch.await_args_list[1].args == (page_sql, "p", 2, 2)
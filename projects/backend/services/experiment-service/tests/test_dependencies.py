@@ -6,12 +6,15 @@ from unittest.mock import MagicMock
 
 import pytest
 from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
 
 from experiment_service.services.dependencies import (
+    USER_CONTEXT_KEY,
     UserContext,
     _parse_permissions,
     ensure_permission,
     ensure_project_context,
+    require_current_user,
     resolve_project_id,
 )
 
@@ -198,3 +201,27 @@ def test_make_headers_no_project_id():
     headers = make_headers(None, role="editor")
     assert "X-Project-Id" not in headers
     assert "X-User-Permissions" in headers
+
+
+# ---------------------------------------------------------------------------
+# require_current_user: memoization on the request
+# ---------------------------------------------------------------------------
+
+async def test_require_current_user_memoizes_context_on_request():
+    pid = uuid.uuid4()
+    request = make_mocked_request("GET", "/api/v1/experiments", headers=make_headers(pid, role="owner"))
+
+    first = await require_current_user(request)
+    second = await require_current_user(request)
+
+    assert first is second
+    assert request[USER_CONTEXT_KEY] is first
+    assert first.active_project_id == pid
+
+
+async def test_require_current_user_missing_header_is_not_cached():
+    request = make_mocked_request("GET", "/api/v1/experiments")
+
+    with pytest.raises(web.HTTPUnauthorized):
+        await require_current_user(request)
+    assert USER_CONTEXT_KEY not in request
@@ -92,6 +92,40 @@ class TestExperimentModel:
                 updated_at=datetime.now(timezone.utc),
             )
 
+    def test_experiment_is_frozen(self):
+        now = datetime.now(timezone.utc)
+        experiment = Experiment(
+            id=uuid.uuid4(),
+            project_id=uuid.uuid4(),
+            name="Frozen",
+            owner_id=uuid.uuid4(),
+            created_at=now,
+            updated_at=now,
+        )
+        with pytest.raises(ValidationError):
+            experiment.name = "changed"
+
+    def test_from_record_matches_validated_model(self):
+        now = datetime.now(timezone.utc)
+        record = {
+            "id": uuid.uuid4(),
+            "project_id": uuid.uuid4(),
+            "owner_id": uuid.uuid4(),
+            "name": "Exp",
+            "description": None,
+            "experiment_type": "aero",
+            "tags": ["a", "b"],
+            "metadata": {"k": 1},
+            "status": "running",
+            "archived_at": None,
+            "created_at": now,
+            "updated_at": now,
+            "total_count": 3,
+        }
+        experiment = Experiment.from_record(record)
+        assert experiment.status is ExperimentStatus.RUNNING
+        assert experiment == Experiment.model_validate(record)
+
 
 class TestRunModel:
     """Tests for Run domain model."""
@@ -135,6 +169,32 @@ class TestRunModel:
         assert run.finished_at is None
         assert run.duration_seconds is None
 
+    def test_from_record_matches_validated_model(self):
+        now = datetime.now(timezone.utc)
+        record = {
+            "id": uuid.uuid4(),
+            "experiment_id": uuid.uuid4(),
+            "project_id": uuid.uuid4(),
+            "created_by": uuid.uuid4(),
+            "name": "Run",
+            "params": {"lr": 0.1},
+            "git_sha": None,
+            "env": None,
+            "notes": None,
+            "tags": [],
+            "metadata": {},
+            "status": "succeeded",
+            "started_at": now,
+            "finished_at": now,
+            "duration_seconds": 0,
+            "auto_complete_after_minutes": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        run = Run.from_record(record)
+        assert run.status is RunStatus.SUCCEEDED
+        assert run == Run.model_validate(record)
+
 
 class TestCaptureSessionModel:
     """Tests for CaptureSession domain model."""
@@ -174,6 +234,29 @@ class TestCaptureSessionModel:
         assert session.started_at is None
         assert session.stopped_at is None
 
+    def test_from_record_matches_validated_model(self):
+        now = datetime.now(timezone.utc)
+        record = {
+            "id": uuid.uuid4(),
+            "run_id": uuid.uuid4(),
+            "project_id": uuid.uuid4(),
+            "ordinal_number": 2,
+            "started_at": now,
+            "stopped_at": None,
+            "status": "running",
+            "initiated_by": uuid.uuid4(),
+            "notes": None,
+            "archived": False,
+            "created_at": now,
+            "updated_at": now,
+            "total_count": 7,
+        }
+        session = CaptureSession.from_record(record)
+        assert session.status is CaptureSessionStatus.RUNNING
+        assert session == CaptureSession.model_validate(
+            {k: v for k, v in record.items() if k != "total_count"}
+        )
+
 
 class TestSensorModel:
     """Tests for Sensor domain model."""
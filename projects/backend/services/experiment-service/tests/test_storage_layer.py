@@ -5,6 +5,7 @@ import uuid
 import asyncpg
 import pytest
 
+from backend_common.db.pool import init_connection
 from experiment_service.core.exceptions import InvalidStatusTransitionError, NotFoundError
 from experiment_service.domain.dto import (
     CaptureSessionCreateDTO,
@@ -30,7 +31,8 @@ from experiment_service.services import (
 @pytest.fixture
 async def db_pool(pgsql):
     conninfo = pgsql["experiment_service"].conninfo
-    pool = await asyncpg.create_pool(dsn=conninfo.get_uri())
+    # Same jsonb codec as the service pool: repositories pass and get dicts.
+    pool = await asyncpg.create_pool(dsn=conninfo.get_uri(), init=init_connection)
     try:
         yield pool
     finally:
@@ -181,3 +183,30 @@ async def test_storage_layer_crud(db_pool):
             CaptureSessionUpdateDTO(status=CaptureSessionStatus.SUCCEEDED),
         )
 
+
+@pytest.mark.asyncio
+async def test_experiment_list_reports_total_past_last_page(db_pool):
+    experiments_repo = ExperimentRepository(db_pool)
+    service = ExperimentService(experiments_repo)
+
+    project_id = uuid.uuid4()
+    owner_id = uuid.uuid4()
+    for i in range(3):
+        await service.create_experiment(
+            ExperimentCreateDTO(project_id=project_id, owner_id=owner_id, name=f"Exp {i}")
+        )
+
+    listed, total = await experiments_repo.list_by_project(project_id, limit=2)
+    assert [exp.name for exp in listed] == ["Exp 2", "Exp 1"]
+    assert total == 3
+
+    listed, total = await experiments_repo.list_by_project(project_id, limit=2, offset=10)
+    assert listed == []
+    assert total == 3
+
+    listed, total = await experiments_repo.search_experiments(project_id, "Exp 1")
+    assert [exp.name for exp in listed] == ["Exp 1"]
+    assert total == 1
+
+    listed, total = await experiments_repo.list_by_project(uuid.uuid4())
+    assert (listed, total) == ([], 0)
@@ -5,13 +5,15 @@ import uuid
 import asyncpg
 import pytest
 
+from backend_common.db.pool import init_connection
 from experiment_service.repositories.webhooks import WebhookDeliveryRepository, WebhookSubscriptionRepository
 
 
 @pytest.fixture
 async def db_pool(pgsql):
     conninfo = pgsql["experiment_service"].conninfo
-    pool = await asyncpg.create_pool(dsn=conninfo.get_uri())
+    # Same jsonb codec as the service pool: repositories pass and get dicts.
+    pool = await asyncpg.create_pool(dsn=conninfo.get_uri(), init=init_connection)
     try:
         yield pool
     finally:
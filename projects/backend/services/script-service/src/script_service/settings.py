@@ -1,7 +1,6 @@
 """Application settings."""
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import cast
 
 from pydantic import AnyHttpUrl, Field, PostgresDsn
@@ -25,10 +24,9 @@ class Settings(BaseServiceSettings):
     )
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Process-wide settings instance."""
+    return Settings.instance()
 
 
 settings = get_settings()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import structlog
 import time
@@ -22,6 +23,7 @@ from telemetry_ingest_service.prometheus_metrics import (
     TELEMETRY_READINGS_INGESTED,
 )
 from telemetry_ingest_service.repositories.sensor_error_log import SensorErrorLogRepository
+from telemetry_ingest_service.services.auth_cache import auth_cache
 from telemetry_ingest_service.services.telemetry import TelemetryIngestService
 from telemetry_ingest_service.services.telemetry import hash_sensor_token
 from telemetry_ingest_service.settings import settings
@@ -33,6 +35,9 @@ logger = structlog.get_logger(__name__)
 
 routes = web.RouteTableDef()
 
+# Shared aiohttp session for auth-service calls; opened/closed in main.create_app.
+AUTH_SESSION_KEY = "auth_http_session"
+
 
 async def _get_error_log_repo() -> SensorErrorLogRepository:
     pool = await get_pool()
@@ -80,7 +85,8 @@ def _normalize_bearer(value: str | None) -> str | None:
     value = value.strip()
     if not value:
         return None
-    if value.lower().startswith("bearer "):
+    # Compare only the fixed-length prefix instead of lower-casing the whole token.
+    if value[:7].lower() == "bearer ":
         value = value[7:].strip()
     return value or None
 
@@ -257,39 +263,53 @@ def _serialize_telemetry_record(row: dict) -> dict:
     }
 
 
-async def _authorize_user_token(*, token: str, project_id: UUID) -> None:
+@functools.lru_cache(maxsize=4)
+def _auth_base_url(configured_url: str) -> str:
+    """Normalise the configured auth-service URL once per distinct value."""
+    base = configured_url.rstrip("/")
+    if base.endswith("/api/v1"):
+        # Support envs that include the experiment-service prefix by mistake.
+        base = base[: -len("/api/v1")]
+    return base
+
+
+async def _authorize_user_token(
+    session: aiohttp.ClientSession, *, token: str, project_id: UUID
+) -> None:
     """
     Validate that the bearer token belongs to a user that is a member of the given project.
     Uses auth-service:
       - GET /auth/me
       - GET /projects/{project_id}/members
+    Successful checks are cached per (token, project) for a short TTL.
     """
-    base = settings.auth_service_url.rstrip("/")
-    if base.endswith("/api/v1"):
-        # Support envs that include the experiment-service prefix by mistake.
-        base = base[: -len("/api/v1")]
+    if auth_cache.is_authorized(token, project_id):
+        return
+
+    base = _auth_base_url(settings.auth_service_url)
     headers = {"Authorization": f"Bearer {token}"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{base}/auth/me", headers=headers) as resp:
-            if resp.status != 200:
-                raise web.HTTPUnauthorized(text="Unauthorized")
-            me = await resp.json()
-            user_id = me.get("id")
-            if not user_id:
-                raise web.HTTPUnauthorized(text="Unauthorized")
-
-        async with session.get(f"{base}/projects/{project_id}/members", headers=headers) as resp:
-            if resp.status == 403:
-                raise web.HTTPForbidden(text="Forbidden")
-            if resp.status == 404:
-                raise web.HTTPNotFound(text="Project not found")
-            if resp.status != 200:
-                raise web.HTTPBadGateway(text="Auth service error")
-            data = await resp.json()
-            members = data.get("members") or []
-            if not any(str(m.get("user_id")) == str(user_id) for m in members):
-                raise web.HTTPForbidden(text="Forbidden")
+    async with session.get(f"{base}/auth/me", headers=headers) as resp:
+        if resp.status != 200:
+            raise web.HTTPUnauthorized(text="Unauthorized")
+        me = await resp.json()
+        user_id = me.get("id")
+        if not user_id:
+            raise web.HTTPUnauthorized(text="Unauthorized")
+
+    async with session.get(f"{base}/projects/{project_id}/members", headers=headers) as resp:
+        if resp.status == 403:
+            raise web.HTTPForbidden(text="Forbidden")
+        if resp.status == 404:
+            raise web.HTTPNotFound(text="Project not found")
+        if resp.status != 200:
+            raise web.HTTPBadGateway(text="Auth service error")
+        data = await resp.json()
+        members = data.get("members") or []
+        if not any(str(m.get("user_id")) == str(user_id) for m in members):
+            raise web.HTTPForbidden(text="Forbidden")
+
+    auth_cache.remember(token, project_id)
 
 
 @routes.get("/api/v1/telemetry/stream")
@@ -339,7 +359,9 @@ async def telemetry_stream(request: web.Request) -> web.StreamResponse:
 
     # If token is a user token, enforce membership in the sensor's project.
     if _looks_like_jwt(token):
-        await _authorize_user_token(token=token, project_id=project_id)
+        await _authorize_user_token(
+            request.app[AUTH_SESSION_KEY], token=token, project_id=project_id
+        )
 
     resp = web.StreamResponse(
         status=200,
@@ -481,7 +503,9 @@ async def telemetry_query(request: web.Request) -> web.Response:
             raise web.HTTPNotFound(text="Capture session not found")
         project_id = UUID(str(row["project_id"]))
 
-    await _authorize_user_token(token=token, project_id=project_id)
+    await _authorize_user_token(
+        request.app[AUTH_SESSION_KEY], token=token, project_id=project_id
+    )
 
     conditions: list[str] = []
     params: list[object] = []
@@ -633,7 +657,9 @@ async def telemetry_aggregated(request: web.Request) -> web.Response:
             raise web.HTTPNotFound(text="Capture session not found")
         project_id = UUID(str(row["project_id"]))
 
-    await _authorize_user_token(token=token, project_id=project_id)
+    await _authorize_user_token(
+        request.app[AUTH_SESSION_KEY], token=token, project_id=project_id
+    )
 
     # --- build query ---
     conditions: list[str] = []
@@ -725,7 +751,9 @@ async def sensor_error_log(request: web.Request) -> web.Response:
         raise web.HTTPNotFound(text="Sensor not found")
     project_id = UUID(str(row["project_id"]))
 
-    await _authorize_user_token(token=token, project_id=project_id)
+    await _authorize_user_token(
+        request.app[AUTH_SESSION_KEY], token=token, project_id=project_id
+    )
 
     repo = SensorErrorLogRepository(pool)
     entries = await repo.list_for_sensor(str(sensor_id), limit=limit, offset=offset)
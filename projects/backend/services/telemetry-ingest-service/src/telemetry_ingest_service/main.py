@@ -5,7 +5,7 @@ import asyncio
 from pathlib import Path
 from typing import Any
 
-from aiohttp import web
+from aiohttp import ClientSession, web
 
 from backend_common.aiohttp_app import (
     add_cors_to_routes,
@@ -18,6 +18,7 @@ from backend_common.db.pool import close_pool_service as close_pool, init_pool_s
 from backend_common.logging_config import configure_logging
 
 from telemetry_ingest_service.api.routes.health import health_routes
+from telemetry_ingest_service.api.routes.telemetry import AUTH_SESSION_KEY
 from telemetry_ingest_service.api.routes.telemetry import routes as telemetry_routes
 from telemetry_ingest_service.api.routes.ws_ingest import ws_routes
 from telemetry_ingest_service.settings import settings
@@ -34,6 +35,16 @@ async def init_pool(_app: Any = None) -> None:
     await init_pool_service(_app, settings)
 
 
+async def start_auth_session(app: web.Application) -> None:
+    app[AUTH_SESSION_KEY] = ClientSession()
+
+
+async def stop_auth_session(app: web.Application) -> None:
+    session: ClientSession | None = app.get(AUTH_SESSION_KEY)
+    if session is not None:
+        await session.close()
+
+
 async def _start_spool_worker(app: web.Application) -> None:
     if settings.spool_enabled:
         app["_spool_worker"] = asyncio.ensure_future(run_spool_flush_worker())
@@ -62,7 +73,9 @@ def create_app() -> web.Application:
 
     app.on_startup.append(init_pool)
     app.on_startup.append(_start_spool_worker)
+    app.on_startup.append(start_auth_session)
     app.on_cleanup.append(_stop_spool_worker)
+    app.on_cleanup.append(stop_auth_session)
     app.on_cleanup.append(close_pool)
 
     add_cors_to_routes(app, cors)
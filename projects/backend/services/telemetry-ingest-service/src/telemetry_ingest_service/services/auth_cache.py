@@ -0,0 +1,73 @@
+"""In-memory TTL cache for user-token authorization results.
+
+Every user-authenticated telemetry read (SSE stream, query, aggregates,
+error log) has to ask auth-service whether the token belongs to a member of
+the project. Dashboards poll the same endpoints with the same token, so
+successful checks are remembered for a short TTL instead of repeating two
+HTTP round-trips per request.
+
+Only positive results are cached, and never past the token's own ``exp``
+claim. Tokens are stored as blake2b digests, never in raw form.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import time
+from uuid import UUID
+
+from backend_common.ttl_cache import TTLCache
+
+from telemetry_ingest_service.settings import settings
+
+_CacheKey = tuple[bytes, UUID]
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _token_expiry(token: str) -> float | None:
+    """Return the ``exp`` claim of a JWT as a Unix timestamp, if present.
+
+    The signature is not checked: auth-service has just accepted the token,
+    and the value is only used to shorten how long that result is cached.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        return None
+    return float(exp)
+
+
+class AuthorizationCache:
+    """TTL cache of (token, project_id) pairs that passed authorization."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._cache: TTLCache[_CacheKey, bool] = TTLCache(ttl_seconds, max_entries)
+
+    def is_authorized(self, token: str, project_id: UUID) -> bool:
+        return self._cache.get((_token_digest(token), project_id)) is not None
+
+    def remember(self, token: str, project_id: UUID) -> None:
+        token_exp = _token_expiry(token)
+        ttl = None if token_exp is None else token_exp - time.time()
+        self._cache.set((_token_digest(token), project_id), True, ttl=ttl)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+# Module-level singleton shared by all request handlers.
+auth_cache = AuthorizationCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    max_entries=settings.auth_cache_max_entries,
+)
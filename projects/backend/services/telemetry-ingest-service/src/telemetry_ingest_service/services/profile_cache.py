@@ -13,20 +13,30 @@ from __future__ import annotations
 
 import json
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
+from backend_common.conversion import Converter, compile_conversion
+
 from telemetry_ingest_service.settings import settings
 
 
 @dataclass(frozen=True, slots=True)
 class CachedProfile:
-    """Minimal projection of a conversion profile needed for ingest."""
+    """Minimal projection of a conversion profile needed for ingest.
+
+    ``converter`` is compiled from ``kind``/``payload`` once when the entry is
+    created and is ``None`` if the payload is invalid.
+    """
 
     profile_id: UUID
     kind: str
     payload: dict[str, Any]
+    converter: Converter | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "converter", compile_conversion(self.kind, self.payload))
 
 
 class ProfileCache:
@@ -12,7 +12,6 @@ from uuid import UUID
 
 from asyncpg.exceptions import PostgresError  # type: ignore[import-untyped]
 
-from backend_common.conversion import apply_conversion
 from backend_common.db.pool import get_pool_service as get_pool
 
 from telemetry_ingest_service.core.exceptions import (
@@ -419,9 +418,8 @@ class TelemetryIngestService:
 
             if physical_value is None and active_profile is not None:
                 try:
-                    result = apply_conversion(
-                        active_profile.kind, active_profile.payload, reading.raw_value,
-                    )
+                    converter = active_profile.converter
+                    result = converter(reading.raw_value) if converter is not None else None
                     if result is not None:
                         physical_value = result
                         conversion_status = "converted"
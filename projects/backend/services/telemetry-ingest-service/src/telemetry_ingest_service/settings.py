@@ -1,7 +1,6 @@
 """Application settings."""
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import cast
 
 from pydantic import Field, PostgresDsn
@@ -39,6 +38,9 @@ class Settings(BaseServiceSettings):
 
     # Auth-service (for user-authenticated telemetry stream access)
     auth_service_url: str = "http://auth-service:8001"
+    # Successful token/project checks are reused for this long (0 disables)
+    auth_cache_ttl_seconds: float = 60.0
+    auth_cache_max_entries: int = 10_000
 
     # WebSocket ingest limits
     ws_max_message_bytes: int = 1 * 1024 * 1024  # 1 MB per message
@@ -60,9 +62,8 @@ class Settings(BaseServiceSettings):
     spool_max_files: int = 10_000
 
 
-@lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    return Settings.instance()
 
 
 settings = get_settings()
@@ -0,0 +1,99 @@
+"""Unit tests for telemetry_ingest_service.services.auth_cache module."""
+from __future__ import annotations
+
+import base64
+import json
+from unittest.mock import patch
+from uuid import uuid4
+
+from telemetry_ingest_service.services.auth_cache import AuthorizationCache
+
+
+def _jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload}.sig"
+
+
+class TestAuthorizationCache:
+    """Tests for AuthorizationCache."""
+
+    def test_miss_then_hit(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=10)
+        project_id = uuid4()
+
+        assert cache.is_authorized("a.b.c", project_id) is False
+        cache.remember("a.b.c", project_id)
+        assert cache.is_authorized("a.b.c", project_id) is True
+
+    def test_scoped_to_token_and_project(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=10)
+        project_id = uuid4()
+        cache.remember("a.b.c", project_id)
+
+        assert cache.is_authorized("x.y.z", project_id) is False
+        assert cache.is_authorized("a.b.c", uuid4()) is False
+
+    def test_raw_token_not_stored(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=10)
+        cache.remember("secret.jwt.token", uuid4())
+
+        ((digest, _),) = list(cache._cache)
+        assert isinstance(digest, bytes)
+        assert b"secret" not in digest
+
+    def test_expired_entry(self):
+        cache = AuthorizationCache(ttl_seconds=10.0, max_entries=10)
+        project_id = uuid4()
+        with patch("telemetry_ingest_service.services.auth_cache.time.monotonic", return_value=100.0):
+            cache.remember("a.b.c", project_id)
+        with patch("telemetry_ingest_service.services.auth_cache.time.monotonic", return_value=110.5):
+            assert cache.is_authorized("a.b.c", project_id) is False
+        assert len(cache._cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.remember("t", first)
+        cache.remember("t", second)
+        cache.remember("t", third)
+
+        assert cache.is_authorized("t", first) is False
+        assert cache.is_authorized("t", second) is True
+        assert cache.is_authorized("t", third) is True
+
+    def test_entry_does_not_outlive_token_exp(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=10)
+        project_id = uuid4()
+        token = _jwt({"sub": "u", "exp": 1_000_005})
+        with (
+            patch("telemetry_ingest_service.services.auth_cache.time.time", return_value=1_000_000.0),
+            patch("telemetry_ingest_service.services.auth_cache.time.monotonic", return_value=100.0),
+        ):
+            cache.remember(token, project_id)
+        with patch("telemetry_ingest_service.services.auth_cache.time.monotonic", return_value=104.0):
+            assert cache.is_authorized(token, project_id) is True
+        with patch("telemetry_ingest_service.services.auth_cache.time.monotonic", return_value=105.5):
+            assert cache.is_authorized(token, project_id) is False
+
+    def test_expired_token_not_cached(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=10)
+        project_id = uuid4()
+        token = _jwt({"sub": "u", "exp": 1})
+        cache.remember(token, project_id)
+
+        assert cache.is_authorized(token, project_id) is False
+
+    def test_zero_ttl_disables_cache(self):
+        cache = AuthorizationCache(ttl_seconds=0.0, max_entries=10)
+        project_id = uuid4()
+        cache.remember("a.b.c", project_id)
+
+        assert cache.is_authorized("a.b.c", project_id) is False
+
+    def test_clear(self):
+        cache = AuthorizationCache(ttl_seconds=60.0, max_entries=10)
+        project_id = uuid4()
+        cache.remember("a.b.c", project_id)
+        cache.clear()
+
+        assert cache.is_authorized("a.b.c", project_id) is False
@@ -99,6 +99,27 @@ class TestCachedProfile:
         assert profile1 == profile2
         assert profile1 != profile3
 
+    def test_converter_compiled_from_payload(self):
+        """Test CachedProfile compiles its payload into a converter."""
+        profile = CachedProfile(
+            profile_id=uuid4(),
+            kind="linear",
+            payload={"a": 2.0, "b": 5.0},
+        )
+
+        assert profile.converter is not None
+        assert profile.converter(10.0) == 25.0
+
+    def test_converter_none_for_invalid_payload(self):
+        """Test CachedProfile has no converter when the payload is invalid."""
+        profile = CachedProfile(
+            profile_id=uuid4(),
+            kind="linear",
+            payload={"a": "two"},
+        )
+
+        assert profile.converter is None
+
 
 class TestProfileCacheCreation:
     """Tests for ProfileCache initialization."""
@@ -16,6 +16,7 @@ from telemetry_ingest_service.core.exceptions import (
     UnauthorizedError,
 )
 from telemetry_ingest_service.domain.dto import TelemetryIngestDTO, TelemetryReadingDTO
+from telemetry_ingest_service.services.profile_cache import CachedProfile
 from telemetry_ingest_service.services.telemetry import (
     TelemetryIngestService,
     _SensorAuth,
@@ -549,17 +550,15 @@ class TestTelemetryIngestServicePrepareItems:
             ],
         )
 
-        # Mock profile cache with linear conversion (a=2, b=5)
-        mock_profile = MagicMock()
-        mock_profile.kind = "linear"
-        mock_profile.payload = {"a": 2.0, "b": 5.0}
-        mock_profile.profile_id = uuid4()
-
-        with patch("telemetry_ingest_service.services.telemetry.profile_cache") as mock_cache, \
-             patch("telemetry_ingest_service.services.telemetry.apply_conversion") as mock_convert:
+        # Profile cache returns a linear conversion (a=2, b=5)
+        profile = CachedProfile(
+            profile_id=uuid4(),
+            kind="linear",
+            payload={"a": 2.0, "b": 5.0},
+        )
 
-            mock_cache.get_active_profile = AsyncMock(return_value=mock_profile)
-            mock_convert.return_value = 25.0  # 10 * 2 + 5
+        with patch("telemetry_ingest_service.services.telemetry.profile_cache") as mock_cache:
+            mock_cache.get_active_profile = AsyncMock(return_value=profile)
 
             items, _ = await service._prepare_items(
                 mock_conn, project_id, payload,